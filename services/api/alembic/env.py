@@ -2,6 +2,7 @@
 # sys.path.append(str(BASE_DIR))
 
 import os
+import sys
 from logging.config import fileConfig
 
 from dotenv import load_dotenv
@@ -12,6 +13,9 @@ from flux_watch_api.schema.utils.base import Base
 
 load_dotenv()
 
+# migrations import shared helpers from migration_helpers.py next to this file
+sys.path.insert(0, os.path.dirname(__file__))
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
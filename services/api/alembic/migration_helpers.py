@@ -0,0 +1,29 @@
+"""
+Helpers shared by migrations.
+
+Migrations that already ran must keep doing what they did when they were
+written, so nothing here imports application code and a helper never changes
+once a migration uses it. When a migration needs different behaviour, add a
+new helper next to the old one.
+
+env.py puts this directory on sys.path, so migrations import it as
+``migration_helpers``.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+def event_partitions() -> list[str]:
+    """Names of the partitions attached to ``events`` when the migration runs."""
+    return list(
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'events'::regclass"
+            )
+        )
+        .scalars()
+    )
@@ -0,0 +1,156 @@
+"""partition events by occurred_at
+
+Revision ID: 5c9d1e7f3a26
+Revises: e41f7a2c9b58
+Create Date: 2026-10-18 14:27:51.902334
+
+The existing heap is not copied: it is attached as the partition
+``events_legacy`` covering everything before the start of next week, so the
+upgrade costs one validation scan instead of a full rewrite. Weekly partitions
+from there on are created here and then kept ahead by PartitionManager;
+``events_legacy`` is dropped by retention like any other partition once it
+ages out.
+
+While the CHECK constraint is being validated, rows with an occurred_at past
+the cutover are rejected by the old table; the window is one table scan.
+"""
+
+from collections.abc import Sequence
+from datetime import date, timedelta
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c9d1e7f3a26"
+down_revision: str | Sequence[str] | None = "e41f7a2c9b58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PREMAKE_WEEKS = 4
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    cutover = _week_start(date.today()) + timedelta(weeks=1)
+
+    # unique indexes the partitioned parent will require, built without
+    # blocking writes; the (id, occurred_at) one becomes the primary key below
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "events_legacy_id_occurred_at_key",
+            "events",
+            ["id", "occurred_at"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "uq_events_legacy_parent_idempotency_key",
+            "events",
+            ["parent", "idempotency_key", "occurred_at"],
+            unique=True,
+            postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # this block is not transactional, a failed upgrade leaves it behind
+        op.execute("ALTER TABLE events DROP CONSTRAINT IF EXISTS events_legacy_range")
+        op.execute(
+            "ALTER TABLE events ADD CONSTRAINT events_legacy_range "
+            f"CHECK (occurred_at < '{cutover.isoformat()}') NOT VALID"
+        )
+        # SHARE UPDATE EXCLUSIVE only: writes continue during the scan, and
+        # ATTACH PARTITION below can skip its own
+        op.execute("ALTER TABLE events VALIDATE CONSTRAINT events_legacy_range")
+
+    op.execute("ALTER TABLE events RENAME TO events_legacy")
+    # ATTACH PARTITION only adopts an index for the parent's primary key when
+    # it backs a PRIMARY KEY constraint; a plain unique index is ignored and
+    # the attach tries to add a second primary key. Swap the (id) key for one
+    # on the prebuilt index, which takes no scan.
+    op.execute("ALTER TABLE events_legacy DROP CONSTRAINT events_pkey")
+    op.execute(
+        "ALTER TABLE events_legacy ADD CONSTRAINT events_legacy_pkey "
+        "PRIMARY KEY USING INDEX events_legacy_id_occurred_at_key"
+    )
+    op.execute("ALTER INDEX ix_events_parent RENAME TO ix_events_legacy_parent")
+    op.drop_index("uq_events_parent_idempotency_key", table_name="events_legacy")
+
+    op.execute(
+        """
+        CREATE TABLE events (
+            entity_type TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            event_version INTEGER NOT NULL,
+            occurred_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            producer TEXT NOT NULL,
+            actor_type TEXT,
+            actor_id TEXT,
+            context JSONB,
+            payload JSONB NOT NULL,
+            idempotency_key TEXT,
+            id UUID NOT NULL,
+            is_expired BOOLEAN NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            parent TEXT NOT NULL,
+            CONSTRAINT events_pkey PRIMARY KEY (id, occurred_at)
+        ) PARTITION BY RANGE (occurred_at)
+        """
+    )
+    op.create_index("ix_events_parent", "events", ["parent"], unique=False)
+    op.create_index(
+        "uq_events_parent_idempotency_key",
+        "events",
+        ["parent", "idempotency_key", "occurred_at"],
+        unique=True,
+        postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+    )
+
+    op.execute(
+        "ALTER TABLE events ATTACH PARTITION events_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{cutover.isoformat()}')"
+    )
+    # the partition bound enforces the range from now on
+    op.execute("ALTER TABLE events_legacy DROP CONSTRAINT events_legacy_range")
+
+    for week in range(PREMAKE_WEEKS):
+        start = cutover + timedelta(weeks=week)
+        end = start + timedelta(weeks=1)
+        op.execute(
+            f"CREATE TABLE events_p{start:%Y%m%d} PARTITION OF events "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE events RENAME TO events_partitioned")
+    op.execute("ALTER INDEX events_pkey RENAME TO events_partitioned_pkey")
+    op.execute("ALTER INDEX ix_events_parent RENAME TO ix_events_partitioned_parent")
+    op.execute(
+        "ALTER INDEX uq_events_parent_idempotency_key "
+        "RENAME TO uq_events_partitioned_parent_idempotency_key"
+    )
+
+    op.execute("CREATE TABLE events (LIKE events_partitioned INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO events SELECT * FROM events_partitioned")
+    op.execute("DROP TABLE events_partitioned")
+
+    op.create_primary_key("events_pkey", "events", ["id"])
+    op.create_index("ix_events_parent", "events", ["parent"], unique=False)
+    op.create_index(
+        "uq_events_parent_idempotency_key",
+        "events",
+        ["parent", "idempotency_key"],
+        unique=True,
+        postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+    )
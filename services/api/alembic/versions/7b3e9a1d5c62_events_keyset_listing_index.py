@@ -0,0 +1,51 @@
+"""events keyset listing index
+
+Revision ID: 7b3e9a1d5c62
+Revises: f6a19c3e8d25
+Create Date: 2026-10-18 19:12:04.583129
+
+Cursor pagination seeks with ``(occurred_at, id) < (...)`` ordered by
+``occurred_at DESC, id DESC``. A row comparison is only an index condition
+when the index columns sort the same way, so ix_events_parent_occurred_at_id
+(``id`` ascending) is replaced by one with ``id DESC``. Built like the listing
+indexes in a3f8b2d6c410: ON ONLY the parent, concurrently per partition, then
+attached; the old index is dropped once the new one is valid.
+"""
+
+from collections.abc import Sequence
+
+from migration_helpers import event_partitions
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b3e9a1d5c62"
+down_revision: str | Sequence[str] | None = "f6a19c3e8d25"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+NEW = ("ix_events_parent_occurred_at_id_desc", "parent_occurred_at_id_desc")
+OLD = ("ix_events_parent_occurred_at_id", "parent_occurred_at_id")
+
+
+def _create(name: str, suffix: str, columns: str) -> None:
+    op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY events {columns}")
+    partitions = event_partitions()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            child = f"{partition}_{suffix}"
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} {columns}")
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _create(*NEW, "(parent, occurred_at DESC, id DESC)")
+    # dropping the parent index drops the attached partition indexes with it
+    op.drop_index(OLD[0], table_name="events")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _create(*OLD, "(parent, occurred_at DESC, id)")
+    op.drop_index(NEW[0], table_name="events")
@@ -0,0 +1,46 @@
+"""add events entity_id trigram index
+
+Revision ID: 9d4b6f2e1a73
+Revises: e3a7c1f94b28
+Create Date: 2026-10-18 22:36:05.118402
+
+Enables pg_trgm and adds a gin_trgm_ops index on events.entity_id for the
+entity_id__contains substring search, built like the listing indexes in
+a3f8b2d6c410: ON ONLY the parent, concurrently per partition, then attached.
+The extension stays on downgrade; other objects may depend on it.
+"""
+
+from collections.abc import Sequence
+
+from migration_helpers import event_partitions
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4b6f2e1a73"
+down_revision: str | Sequence[str] | None = "e3a7c1f94b28"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX = "ix_events_entity_id_trgm"
+DEFINITION = "USING gin (entity_id gin_trgm_ops)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX} ON ONLY events {DEFINITION}")
+
+    partitions = event_partitions()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            child = f"{partition}_entity_id_trgm"
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} {DEFINITION}"
+            )
+            op.execute(f"ALTER INDEX {INDEX} ATTACH PARTITION {child}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX, table_name="events")
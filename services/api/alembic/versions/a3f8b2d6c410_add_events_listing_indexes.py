@@ -0,0 +1,67 @@
+"""add events listing indexes
+
+Revision ID: a3f8b2d6c410
+Revises: 5c9d1e7f3a26
+Create Date: 2026-10-18 16:05:12.447810
+
+CREATE INDEX CONCURRENTLY is not available on a partitioned table, so each
+index is created ON ONLY the parent (invalid until complete), built
+concurrently on every partition and attached; the parent index turns valid
+once the last partition is attached. Partitions created later inherit the
+indexes from the parent.
+
+ix_events_parent is dropped: every new index leads with parent.
+"""
+
+from collections.abc import Sequence
+
+from migration_helpers import event_partitions
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f8b2d6c410"
+down_revision: str | Sequence[str] | None = "5c9d1e7f3a26"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# parent index name, per-partition suffix, column list
+INDEXES = [
+    ("ix_events_parent_occurred_at_id", "parent_occurred_at_id", "(parent, occurred_at DESC, id)"),
+    (
+        "ix_events_parent_event_type_occurred_at",
+        "parent_event_type_occurred_at",
+        "(parent, event_type, occurred_at)",
+    ),
+    (
+        "ix_events_parent_entity_occurred_at",
+        "parent_entity_occurred_at",
+        "(parent, entity_type, entity_id, occurred_at)",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, _, columns in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY events {columns}")
+
+    partitions = event_partitions()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            for name, suffix, columns in INDEXES:
+                child = f"{partition}_{suffix}"
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} {columns}"
+                )
+                op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+    op.drop_index("ix_events_parent", table_name="events")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_events_parent", "events", ["parent"], unique=False)
+    for name, _, _ in INDEXES:
+        # dropping the parent index drops the attached partition indexes with it
+        op.drop_index(name, table_name="events")
@@ -0,0 +1,45 @@
+"""add idempotency key to events
+
+Revision ID: b7e2c4a9d013
+Revises: 8ccc311eae1a
+Create Date: 2026-10-18 09:12:44.381205
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c4a9d013"
+down_revision: str | Sequence[str] | None = "8ccc311eae1a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("events", sa.Column("idempotency_key", sa.Text(), nullable=True))
+    # built concurrently so ingestion keeps writing while the index is created
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_events_parent_idempotency_key",
+            "events",
+            ["parent", "idempotency_key"],
+            unique=True,
+            postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_events_parent_idempotency_key",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("events", "idempotency_key")
@@ -0,0 +1,59 @@
+"""add events producer and actor indexes
+
+Revision ID: c5d0e8f2a7b4
+Revises: 7b3e9a1d5c62
+Create Date: 2026-10-18 20:31:47.902615
+
+Listing indexes for the producer and actor_id filters, built like the ones in
+a3f8b2d6c410: ON ONLY the parent, concurrently per partition, then attached.
+The actor index is partial: most events have no actor, and an actor_id
+filter implies actor_id IS NOT NULL.
+"""
+
+from collections.abc import Sequence
+
+from migration_helpers import event_partitions
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d0e8f2a7b4"
+down_revision: str | Sequence[str] | None = "7b3e9a1d5c62"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# parent index name, per-partition suffix, index definition
+INDEXES = [
+    (
+        "ix_events_parent_producer_occurred_at",
+        "parent_producer_occurred_at",
+        "(parent, producer, occurred_at)",
+    ),
+    (
+        "ix_events_parent_actor_id_occurred_at",
+        "parent_actor_id_occurred_at",
+        "(parent, actor_id, occurred_at) WHERE actor_id IS NOT NULL",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, _, definition in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY events {definition}")
+
+    partitions = event_partitions()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            for name, suffix, definition in INDEXES:
+                child = f"{partition}_{suffix}"
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} {definition}"
+                )
+                op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _, _ in INDEXES:
+        op.drop_index(name, table_name="events")
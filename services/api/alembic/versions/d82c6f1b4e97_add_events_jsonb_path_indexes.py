@@ -0,0 +1,50 @@
+"""add events jsonb path indexes
+
+Revision ID: d82c6f1b4e97
+Revises: a3f8b2d6c410
+Create Date: 2026-10-18 17:42:36.118204
+
+GIN indexes with jsonb_path_ops on payload and context for the payload__* /
+context__* filters. Built the same way as the listing indexes in
+a3f8b2d6c410: ON ONLY the parent, concurrently per partition, then attached.
+"""
+
+from collections.abc import Sequence
+
+from migration_helpers import event_partitions
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d82c6f1b4e97"
+down_revision: str | Sequence[str] | None = "a3f8b2d6c410"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# parent index name, per-partition suffix, index definition
+INDEXES = [
+    ("ix_events_payload_path", "payload_path", "USING gin (payload jsonb_path_ops)"),
+    ("ix_events_context_path", "context_path", "USING gin (context jsonb_path_ops)"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, _, definition in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON ONLY events {definition}")
+
+    partitions = event_partitions()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            for name, suffix, definition in INDEXES:
+                child = f"{partition}_{suffix}"
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} ON {partition} {definition}"
+                )
+                op.execute(f"ALTER INDEX {name} ATTACH PARTITION {child}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _, _ in INDEXES:
+        op.drop_index(name, table_name="events")
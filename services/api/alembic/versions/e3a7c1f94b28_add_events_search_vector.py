@@ -0,0 +1,62 @@
+"""add events search vector
+
+Revision ID: e3a7c1f94b28
+Revises: c5d0e8f2a7b4
+Create Date: 2026-10-18 21:48:13.270554
+
+Adds events.search_vector, a STORED generated tsvector over the event type,
+entity id, producer and a few payload text keys, and a GIN index on it built
+like the listing indexes in a3f8b2d6c410.
+
+Like f6a19c3e8d25, adding a stored generated column rewrites every partition
+under an ACCESS EXCLUSIVE lock; run it in a maintenance window.
+"""
+
+from collections.abc import Sequence
+
+from migration_helpers import event_partitions
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a7c1f94b28"
+down_revision: str | Sequence[str] | None = "c5d0e8f2a7b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PAYLOAD_KEYS = ("message", "name", "title", "description", "status", "error")
+
+EXPRESSION = (
+    "setweight(to_tsvector('simple', event_type || ' ' || translate(event_type, '._', '  ')), 'A')"
+    " || setweight(to_tsvector('simple', entity_id || ' ' || producer), 'B')"
+    " || setweight(to_tsvector('simple', "
+    + " || ' ' || ".join(f"coalesce(payload ->> '{key}', '')" for key in PAYLOAD_KEYS)
+    + "), 'C')"
+)
+
+INDEX = "ix_events_search_vector"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        f"ALTER TABLE events ADD COLUMN search_vector TSVECTOR "
+        f"GENERATED ALWAYS AS ({EXPRESSION}) STORED NOT NULL"
+    )
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX} ON ONLY events USING gin (search_vector)")
+
+    partitions = event_partitions()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            child = f"{partition}_search_vector"
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} "
+                f"ON {partition} USING gin (search_vector)"
+            )
+            op.execute(f"ALTER INDEX {INDEX} ATTACH PARTITION {child}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX, table_name="events")
+    op.drop_column("events", "search_vector")
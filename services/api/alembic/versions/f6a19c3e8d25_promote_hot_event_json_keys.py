@@ -0,0 +1,69 @@
+"""promote hot event json keys
+
+Revision ID: f6a19c3e8d25
+Revises: d82c6f1b4e97
+Create Date: 2026-10-18 18:20:09.561473
+
+Adds STORED generated columns for context.trace_id, context.session_id,
+context.source and payload.latency_ms, each with a partial (parent, column)
+index built like the listing indexes in a3f8b2d6c410.
+
+Adding a stored generated column rewrites every partition under an ACCESS
+EXCLUSIVE lock, so on a large events table run this in a maintenance window
+(or after archiving old partitions).
+"""
+
+from collections.abc import Sequence
+
+from migration_helpers import event_partitions
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a19c3e8d25"
+down_revision: str | Sequence[str] | None = "d82c6f1b4e97"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = [
+    ("context_trace_id", "TEXT", "(context ->> 'trace_id')"),
+    ("context_session_id", "TEXT", "(context ->> 'session_id')"),
+    ("context_source", "TEXT", "(context ->> 'source')"),
+    (
+        "payload_latency_ms",
+        "DOUBLE PRECISION",
+        "CASE WHEN jsonb_typeof(payload -> 'latency_ms') = 'number' "
+        "THEN (payload ->> 'latency_ms')::double precision END",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column, type_, expression in COLUMNS:
+        op.execute(
+            f"ALTER TABLE events ADD COLUMN {column} {type_} "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_events_parent_{column} "
+            f"ON ONLY events (parent, {column}) WHERE {column} IS NOT NULL"
+        )
+
+    partitions = event_partitions()
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            for column, _, _ in COLUMNS:
+                child = f"{partition}_parent_{column}"
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {child} "
+                    f"ON {partition} (parent, {column}) WHERE {column} IS NOT NULL"
+                )
+                op.execute(f"ALTER INDEX ix_events_parent_{column} ATTACH PARTITION {child}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column, _, _ in COLUMNS:
+        # dropping the column drops its indexes with it
+        op.drop_column("events", column)
@@ -0,0 +1,121 @@
+"""
+Bytes and latency of a GET /events page with and without ``fields=``.
+
+Loads ``--rows`` events with ``--payload-bytes`` large payloads and contexts
+for one tenant into a scratch database (only when it has fewer), then times
+100-row pages the way the listing serves them: query, rows to response
+models, JSON encoding. "full" selects whole EventORM rows; "fields" selects
+the columns behind ``--fields`` only. Bytes are the encoded response body.
+
+Needs a migrated, disposable database; the events table is written to.
+
+    python -m benchmarks.bench_events_fields --pg-url postgresql://.../fluxwatch_bench \\
+        --rows 100000 --payload-bytes 16384
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, select, text
+
+from flux_watch_api.database.bulk import CopyLoader
+from flux_watch_api.database.query_builder.builder import QueryBuilder
+from flux_watch_api.database.session import Database, DatabaseConnectionConfig
+from flux_watch_api.models.events import PartialEvent
+from flux_watch_api.repository.events.events import EventsSearch
+from flux_watch_api.schema.events import EVENT_FIELD_COLUMNS, EventORM, event_values
+
+TENANT = "bench-fields@bench"
+
+
+def _rows(count: int, payload_bytes: int) -> Iterator[dict]:
+    now = datetime.now(timezone.utc)
+    for i in range(count):
+        yield {
+            "id": uuid.uuid4(),
+            "parent": TENANT,
+            "entity_type": "order",
+            "entity_id": f"order-{i % 10_000}",
+            "event_type": "order.created",
+            "event_version": 1,
+            "occurred_at": now - timedelta(seconds=random.randrange(30 * 86400)),
+            "producer": "bench",
+            # random text so TOAST compression does not hide the size
+            "payload": {"blob": random.randbytes(payload_bytes // 2).hex(), "amount": i},
+            "context": {"trace_id": uuid.uuid4().hex, "source": "bench"},
+            "expired": False,
+        }
+
+
+def fill(db: Database, target: int, payload_bytes: int) -> None:
+    with db.session_local() as session:
+        current = session.execute(
+            select(func.count()).select_from(EventORM).where(EventORM.parent == TENANT)
+        ).scalar_one()
+    missing = target - current
+    while missing > 0:
+        chunk = min(missing, 10_000)
+        with db.session_local() as session, session.begin():
+            CopyLoader(session, EventORM).copy(_rows(chunk, payload_bytes))
+        missing -= chunk
+        print(f"  loaded {target - missing:,}/{target:,}")
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE events"))
+
+
+def page(session, fields: list[str] | None, number: int) -> bytes:
+    params = {"parent": TENANT, "page": number, "page_size": 100, "count": "none"}
+    if fields:
+        columns = {column for field in fields for column in EVENT_FIELD_COLUMNS[field]}
+        params["fields"] = ",".join(sorted(columns))
+    builder = QueryBuilder(EventsSearch, **params)
+    data_query, _ = builder.build(with_counts=True)
+    result = session.execute(data_query)
+    if fields:
+        results = [PartialEvent(**event_values(row, fields)) for row in result.all()]
+        body = [r.model_dump(by_alias=True, exclude_unset=True) for r in results]
+    else:
+        body = [event.to_model().model_dump(by_alias=True) for event in result.scalars().all()]
+    return json.dumps(jsonable_encoder(body)).encode()
+
+
+def measure(db: Database, fields: list[str] | None, samples: int) -> tuple[float, float, int]:
+    timings, sizes = [], []
+    with db.session_local() as session:
+        for _ in range(samples):
+            started = time.perf_counter()
+            body = page(session, fields, random.randint(1, 50))
+            timings.append((time.perf_counter() - started) * 1000)
+            sizes.append(len(body))
+    percentiles = statistics.quantiles(timings, n=100)
+    return percentiles[49], percentiles[98], int(statistics.mean(sizes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pg-url", required=True, help="A disposable, migrated database")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--payload-bytes", type=int, default=16_384)
+    parser.add_argument("--fields", default="event_type,entity,occurred_at")
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    db = Database(url=args.pg_url, config=DatabaseConnectionConfig.API)
+    fill(db, args.rows, args.payload_bytes)
+
+    fields = args.fields.split(",")
+    print(f"{'select':<8} {'p50 ms':>9} {'p99 ms':>9} {'bytes/page':>12}")
+    for label, selected in (("full", None), ("fields", fields)):
+        p50, p99, size = measure(db, selected, args.samples)
+        print(f"{label:<8} {p50:>9.2f} {p99:>9.2f} {size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+p50/p99 of the GET /events queries with and without the listing indexes.
+
+Fills a scratch database up to each ``--sizes`` row count (rows are only ever
+added, so the sizes are cumulative), then times the queries EventsSearch
+builds for three shapes: the default tenant listing, a tenant + event_type
+filter and a tenant + entity filter, each with its count query. Every size is
+measured twice: with the indexes from migration a3f8b2d6c410 dropped
+("before") and rebuilt ("after").
+
+Needs a migrated, disposable database; the events table is written to and its
+indexes are dropped and recreated.
+
+    python -m benchmarks.bench_events_listing --pg-url postgresql://.../fluxwatch_bench \\
+        --sizes 1000000 10000000 100000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, text
+
+from flux_watch_api.database.bulk import CopyLoader
+from flux_watch_api.database.query_builder.builder import QueryBuilder
+from flux_watch_api.database.session import Database, DatabaseConnectionConfig
+from flux_watch_api.models.events import EVENT_TYPES
+from flux_watch_api.repository.events.events import EventsSearch
+from flux_watch_api.schema.events import EventORM
+
+INDEXES = [index for index in EventORM.__table__.indexes if index.name.startswith("ix_events_")]
+
+
+def _rows(count: int, tenants: list[str], days: int) -> Iterator[dict]:
+    now = datetime.now(timezone.utc)
+    entity_types = list(EVENT_TYPES)
+    for _ in range(count):
+        entity_type = random.choice(entity_types)
+        yield {
+            "id": uuid.uuid4(),
+            # skewed like real traffic: a few tenants own most of the rows
+            "parent": tenants[min(int(random.expovariate(5 / len(tenants))), len(tenants) - 1)],
+            "entity_type": entity_type,
+            "entity_id": f"{entity_type}-{random.randrange(10_000)}",
+            "event_type": random.choice(EVENT_TYPES[entity_type]),
+            "event_version": 1,
+            "occurred_at": now - timedelta(seconds=random.randrange(days * 86400)),
+            "producer": "bench",
+            "payload": {},
+            "expired": False,
+        }
+
+
+def fill(db: Database, target: int, tenants: list[str], days: int) -> None:
+    with db.session_local() as session:
+        current = session.execute(select(func.count()).select_from(EventORM)).scalar_one()
+    missing = target - current
+    while missing > 0:
+        chunk = min(missing, 500_000)
+        with db.session_local() as session, session.begin():
+            CopyLoader(session, EventORM).copy(_rows(chunk, tenants, days))
+        missing -= chunk
+        print(f"  loaded {target - missing:,}/{target:,}")
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE events"))
+
+
+def set_indexes(db: Database, present: bool) -> None:
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index in INDEXES:
+            if present:
+                index.create(conn, checkfirst=True)
+            else:
+                index.drop(conn, checkfirst=True)
+        conn.execute(text("ANALYZE events"))
+
+
+def measure(db: Database, params: Callable[[], dict], samples: int) -> tuple[float, float]:
+    timings = []
+    with db.session_local() as session:
+        for _ in range(samples):
+            data_query, count_query = QueryBuilder(EventsSearch, **params()).build(with_counts=True)
+            started = time.perf_counter()
+            session.execute(data_query).scalars().all()
+            session.execute(count_query).scalar_one()
+            timings.append((time.perf_counter() - started) * 1000)
+    percentiles = statistics.quantiles(timings, n=100)
+    return percentiles[49], percentiles[98]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pg-url", required=True, help="A disposable, migrated database")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+
+    db = Database(url=args.pg_url, config=DatabaseConnectionConfig.API)
+    tenants = [f"tenant-{i}@bench" for i in range(args.tenants)]
+
+    def tenant():
+        return random.choice(tenants[:5])
+
+    shapes = {
+        "listing": lambda: {"parent": tenant()},
+        "event_type": lambda: {"parent": tenant(), "event_type": "order.created"},
+        "entity": lambda: {
+            "parent": tenant(),
+            "entity_type": "order",
+            "entity_id": f"order-{random.randrange(10_000)}",
+        },
+    }
+
+    print(f"{'rows':>12} {'query':<11} {'indexes':<8} {'p50 ms':>9} {'p99 ms':>9}")
+    for size in sorted(args.sizes):
+        print(f"filling to {size:,} rows")
+        fill(db, size, tenants, args.days)
+        for present in (False, True):
+            set_indexes(db, present)
+            for name, params in shapes.items():
+                p50, p99 = measure(db, params, args.samples)
+                label = "after" if present else "before"
+                print(f"{size:>12,} {name:<11} {label:<8} {p50:>9.2f} {p99:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+CPU cost of building the single-event ingest response, full vs ``return=minimal``.
+
+The full path turns the inserted EventORM into an ``Event`` and lets FastAPI
+encode it; the minimal path only wraps the RETURNING row in an ``EventRef``.
+The refresh SELECT the minimal path also avoids is a database round trip and
+is not part of this number.
+
+    python -m benchmarks.bench_ingest_response [iterations]
+"""
+
+import sys
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from flux_watch_api.models.events import EventCreate, EventRef
+from flux_watch_api.schema.events import EventORM
+
+
+def _stored_event() -> EventORM:
+    event = EventCreate.model_validate(
+        {
+            "entity": {"type": "order", "id": "order-1"},
+            "eventType": "order.created",
+            "producer": "checkout",
+            "occurredAt": datetime.now(timezone.utc).isoformat(),
+            "actor": {"type": "user", "id": "user-1"},
+            "context": {"traceId": "t-1", "source": "web"},
+            "payload": {"amount": 1999, "currency": "EUR", "items": [{"sku": "a", "qty": 2}]},
+        }
+    )
+    now = datetime.now(timezone.utc)
+    row = EventORM.values_from_model(event, parent="acct@example.com")
+    return EventORM(**row, id=uuid4(), created_at=now, updated_at=now)
+
+
+def full(orm: EventORM):
+    return jsonable_encoder(orm.to_model())
+
+
+def minimal(orm: EventORM):
+    return jsonable_encoder(EventRef(id=orm.id, occurred_at=orm.occurred_at))
+
+
+def bench(fn, orm: EventORM, iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        fn(orm)
+    return (time.process_time() - started) / iterations
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    orm = _stored_event()
+    for fn in (full, minimal):
+        fn(orm)
+
+    full_us = bench(full, orm, iterations) * 1e6
+    minimal_us = bench(minimal, orm, iterations) * 1e6
+    print(f"full     {full_us:8.1f} us/request")
+    print(f"minimal  {minimal_us:8.1f} us/request")
+    print(f"saved    {full_us - minimal_us:8.1f} us/request ({1 - minimal_us / full_us:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Per-query cost of QueryBuilder with and without the compiled QueryPlan.
+
+"before" runs every feature's ``apply`` the way the builder did before plans
+existed (the plan of the QueryModel instance is switched off); "after" uses
+the plan compiled at class definition. Shapes are the auth lookup every
+request does, the API key listing and two GET /events queries.
+
+Without ``--pg-url`` only building the statements is timed. With it, each
+statement is also executed against that database, which adds the compiled
+cache lookup and the driver's work; the tables only need to exist. Timings
+are process CPU time, so waiting on the server is not counted.
+
+    python -m benchmarks.bench_query_build [--iterations 20000] [--pg-url postgresql://...]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+from flux_watch_api.database.query_builder.builder import QueryBuilder
+from flux_watch_api.database.session import Database, DatabaseConnectionConfig
+from flux_watch_api.managers.auth.plugins.key_plugin import KeySearch
+from flux_watch_api.models.common import AccountSearch
+from flux_watch_api.repository.events.events import EventsSearch
+
+SHAPES = {
+    "auth": (AccountSearch, {"principal": "acct@example.com"}, False),
+    "keys": (KeySearch, {"is_active": True}, False),
+    "events": (EventsSearch, {"parent": "acct@example.com"}, True),
+    "events_filtered": (
+        EventsSearch,
+        {"parent": "acct@example.com", "event_type": "order.created", "payload__amount__gt": "100"},
+        True,
+    ),
+}
+
+
+def run(shape: str, planned: bool, session=None) -> None:
+    schema_cls, params, with_counts = SHAPES[shape]
+    builder = QueryBuilder(schema_cls, **params)
+    if not planned:
+        builder.schema.plan = None
+    data_query, count_query = builder.build(with_counts=with_counts)
+    if session is not None:
+        session.execute(data_query).all()
+        if count_query is not None:
+            session.execute(count_query).scalar_one()
+
+
+def bench(fn: Callable[[], None], iterations: int) -> float:
+    # warm up: the first executions compile, psycopg prepares after five
+    for _ in range(10):
+        fn()
+    started = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - started) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--pg-url", help="Also execute the statements against this database")
+    args = parser.parse_args()
+
+    session = None
+    if args.pg_url:
+        db = Database(url=args.pg_url, config=DatabaseConnectionConfig.API)
+        session = db.session_local()
+
+    modes = {"build": None}
+    if session is not None:
+        # round trips dominate, so fewer of them
+        modes["execute"] = session
+    print(f"{'query':<16} {'mode':<8} {'before us':>10} {'after us':>10} {'speedup':>8}")
+    for shape in SHAPES:
+        for mode, target in modes.items():
+            iterations = args.iterations if target is None else max(args.iterations // 20, 1)
+            before, after = (
+                bench(partial(run, shape, planned, target), iterations) * 1e6
+                for planned in (False, True)
+            )
+            print(f"{shape:<16} {mode:<8} {before:>10.1f} {after:>10.1f} {before / after:>7.2f}x")
+
+    if session is not None:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
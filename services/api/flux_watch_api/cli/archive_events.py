@@ -0,0 +1,131 @@
+"""
+Move events partitions older than the archive window to Parquet files.
+
+Every partition of ``events`` whose range ends at least ``--after-days`` days
+ago is streamed into EventArchive and the archive watermark is moved up to the
+partition's upper bound, oldest first. The archived partitions are dropped at
+the end, ``--watermark-ttl`` seconds after the last move, once no reader can
+still hold a watermark from before it. Files are complete before the watermark
+moves and the watermark moves before the drop, so reads never see a gap; an
+interrupted run is simply started again and overwrites what it had written for
+the partition it was on.
+
+    python -m flux_watch_api.cli.archive_events --archive-dir /srv/fluxwatch/archive
+"""
+
+import argparse
+import logging
+import sys
+import time as timer
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import text
+
+from flux_watch_api.core.config import AppConfig
+from flux_watch_api.database.partitions import PARTITIONS_QUERY, partition_bounds
+from flux_watch_api.database.session import Database, DatabaseConnectionConfig
+from flux_watch_api.services.archive import EventArchive
+
+logger = logging.getLogger(__name__)
+
+
+def aged_partitions(db: Database, cutoff: datetime) -> list[tuple[datetime, str]]:
+    """``(upper, name)`` of the partitions ending on or before ``cutoff``, oldest first."""
+    with db.session_local() as session:
+        bounds = partition_bounds(session.execute(PARTITIONS_QUERY, {"table": "events"}))
+    return sorted(
+        (upper, name)
+        for name, (_, upper) in bounds.items()
+        if upper is not None and upper <= cutoff
+    )
+
+
+def archive(
+    db: Database,
+    store: EventArchive,
+    after_days: int,
+    batch_size: int,
+    dry_run: bool,
+    watermark_ttl: float = 0,
+):
+    cutoff = datetime.combine(date.today() - timedelta(days=after_days), time.min)
+    archived = []
+
+    for upper, name in aged_partitions(db, cutoff):
+        if dry_run:
+            logger.info(f"{name}: would archive rows before {upper.isoformat()}")
+            continue
+
+        started = timer.perf_counter()
+        with db.session_local() as session:
+            # parent DESC, occurred_at ASC is a backward scan of the listing
+            # index; the archive only needs each (parent, day) to be contiguous
+            rows = session.execute(
+                text(f'SELECT * FROM "{name}" ORDER BY parent DESC, occurred_at'),
+                execution_options={"stream_results": True, "yield_per": batch_size},
+            ).mappings()
+            count = store.write(rows, name=name)
+        store.advance_watermark(upper)
+        archived.append(name)
+        logger.info(
+            f"{name}: archived {count} rows in {timer.perf_counter() - started:.1f}s, "
+            f"watermark={upper.isoformat()}"
+        )
+
+    if archived:
+        # readers cache the watermark; until theirs expires they still read
+        # these ranges from Postgres
+        timer.sleep(watermark_ttl)
+    for name in archived:
+        with db.session_local() as session, session.begin():
+            session.execute(text(f'DROP TABLE "{name}"'))
+        logger.info(f"{name}: dropped")
+
+    return archived
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--archive-dir", default=AppConfig.EVENTS_ARCHIVE_DIR, help="Defaults to EVENTS_ARCHIVE_DIR"
+    )
+    parser.add_argument(
+        "--after-days",
+        type=int,
+        default=AppConfig.EVENTS_ARCHIVE_AFTER_DAYS,
+        help="Defaults to EVENTS_ARCHIVE_AFTER_DAYS",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=50_000, help="Rows fetched per round trip"
+    )
+    parser.add_argument(
+        "--watermark-ttl",
+        type=float,
+        default=AppConfig.EVENTS_ARCHIVE_WATERMARK_TTL_S,
+        help="Seconds to wait before dropping archived partitions; "
+        "defaults to EVENTS_ARCHIVE_WATERMARK_TTL_S",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only list what would be archived")
+    parser.add_argument("--pg-url", default=AppConfig.PG_URL, help="Defaults to PG_URL")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s: %(message)s")
+
+    if not args.archive_dir:
+        parser.error("--archive-dir or EVENTS_ARCHIVE_DIR is required")
+
+    db = Database(url=args.pg_url, config=DatabaseConnectionConfig.API)
+    archived = archive(
+        db,
+        EventArchive(root=args.archive_dir),
+        after_days=args.after_days,
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+        watermark_ttl=args.watermark_ttl,
+    )
+    logger.info(f"done: archived {len(archived)} partitions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
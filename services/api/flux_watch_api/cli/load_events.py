@@ -0,0 +1,94 @@
+"""
+Bulk load NDJSON event files into the events table through COPY.
+
+Meant for backfills and for seeding capacity-test databases with tens of
+millions of rows. Each line is validated against EventCreate; every
+``--chunk-size`` rows are copied and committed in their own transaction so
+memory stays flat and an interrupted load keeps what it already wrote.
+Loaded events are not published to the analytics stream.
+
+    python -m flux_watch_api.cli.load_events --parent acct@example.com events.ndjson
+"""
+
+import argparse
+import logging
+import sys
+import time
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from flux_watch_api.core.config import AppConfig
+from flux_watch_api.database.bulk import CopyLoader
+from flux_watch_api.database.session import Database, DatabaseConnectionConfig
+from flux_watch_api.models.events import EventCreate
+from flux_watch_api.schema.events import EventORM
+from flux_watch_api.utils.utilities import format_validation_error
+
+logger = logging.getLogger(__name__)
+
+
+def iter_rows(path: Path, parent: str, stats: dict[str, int]) -> Iterator[dict[str, Any]]:
+    with path.open("rb") as fh:
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                event = EventCreate.model_validate_json(line)
+            except ValidationError as err:
+                stats["rejected"] += 1
+                logger.warning(f"{path}:{line_no}: {format_validation_error(err)}")
+                continue
+            yield EventORM.values_from_model(event, parent=parent)
+
+
+def load(db: Database, paths: list[Path], parent: str, chunk_size: int, binary: bool):
+    stats = {"loaded": 0, "rejected": 0}
+    started = time.perf_counter()
+
+    for path in paths:
+        rows = iter_rows(path, parent=parent, stats=stats)
+        while True:
+            chunk = islice(rows, chunk_size)
+            with db.session_local() as session, session.begin():
+                copied = CopyLoader(session, EventORM, binary=binary).copy(chunk)
+            if not copied:
+                break
+            stats["loaded"] += copied
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"{path.name}: loaded={stats['loaded']} rejected={stats['rejected']} "
+                f"rate={stats['loaded'] / elapsed:,.0f} rows/s"
+            )
+
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="+", type=Path, help="NDJSON files, one event per line")
+    parser.add_argument("--parent", required=True, help="Account principal owning the events")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Rows per transaction")
+    parser.add_argument("--text", action="store_true", help="Use text COPY instead of binary")
+    parser.add_argument("--pg-url", default=AppConfig.PG_URL, help="Defaults to PG_URL")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s: %(message)s")
+
+    db = Database(url=args.pg_url, config=DatabaseConnectionConfig.API)
+    stats = load(
+        db,
+        paths=args.files,
+        parent=args.parent,
+        chunk_size=args.chunk_size,
+        binary=not args.text,
+    )
+    logger.info(f"done: loaded={stats['loaded']} rejected={stats['rejected']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
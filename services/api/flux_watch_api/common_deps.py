@@ -3,8 +3,12 @@ import logging.config
 
 from flux_watch_api.core.config import AppConfig
 from flux_watch_api.core.registry import registry
-from flux_watch_api.database.redis import Redis
-from flux_watch_api.database.session import Database, DatabaseConnectionConfig
+from flux_watch_api.database.partitions import PartitionManager
+from flux_watch_api.database.redis import AsyncRedis, Redis
+from flux_watch_api.database.session import AsyncDatabase, Database, DatabaseConnectionConfig
+from flux_watch_api.services.archive import EventArchive
+from flux_watch_api.services.outbox_relay import OutboxRelay
+from flux_watch_api.services.write_behind import WriteBehindQueue
 
 
 def register_common_deps(init_logger: bool = True) -> None:
@@ -14,5 +18,51 @@ def register_common_deps(init_logger: bool = True) -> None:
     if init_logger:
         logging.config.dictConfig(_config.LOGGING_CONFIG)
 
-    registry.register(Database, url=_config.PG_URL, config=DatabaseConnectionConfig.API)
+    database_config = {
+        "url": _config.PG_URL,
+        "replica_urls": _config.PG_REPLICA_URLS,
+        "replica_cooldown_s": _config.PG_REPLICA_COOLDOWN_S,
+    }
+    # the sync Database only serves auth and account routes: it is the auth pool
+    registry.register(
+        Database, config=DatabaseConnectionConfig.AUTH, name="auth", **database_config
+    )
+    registry.register(
+        AsyncDatabase,
+        config=DatabaseConnectionConfig.QUERY,
+        name="query",
+        pools={
+            "ingest": DatabaseConnectionConfig.INGEST,
+            "stream": DatabaseConnectionConfig.STREAM,
+        },
+        **database_config,
+    )
     registry.register(Redis, redis_url=_config.REDIS_URL)
+    registry.register(AsyncRedis, redis_url=_config.REDIS_URL)
+    registry.register(
+        WriteBehindQueue,
+        max_size=_config.WRITE_BEHIND_MAX_QUEUE,
+        flush_size=_config.WRITE_BEHIND_FLUSH_SIZE,
+        max_latency_ms=_config.WRITE_BEHIND_MAX_LATENCY_MS,
+        retry_after=_config.WRITE_BEHIND_RETRY_AFTER,
+        retry_backoff_ms=_config.WRITE_BEHIND_RETRY_BACKOFF_MS,
+    )
+    registry.register(
+        OutboxRelay,
+        batch_size=_config.OUTBOX_BATCH_SIZE,
+        poll_interval_ms=_config.OUTBOX_POLL_INTERVAL_MS,
+        retention_seconds=_config.OUTBOX_RETENTION_SECONDS,
+    )
+    registry.register(
+        PartitionManager,
+        table="events",
+        interval=_config.EVENTS_PARTITION_INTERVAL,
+        premake=_config.EVENTS_PARTITION_PREMAKE,
+        retention_days=_config.EVENTS_RETENTION_DAYS,
+        check_interval_s=_config.PARTITION_CHECK_INTERVAL_S,
+    )
+    registry.register(
+        EventArchive,
+        root=_config.EVENTS_ARCHIVE_DIR,
+        watermark_ttl=_config.EVENTS_ARCHIVE_WATERMARK_TTL_S,
+    )
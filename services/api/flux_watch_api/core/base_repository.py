@@ -5,17 +5,14 @@ from starlette.requests import Request
 
 from flux_watch_api.core.config import AppConfig
 from flux_watch_api.core.registry import registry
-from flux_watch_api.database.client import SQLClient
-from flux_watch_api.database.redis import Redis
+from flux_watch_api.database.client import AsyncSQLClient, SQLClient
+from flux_watch_api.database.redis import AsyncRedis, Redis
 from flux_watch_api.models.account import Account
+from flux_watch_api.schema.outbox import OutboxORM
 
 
-class Repository:
-    def __init__(self, request: Request, client: SQLClient = Depends()):
-        self._client = client
-        self._request = request
-        self._redis: Redis = registry.resolve(Redis)
-        self.app_config: AppConfig = registry.resolve(AppConfig)
+class _RequestContext:
+    _request: Request
 
     @property
     def session_account(self) -> Account | None:
@@ -25,12 +22,20 @@ class Repository:
     def principal(self) -> str:
         return self.session_account.principal
 
-    def publish(self, stream, fields):
-        self._redis.publish(stream, fields)
+
+class Repository(_RequestContext):
+    def __init__(self, request: Request, client: SQLClient = Depends()):
+        self._client = client
+        self._request = request
+        self._redis: Redis = registry.resolve(Redis)
+        self.app_config: AppConfig = registry.resolve(AppConfig)
 
     def add_one(self, obj: Any):
         return self._client.add_one(obj)
 
+    def add_many(self, model: Any, rows: list[dict[str, Any]]):
+        return self._client.add_many(model, rows)
+
     def get_one(self, *args, **kwargs):
         return self._client.get_one(*args, **kwargs)
 
@@ -40,5 +45,80 @@ class Repository:
     def delete_one(self, *args, **kwargs):
         return self._client.delete_one(*args, **kwargs)
 
+    def update_where(self, *args, **kwargs):
+        return self._client.update_where(*args, **kwargs)
+
+    def soft_delete_where(self, *args, **kwargs):
+        return self._client.soft_delete_where(*args, **kwargs)
+
     def explicit_commit(self):
         return self._client.explicit_commit()
+
+
+class AsyncRepository(_RequestContext):
+    """Repository for async routes, backed by AsyncSQLClient and AsyncRedis."""
+
+    def __init__(self, request: Request, client: AsyncSQLClient = Depends()):
+        self._client = client
+        self._request = request
+        self._redis: AsyncRedis = registry.resolve(AsyncRedis)
+        self.app_config: AppConfig = registry.resolve(AppConfig)
+
+    async def add_to_outbox(self, stream: str, messages: list[dict]):
+        """Stage stream messages in the current transaction; the OutboxRelay
+        publishes them once it commits."""
+        rows = [{"stream": stream, "fields": fields} for fields in messages]
+        return await self._client.insert_many(OutboxORM, rows)
+
+    async def add_one(self, obj: Any):
+        return await self._client.add_one(obj)
+
+    async def add_many(self, model: Any, rows: list[dict[str, Any]]):
+        return await self._client.add_many(model, rows)
+
+    async def insert_returning(
+        self, model: Any, rows: list[dict[str, Any]], columns: tuple[str, ...]
+    ):
+        return await self._client.insert_returning(model, rows, columns)
+
+    async def add_many_skip_conflicts(self, model: Any, rows: list[dict[str, Any]], index: Any):
+        return await self._client.add_many_skip_conflicts(model, rows, index)
+
+    async def copy_many(self, model: Any, rows: list[dict[str, Any]]):
+        return await self._client.copy_many(model, rows)
+
+    async def get_by_keys(self, *args, **kwargs):
+        return await self._client.get_by_keys(*args, **kwargs)
+
+    async def cache_get_many(self, keys: list[str]) -> list[bytes | None]:
+        return await self._redis.get_many(keys)
+
+    async def cache_set_many(self, values: dict[str, str | bytes], ttl: int) -> None:
+        await self._redis.set_many(values, ttl)
+
+    async def cache_incr_many(self, keys: list[str]) -> None:
+        await self._redis.incr_many(keys)
+
+    def after_commit(self, key: str, callback) -> None:
+        self._client.after_commit(key, callback)
+
+    async def read_lag(self) -> float:
+        return await self._client.read_lag()
+
+    async def get_one(self, *args, **kwargs):
+        return await self._client.get_one(*args, **kwargs)
+
+    async def get_many(self, *args, **kwargs):
+        return await self._client.get_many(*args, **kwargs)
+
+    async def delete_one(self, *args, **kwargs):
+        return await self._client.delete_one(*args, **kwargs)
+
+    async def update_where(self, *args, **kwargs):
+        return await self._client.update_where(*args, **kwargs)
+
+    async def soft_delete_where(self, *args, **kwargs):
+        return await self._client.soft_delete_where(*args, **kwargs)
+
+    async def explicit_commit(self):
+        return await self._client.explicit_commit()
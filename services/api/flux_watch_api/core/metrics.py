@@ -0,0 +1,72 @@
+import threading
+from collections.abc import Callable
+from contextlib import contextmanager
+from time import perf_counter
+
+from flux_watch_api.core.class_helper import Singleton
+
+
+class Metrics(metaclass=Singleton):
+    """
+    Process-local counters, gauges and timers, exposed as JSON on /metrics.
+
+    Gauges can be registered as callbacks so values that already live somewhere
+    else (a queue size, a pool's checked-out count) are read at snapshot time
+    instead of being copied on every change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._gauges: dict[str, float] = {}
+        self._gauge_callbacks: dict[str, Callable[[], float]] = {}
+        self._timers: dict[str, dict[str, float]] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def register_gauge(self, name: str, fn: Callable[[], float]) -> None:
+        with self._lock:
+            self._gauge_callbacks[name] = fn
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timer = self._timers.setdefault(name, {"count": 0, "sum": 0.0, "max": 0.0, "last": 0.0})
+            timer["count"] += 1
+            timer["sum"] += seconds
+            timer["max"] = max(timer["max"], seconds)
+            timer["last"] = seconds
+
+    @contextmanager
+    def timer(self, name: str):
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - started)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            gauges = dict(self._gauges)
+            callbacks = dict(self._gauge_callbacks)
+            counters = dict(self._counters)
+            timers = {name: dict(values) for name, values in self._timers.items()}
+
+        for name, fn in callbacks.items():
+            gauges[name] = fn()
+        for values in timers.values():
+            values["avg"] = values["sum"] / values["count"] if values["count"] else 0.0
+
+        return {"counters": counters, "gauges": gauges, "timers": timers}
+
+
+metrics = Metrics()
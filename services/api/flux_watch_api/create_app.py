@@ -8,10 +8,15 @@ from flux_watch_api.common_deps import register_common_deps
 from flux_watch_api.core.app import App
 from flux_watch_api.core.config import AppConfig
 from flux_watch_api.core.registry import registry
-from flux_watch_api.database.redis import Redis
+from flux_watch_api.database.partitions import PartitionManager
+from flux_watch_api.database.redis import AsyncRedis, Redis
+from flux_watch_api.database.session import AsyncDatabase
 from flux_watch_api.errors.rest_errors import ServerError
 from flux_watch_api.middlewares.auth import auth_middleware
+from flux_watch_api.repository.events.events import EventsRepository
 from flux_watch_api.routes.routes import router
+from flux_watch_api.services.outbox_relay import OutboxRelay
+from flux_watch_api.services.write_behind import WriteBehindQueue
 from flux_watch_api.utils.cors import ALLOWED_HEADERS, ALLOWED_METHODS
 
 logger = logging.getLogger(__name__)
@@ -23,8 +28,20 @@ def create_app() -> App:
 
     @asynccontextmanager
     async def lifespan(_app: App):
+        ingest_queue: WriteBehindQueue = registry.resolve(WriteBehindQueue)
+        outbox_relay: OutboxRelay = registry.resolve(OutboxRelay)
+        partition_manager: PartitionManager = registry.resolve(PartitionManager)
+        await partition_manager.start()
+        await ingest_queue.start(flush=EventsRepository.flush_queued)
+        await outbox_relay.start()
         yield
-        registry.resolve(Redis).flush()
+        # the queue flushes into the outbox, so it has to drain first
+        await ingest_queue.stop()
+        await outbox_relay.stop()
+        await partition_manager.stop()
+        registry.resolve(Redis).close()
+        await registry.resolve(AsyncRedis).close()
+        await registry.resolve(AsyncDatabase).dispose()
 
     _app = App(
         title="FluxWatch API Service",
@@ -0,0 +1,98 @@
+import logging
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from psycopg.types.json import Jsonb
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from flux_watch_api.schema.utils.base import Base
+from flux_watch_api.utils.utilities import to_naive_utc
+
+logger = logging.getLogger(__name__)
+
+
+class CopyLoader:
+    """
+    Streams rows into a table through PostgreSQL ``COPY ... FROM STDIN``.
+
+    Rows are dicts keyed by ORM attribute name, the same shape ``SQLClient.add_many``
+    takes. Python-side column defaults (``id``, ``is_expired`` ...) are filled in on
+    the row dict itself so callers can read generated ids back after the copy;
+    server-side defaults (``created_at``/``updated_at``) are left to Postgres.
+    """
+
+    def __init__(self, session: Session | AsyncSession, model: type[Base], binary: bool = True):
+        self.session = session
+        self.model = model
+        self.binary = binary
+
+        mapper = inspect(model)
+        dialect = postgresql.dialect()
+        self._columns: list[tuple[str, str, str, Callable[[Any], Any] | None]] = []
+        self._defaults: list[tuple[str, Any]] = []
+        for column in model.__table__.columns:
+            if column.computed is not None or column.server_default is not None:
+                continue
+            attr = mapper.get_property_by_column(column).key
+            if column.default is not None:
+                self._defaults.append((attr, column.default))
+            pg_type = column.type.compile(dialect=dialect).lower()
+            # binary COPY does not cast timestamptz -> timestamp for us like INSERT does
+            convert = to_naive_utc if pg_type == "timestamp without time zone" else None
+            if not binary and pg_type == "jsonb":
+                convert = Jsonb
+            self._columns.append((attr, column.name, pg_type, convert))
+
+    @property
+    def statement(self) -> str:
+        names = ", ".join(f'"{name}"' for _, name, _, _ in self._columns)
+        fmt = " (FORMAT BINARY)" if self.binary else ""
+        return f'COPY "{self.model.__tablename__}" ({names}) FROM STDIN{fmt}'
+
+    def _apply_defaults(self, row: dict[str, Any]) -> None:
+        for attr, default in self._defaults:
+            if row.get(attr) is None:
+                row[attr] = default.arg(None) if default.is_callable else default.arg
+
+    def _values(self, row: dict[str, Any]) -> list[Any]:
+        values = []
+        for attr, _, _, convert in self._columns:
+            value = row.get(attr)
+            values.append(convert(value) if convert and value is not None else value)
+        return values
+
+    def copy(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Copy every row in ``rows`` inside the session's current transaction.
+
+        ``rows`` may be a generator, it is consumed exactly once, so arbitrarily
+        large inputs are loaded in constant memory. Returns the number of rows.
+        """
+        raw = self.session.connection().connection.driver_connection
+        count = 0
+        with raw.cursor() as cursor, cursor.copy(self.statement) as copy:
+            if self.binary:
+                copy.set_types([pg_type for _, _, pg_type, _ in self._columns])
+            for row in rows:
+                self._apply_defaults(row)
+                copy.write_row(self._values(row))
+                count += 1
+        logger.info(f"copied {count} rows into {self.model.__tablename__}")
+        return count
+
+    async def acopy(self, rows: Iterable[dict[str, Any]]) -> int:
+        """``copy`` for an AsyncSession, driving psycopg's async COPY API."""
+        connection = await self.session.connection()
+        raw = (await connection.get_raw_connection()).driver_connection
+        count = 0
+        async with raw.cursor() as cursor, cursor.copy(self.statement) as copy:
+            if self.binary:
+                copy.set_types([pg_type for _, _, pg_type, _ in self._columns])
+            for row in rows:
+                self._apply_defaults(row)
+                await copy.write_row(self._values(row))
+                count += 1
+        logger.info(f"copied {count} rows into {self.model.__tablename__}")
+        return count
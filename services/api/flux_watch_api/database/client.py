@@ -1,12 +1,25 @@
 import logging
-from typing import TypeVar
+from typing import Any, TypeVar
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Index, insert, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from flux_watch_api.core.metrics import metrics
+from flux_watch_api.database.bulk import CopyLoader
 from flux_watch_api.database.query_builder.base import QueryModel
 from flux_watch_api.database.query_builder.builder import QueryBuilder
-from flux_watch_api.database.session import InjectSession
+from flux_watch_api.database.replicas import AsyncReadSessions, ReadSessions
+from flux_watch_api.database.session import (
+    AFTER_COMMIT,
+    InjectAsyncReadSessions,
+    InjectAsyncSession,
+    InjectReadSessions,
+    InjectSession,
+    run_after_commit,
+)
 from flux_watch_api.errors.rest_errors import AlreadyExistsError, NotFoundError
 from flux_watch_api.schema.utils.base import Base
 
@@ -14,10 +27,86 @@ T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# seconds of commits a replica has received but not replayed yet; 0 when it has
+# replayed everything, and on the primary, where both functions return NULL
+_REPLAY_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+def _insert_returning(model: type[Base], columns: tuple[str, ...]):
+    if not issubclass(model, Base):
+        raise TypeError(f"{model.__name__} must be of type DeclarativeBase | Base")
+    return insert(model).returning(
+        *(getattr(model, c) for c in columns), sort_by_parameter_order=True
+    )
+
+
+def _insert_skip_conflicts(model: type[Base], index: Index):
+    if not issubclass(model, Base):
+        raise TypeError(f"{model.__name__} must be of type DeclarativeBase | Base")
+    return (
+        pg_insert(model)
+        .on_conflict_do_nothing(
+            index_elements=list(index.expressions),
+            index_where=index.dialect_options["postgresql"]["where"],
+        )
+        .returning(model)
+    )
+
+
+def _update_where(search_model: QueryModel, values: dict[str, Any], soft_delete=False, **kwargs):
+    builder = QueryBuilder(search_model, **kwargs)
+    criteria = builder.build_where()
+    if criteria is None:
+        # an unfiltered UPDATE of a whole table is never what a caller meant
+        raise ValueError(f"{search_model.__name__} produced no filters for {kwargs}")
+    model = builder.schema.model
+    stmt = update(model).where(criteria)
+    if soft_delete:
+        if not hasattr(model, "expired"):
+            raise AttributeError(f"{model.__name__} does not have 'expired' field")
+        stmt = stmt.where(model.expired.is_(False))
+    return stmt.values(**values)
+
+
+def _select_by_keys(model: type[Base], columns: tuple[str, ...], keys: list[tuple]):
+    if not issubclass(model, Base):
+        raise TypeError(f"{model.__name__} must be of type DeclarativeBase | Base")
+    return select(model).where(tuple_(*(getattr(model, c) for c in columns)).in_(keys))
+
 
 class SQLClient:
-    def __init__(self, session: Session = InjectSession()):
+    """
+    ``get_one`` / ``get_many`` read from a replica when the Database has any;
+    everything else, and every read after the request touched the primary
+    (read-your-writes), goes to the primary. ``use_primary=True`` forces the
+    primary for one call, e.g. when the loaded objects are going to be changed.
+    """
+
+    def __init__(
+        self, session: Session = InjectSession(), reads: ReadSessions = InjectReadSessions()
+    ):
         self.session = session
+        # constructed by hand (workers, CLIs, tests) there is no replica routing
+        self.reads = reads if isinstance(reads, ReadSessions) else None
+
+    def _read(self, use_primary: bool, fn):
+        if use_primary or self.reads is None or self.session.in_transaction():
+            return fn(self.session)
+        replica = self.reads.get()
+        if replica is None:
+            return fn(self.session)
+        try:
+            result = fn(replica)
+            # end the snapshot right away; loaded rows stay usable (no expire on commit)
+            replica.commit()
+        except OperationalError:
+            metrics.incr("db.replica_fallbacks")
+            self.reads.failed()
+            return fn(self.session)
+        return result
 
     def add_one(self, obj: Base):
         if not isinstance(obj, Base):
@@ -30,22 +119,44 @@ class SQLClient:
         except IntegrityError as err:
             raise AlreadyExistsError from err
 
-    def get_one(self, search_model: QueryModel, **kwargs) -> T | None:
+    def add_many(self, model: type[Base], rows: list[dict[str, Any]]) -> list[Base]:
+        """Insert all rows with a single multi-row INSERT ... RETURNING.
+
+        Rows come back as ORM objects in the same order as ``rows``, with
+        server-generated columns populated, so no follow-up refresh is needed.
+        """
+        if not rows:
+            return []
+        if not issubclass(model, Base):
+            raise TypeError(f"{model.__name__} must be of type DeclarativeBase | Base")
+        try:
+            stmt = insert(model).returning(model, sort_by_parameter_order=True)
+            return list(self.session.scalars(stmt, rows).all())
+        except IntegrityError as err:
+            raise AlreadyExistsError from err
+
+    def get_one(self, search_model: QueryModel, use_primary: bool = False, **kwargs) -> T | None:
         builder = QueryBuilder(search_model, **kwargs)
         query, _ = builder.build(paginate=False, sort=False)
         logger.info(f"executing query: {query}")
-        result = self.session.execute(query).scalar_one_or_none()
+        result = self._read(use_primary, lambda s: s.execute(query).scalar_one_or_none())
         if not result:
             raise NotFoundError
         return result
 
-    def get_many(self, search_model: QueryModel, **kwargs) -> T | None:
+    def get_many(self, search_model: QueryModel, use_primary: bool = False, **kwargs) -> T | None:
         builder = QueryBuilder(search_model, **kwargs)
         data_query, count_query = builder.build(with_counts=True)
         logger.info(f"executing query: {data_query}")
-        rows = self.session.execute(data_query).scalars().all()
-        total_count = self.session.execute(count_query).scalar_one()
-        return rows, total_count
+
+        def _fetch(session: Session):
+            result = session.execute(data_query)
+            rows = result.all() if builder.projected else result.scalars().all()
+            if count_query is None:
+                return rows, None
+            return rows, builder.count_value(session.execute(count_query).scalar_one())
+
+        return self._read(use_primary, _fetch)
 
     def delete_one(self, obj: Base, archive: bool = True):
         if not isinstance(obj, Base):
@@ -58,7 +169,200 @@ class SQLClient:
             else:
                 raise AttributeError(f"{obj.__class__.__name__} does not have 'expired' field")
 
+    def update_where(self, search_model: QueryModel, values: dict[str, Any], **kwargs) -> int:
+        """UPDATE every row ``search_model`` selects for ``kwargs`` in one statement.
+
+        ``values`` are keyed by ORM attribute name. Returns the affected row count.
+        """
+        stmt = _update_where(search_model, values, **kwargs)
+        return self.session.execute(stmt).rowcount
+
+    def soft_delete_where(self, search_model: QueryModel, **kwargs) -> int:
+        """Set-based ``delete_one(archive=True)``: expire all matching rows at once."""
+        stmt = _update_where(search_model, {"expired": True}, soft_delete=True, **kwargs)
+        return self.session.execute(stmt).rowcount
+
     # sometimes we need to commit transactions before raising an explicit error,
     # raising an error would fail the session generator's commit, hence adding this
     def explicit_commit(self):
         self.session.commit()
+
+
+class AsyncSQLClient:
+    """
+    asyncio counterpart of SQLClient; queries are built by the same QueryBuilder
+    so both clients return identical results. The bulk ingest methods only
+    exist here: events are the only table written in bulk.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession = InjectAsyncSession(),
+        reads: AsyncReadSessions = InjectAsyncReadSessions(),
+    ):
+        self.session = session
+        self.reads = reads if isinstance(reads, AsyncReadSessions) else None
+
+    async def _read(self, use_primary: bool, fn):
+        if use_primary or self.reads is None or self.session.in_transaction():
+            return await fn(self.session)
+        replica = await self.reads.get()
+        if replica is None:
+            return await fn(self.session)
+        try:
+            result = await fn(replica)
+            await replica.commit()
+        except OperationalError:
+            metrics.incr("db.replica_fallbacks")
+            await self.reads.failed()
+            return await fn(self.session)
+        return result
+
+    async def read_lag(self) -> float:
+        """How far, in seconds, the session the next ``get_one`` / ``get_many``
+        reads from is behind the primary; 0 when that is the primary. Measured
+        before the read, so the read is at least this fresh."""
+
+        async def _fetch(session: AsyncSession):
+            return float((await session.execute(_REPLAY_LAG)).scalar_one())
+
+        return await self._read(False, _fetch)
+
+    async def add_one(self, obj: Base):
+        if not isinstance(obj, Base):
+            raise TypeError(f"{obj.__class__.__name__} must be of type DeclarativeBase | Base")
+        try:
+            self.session.add(obj)
+            await self.session.flush()
+            await self.session.refresh(obj)
+            return obj
+        except IntegrityError as err:
+            raise AlreadyExistsError from err
+
+    async def add_many(self, model: type[Base], rows: list[dict[str, Any]]) -> list[Base]:
+        if not rows:
+            return []
+        if not issubclass(model, Base):
+            raise TypeError(f"{model.__name__} must be of type DeclarativeBase | Base")
+        try:
+            stmt = insert(model).returning(model, sort_by_parameter_order=True)
+            return list((await self.session.scalars(stmt, rows)).all())
+        except IntegrityError as err:
+            raise AlreadyExistsError from err
+
+    async def insert_many(self, model: type[Base], rows: list[dict[str, Any]]) -> int:
+        """Insert rows without RETURNING, for writes nobody reads back."""
+        if not rows:
+            return 0
+        if not issubclass(model, Base):
+            raise TypeError(f"{model.__name__} must be of type DeclarativeBase | Base")
+        await self.session.execute(insert(model), rows)
+        return len(rows)
+
+    async def insert_returning(
+        self, model: type[Base], rows: list[dict[str, Any]], columns: tuple[str, ...]
+    ) -> list[Any]:
+        """Insert rows and read back only ``columns``, in the order of ``rows``.
+
+        Skips building and refreshing ORM objects when the caller only needs a
+        few server-side values.
+        """
+        if not rows:
+            return []
+        stmt = _insert_returning(model, columns)
+        try:
+            return list((await self.session.execute(stmt, rows)).all())
+        except IntegrityError as err:
+            raise AlreadyExistsError from err
+
+    async def add_many_skip_conflicts(
+        self, model: type[Base], rows: list[dict[str, Any]], index: Index
+    ) -> list[Base]:
+        """INSERT ... ON CONFLICT DO NOTHING on the unique ``index``.
+
+        Only the rows that were actually inserted are returned, in no particular
+        order; callers that need to match them back should set ``id`` up front.
+        """
+        if not rows:
+            return []
+        stmt = _insert_skip_conflicts(model, index)
+        return list((await self.session.scalars(stmt, rows)).all())
+
+    async def get_by_keys(
+        self, model: type[Base], columns: tuple[str, ...], keys: list[tuple]
+    ) -> list[Base]:
+        """Fetch rows whose ``columns`` match any of the ``keys`` tuples."""
+        if not keys:
+            return []
+        return list((await self.session.scalars(_select_by_keys(model, columns, keys))).all())
+
+    async def copy_many(self, model: type[Base], rows: list[dict[str, Any]]) -> int:
+        """Load rows through COPY; much faster than INSERT for large batches.
+
+        Python-side defaults such as ``id`` are filled in on the row dicts.
+        """
+        if not issubclass(model, Base):
+            raise TypeError(f"{model.__name__} must be of type DeclarativeBase | Base")
+        try:
+            return await CopyLoader(self.session, model).acopy(rows)
+        except IntegrityError as err:
+            raise AlreadyExistsError from err
+
+    async def get_one(
+        self, search_model: QueryModel, use_primary: bool = False, **kwargs
+    ) -> T | None:
+        builder = QueryBuilder(search_model, **kwargs)
+        query, _ = builder.build(paginate=False, sort=False)
+        logger.info(f"executing query: {query}")
+
+        async def _fetch(session: AsyncSession):
+            return (await session.execute(query)).scalar_one_or_none()
+
+        result = await self._read(use_primary, _fetch)
+        if not result:
+            raise NotFoundError
+        return result
+
+    async def get_many(
+        self, search_model: QueryModel, use_primary: bool = False, **kwargs
+    ) -> T | None:
+        builder = QueryBuilder(search_model, **kwargs)
+        data_query, count_query = builder.build(with_counts=True)
+        logger.info(f"executing query: {data_query}")
+
+        async def _fetch(session: AsyncSession):
+            result = await session.execute(data_query)
+            rows = result.all() if builder.projected else result.scalars().all()
+            if count_query is None:
+                return rows, None
+            return rows, builder.count_value((await session.execute(count_query)).scalar_one())
+
+        return await self._read(use_primary, _fetch)
+
+    async def delete_one(self, obj: Base, archive: bool = True):
+        if not isinstance(obj, Base):
+            raise TypeError(f"{obj.__class__.__name__} must be of type DeclarativeBase | Base")
+        if not archive:
+            await self.session.delete(obj)
+        else:
+            if hasattr(obj, "expired"):
+                obj.expired = True
+            else:
+                raise AttributeError(f"{obj.__class__.__name__} does not have 'expired' field")
+
+    async def update_where(self, search_model: QueryModel, values: dict[str, Any], **kwargs) -> int:
+        stmt = _update_where(search_model, values, **kwargs)
+        return (await self.session.execute(stmt)).rowcount
+
+    async def soft_delete_where(self, search_model: QueryModel, **kwargs) -> int:
+        stmt = _update_where(search_model, {"expired": True}, soft_delete=True, **kwargs)
+        return (await self.session.execute(stmt)).rowcount
+
+    def after_commit(self, key: str, callback) -> None:
+        """Await ``callback`` once the transaction commits; a callback registered
+        again under the same ``key`` before that runs only once."""
+        self.session.info.setdefault(AFTER_COMMIT, {})[key] = callback
+
+    async def explicit_commit(self):
+        await self.session.commit()
+        await run_after_commit(self.session)
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import re
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from flux_watch_api.core.metrics import metrics
+from flux_watch_api.core.registry import registry
+from flux_watch_api.database.session import AsyncDatabase
+
+logger = logging.getLogger(__name__)
+
+INTERVALS = {"day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+_BOUND = re.compile(r"FOR VALUES FROM \((?P<lower>.+?)\) TO \((?P<upper>.+?)\)")
+
+PARTITIONS_QUERY = text(
+    "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+    "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+    "WHERE i.inhparent = CAST(:table AS regclass)"
+)
+
+# the columns an INSERT can write, i.e. not generated ones
+STORED_COLUMNS_QUERY = text(
+    "SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) FROM pg_attribute "
+    "WHERE attrelid = CAST(:table AS regclass) AND attnum > 0 "
+    "AND NOT attisdropped AND attgenerated = ''"
+)
+
+
+def _parse_bound(value: str) -> datetime | None:
+    # MINVALUE / MAXVALUE come back as None, i.e. unbounded
+    value = value.strip()
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+def partition_bounds(rows) -> dict[str, tuple[datetime | None, datetime | None]]:
+    """``name -> (lower, upper)`` from PARTITIONS_QUERY rows, DEFAULT left out."""
+    bounds = {}
+    for name, expr in rows:
+        match = _BOUND.search(expr or "")
+        if match:
+            bounds[name] = (_parse_bound(match["lower"]), _parse_bound(match["upper"]))
+    return bounds
+
+
+class PartitionManager:
+    """
+    Keeps a range-partitioned table supplied with partitions.
+
+    Partitions span one ``interval`` (weeks start on Monday) and are named
+    ``<table>_pYYYYMMDD`` after their first day. ``maintain`` creates the
+    current partition plus ``premake`` future ones, and drops partitions that
+    end before the retention window; dropping a partition replaces the bulk
+    DELETEs retention used to need. The DEFAULT partition only catches rows
+    outside every range and is never dropped; rows it caught for a range that
+    gets its partition later are moved into it when it is created.
+    """
+
+    def __init__(
+        self,
+        table: str = "events",
+        column: str = "occurred_at",
+        interval: str = "week",
+        premake: int = 4,
+        retention_days: int = 0,
+        check_interval_s: int = 3600,
+    ):
+        if interval not in INTERVALS:
+            raise ValueError(f"Unsupported partition interval '{interval}'")
+        self.table = table
+        self.column = column
+        self.interval = interval
+        self.premake = premake
+        self.retention_days = retention_days
+        self.check_interval = check_interval_s
+
+        self._task: asyncio.Task | None = None
+        self._stopping: asyncio.Event | None = None
+
+    def floor(self, day: date) -> date:
+        if self.interval == "week":
+            return day - timedelta(days=day.weekday())
+        return day
+
+    def partition_name(self, start: date) -> str:
+        return f"{self.table}_p{start:%Y%m%d}"
+
+    def planned(self, today: date) -> list[tuple[str, date, date]]:
+        """``(name, start, end)`` for the current partition and ``premake`` after it."""
+        step = INTERVALS[self.interval]
+        first = self.floor(today)
+        starts = [first + step * i for i in range(self.premake + 1)]
+        return [(self.partition_name(start), start, start + step) for start in starts]
+
+    async def partitions(
+        self, session: AsyncSession
+    ) -> dict[str, tuple[datetime | None, datetime | None]]:
+        """Existing range partitions as ``name -> (lower, upper)``."""
+        return partition_bounds(await session.execute(PARTITIONS_QUERY, {"table": self.table}))
+
+    async def ensure_partitions(self, session: AsyncSession, today: date) -> list[str]:
+        rows = list(await session.execute(PARTITIONS_QUERY, {"table": self.table}))
+        existing = partition_bounds(rows)
+        default = next((name for name, expr in rows if expr == "DEFAULT"), None)
+        created = []
+        for name, start, end in self.planned(today):
+            lower, upper = datetime.combine(start, time.min), datetime.combine(end, time.min)
+            overlaps = any(
+                (lo is None or lo < upper) and (hi is None or hi > lower)
+                for lo, hi in existing.values()
+            )
+            if name in existing or overlaps:
+                continue
+            # CREATE ... PARTITION OF fails while DEFAULT holds rows of the new range
+            moved = default is not None and await self._move_out_of_default(
+                session, default, lower, upper
+            )
+            await session.execute(
+                text(
+                    f'CREATE TABLE "{name}" PARTITION OF "{self.table}" '
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+            )
+            if moved:
+                await session.execute(
+                    text(f'INSERT INTO "{self.table}" ({moved}) SELECT {moved} FROM "_moved"')
+                )
+                await session.execute(text('DROP TABLE "_moved"'))
+            created.append(name)
+        return created
+
+    async def _move_out_of_default(
+        self, session: AsyncSession, default: str, lower: datetime, upper: datetime
+    ) -> str | None:
+        """Park the rows of ``[lower, upper)`` that ``default`` caught in a temporary
+        table, to be inserted again once their partition exists. Returns the
+        column list to insert them with, or None when there was nothing to move."""
+        bounds = {"lower": lower, "upper": upper}
+        in_range = f'"{self.column}" >= :lower AND "{self.column}" < :upper'
+        stray = await session.execute(
+            text(f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {in_range})'), bounds
+        )
+        if not stray.scalar():
+            return None
+        columns = (await session.execute(STORED_COLUMNS_QUERY, {"table": self.table})).scalar_one()
+        await session.execute(
+            text(
+                f'CREATE TEMPORARY TABLE "_moved" AS SELECT {columns} FROM "{default}" WITH NO DATA'
+            )
+        )
+        await session.execute(
+            text(
+                f'WITH moved AS (DELETE FROM "{default}" WHERE {in_range} RETURNING {columns}) '
+                f'INSERT INTO "_moved" SELECT * FROM moved'
+            ),
+            bounds,
+        )
+        return columns
+
+    async def drop_expired(self, session: AsyncSession, today: date) -> list[str]:
+        if not self.retention_days:
+            return []
+        cutoff = datetime.combine(today - timedelta(days=self.retention_days), time.min)
+        dropped = []
+        for name, (_, upper) in (await self.partitions(session)).items():
+            if upper is not None and upper <= cutoff:
+                await session.execute(text(f'DROP TABLE "{name}"'))
+                dropped.append(name)
+        return dropped
+
+    async def maintain(self, session: AsyncSession, today: date | None = None) -> None:
+        today = today or datetime.now(timezone.utc).date()
+        # every API worker runs this; the lock makes the concurrent runs queue up
+        await session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": f"partitions:{self.table}"},
+        )
+        created = await self.ensure_partitions(session, today)
+        dropped = await self.drop_expired(session, today)
+        metrics.incr(f"partitions.{self.table}.created", len(created))
+        metrics.incr(f"partitions.{self.table}.dropped", len(dropped))
+        if created or dropped:
+            logger.info(f"{self.table} partitions: created={created} dropped={dropped}")
+
+    async def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name=f"{self.table}-partitions")
+
+    async def stop(self) -> None:
+        if self._task is None or self._task.done():
+            return
+        self._stopping.set()
+        await self._task
+
+    async def _run(self) -> None:
+        db: AsyncDatabase = registry.resolve(AsyncDatabase)
+        while not self._stopping.is_set():
+            try:
+                async with db.session_scope() as session:
+                    await self.maintain(session)
+            except Exception:
+                metrics.incr(f"partitions.{self.table}.failed")
+                logger.exception(f"Partition maintenance for {self.table} failed")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.check_interval)
+            except TimeoutError:
+                pass
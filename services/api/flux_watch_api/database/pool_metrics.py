@@ -0,0 +1,39 @@
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from flux_watch_api.core.metrics import metrics
+
+
+def timed_pool(base: type[QueuePool], name: str) -> type[QueuePool]:
+    """``base`` recording how long checkouts wait, as the ``db.pool.<name>.wait``
+    timer, and how often they give up, as ``db.pool.<name>.timeouts``.
+
+    A subclass rather than a pool event: SQLAlchemy has no event before a
+    checkout starts waiting. The class survives ``engine.dispose()``, which
+    recreates the pool from it.
+    """
+
+    class TimedPool(base):
+        def _do_get(self):
+            started = perf_counter()
+            try:
+                return super()._do_get()
+            except PoolTimeoutError:
+                metrics.incr(f"db.pool.{name}.timeouts")
+                raise
+            finally:
+                metrics.observe(f"db.pool.{name}.wait", perf_counter() - started)
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+def register_pool_gauges(name: str, engine: Any) -> None:
+    # engine.pool is looked up on every read: dispose() swaps the pool object
+    metrics.register_gauge(f"db.pool.{name}.size", lambda: engine.pool.size())
+    metrics.register_gauge(f"db.pool.{name}.checked_out", lambda: engine.pool.checkedout())
+    # overflow() counts up from -size while the pool is not full yet
+    metrics.register_gauge(f"db.pool.{name}.overflow", lambda: max(engine.pool.overflow(), 0))
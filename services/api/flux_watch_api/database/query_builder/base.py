@@ -1,11 +1,13 @@
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import ClassVar
 
 from pydantic import BaseModel
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import Select
 
+from flux_watch_api.database.query_builder.processor import CountMode
 from flux_watch_api.utils.types import GetTypeHintOf
 
 logger = logging.getLogger(__name__)
@@ -16,6 +18,11 @@ class ParamsBase(BaseModel):
     page: int = 1
     page_size: int = 10
     search: str | None = None
+    # keyset position from a previous page, see QueryModel.keyset
+    cursor: str | None = None
+    count: CountMode = CountMode.EXACT
+    # comma separated model attributes: select only these columns, as rows
+    fields: str | None = None
 
 
 class QueryModel:
@@ -24,7 +31,25 @@ class QueryModel:
 
     model: DeclarativeBase
 
+    # columns of a unique default ordering (descending) that ``cursor`` can seek
+    # on; models without one only page with OFFSET
+    keyset: ClassVar[tuple[str, ...] | None] = None
+
+    # where ``count=capped`` stops counting
+    count_cap: ClassVar[int] = 10_000
+
+    # built from ``features`` when the subclass is defined, see QueryPlan
+    plan: ClassVar["QueryPlan | None"] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "features" in cls.__dict__:
+            cls.plan = QueryPlan(cls.features, cls.params_cls)
+
     def __init__(self, *, params_cls=None, **kwargs):
+        if params_cls is not None and params_cls is not self.params_cls:
+            # the plan only knows the fields of the default params class
+            self.plan = None
         params_cls = params_cls or self.params_cls
         try:
             self.params = params_cls(**kwargs)
@@ -47,3 +72,44 @@ class QueryFeature(ABC):
         schema -> the QueryModel instance; features read params and store state (e.g. _model) on it
         """
         pass
+
+    def compile(self, plan: "QueryPlan") -> Callable[[Select | None, "QueryModel"], Select]:
+        """
+        Resolve whatever does not depend on the request once, when ``plan`` is
+        built, and return the step the plan runs per query. Features that have
+        nothing to precompute simply run ``apply``.
+        """
+        return self.apply
+
+
+# one step of a QueryPlan: (query so far, schema) -> query
+PlanStep = Callable[[Select | None, QueryModel], Select]
+
+
+class QueryPlan:
+    """
+    The feature pipeline of a QueryModel, compiled once per class.
+
+    Features resolve their columns and the params they consume up front, so a
+    query only reads the values it needs from ``params``; values always end up
+    in bound parameters, which keeps the SQL text of a query shape constant
+    and lets SQLAlchemy's compiled cache and psycopg's prepared statements
+    serve it.
+    """
+
+    def __init__(self, features: list[QueryFeature], params_cls: type[BaseModel]):
+        self.params_cls = params_cls
+        self.param_names = list(params_cls.model_fields)
+        self.model: type[DeclarativeBase] | None = None
+
+        self.steps: list[PlanStep] = []
+        for feature in features:
+            if not isinstance(feature, QueryFeature):
+                raise TypeError(f"Feature {feature} is not a QueryFeature")
+            self.steps.append(feature.compile(self))
+
+    def build(self, schema: QueryModel) -> Select:
+        query = None
+        for step in self.steps:
+            query = step(query, schema)
+        return query
@@ -1,7 +1,11 @@
-from sqlalchemy import func, select
-
 from flux_watch_api.database.query_builder.base import QueryFeature
-from flux_watch_api.database.query_builder.processor import Pagination, Sorting
+from flux_watch_api.database.query_builder.processor import (
+    Counting,
+    InvalidCursorError,
+    Keyset,
+    Pagination,
+    Sorting,
+)
 
 
 class QueryBuilder:
@@ -13,8 +17,18 @@ class QueryBuilder:
         self.schema = schema_cls(**kwargs)
         self.sorting = Sorting()
         self.pagination = Pagination()
+        self.keyset = Keyset()
+        self.counting = Counting()
+
+    @property
+    def projected(self) -> bool:
+        """Whether ``fields`` narrowed the select, so rows are not model instances."""
+        return bool(getattr(self.schema.params, "fields", None))
 
     def _build_base(self):
+        if self.schema.plan is not None:
+            return self.schema.plan.build(self.schema)
+
         query = None
         for feature in self.schema.features:
             if not isinstance(feature, QueryFeature):
@@ -22,6 +36,11 @@ class QueryBuilder:
             query = feature.apply(query, self.schema)
         return query
 
+    def build_where(self):
+        """The combined WHERE criteria of the feature pipeline, for set-based
+        UPDATE / DELETE statements that target the same rows a select would."""
+        return self._build_base().whereclause
+
     def build(self, paginate: bool = True, sort: bool = True, with_counts: bool = False):
         base_query = self._build_base()
         model = self.schema.model
@@ -35,17 +54,30 @@ class QueryBuilder:
                 model=model,
                 params=params,
                 default_ordering=getattr(self.schema, "default_ordering", None),
+                expressions=getattr(self.schema, "order_expressions", None),
             )
 
+        seek = bool(getattr(params, self.keyset.param_name, None))
+        if seek:
+            keyset = getattr(self.schema, "keyset", None)
+            if not keyset or params.order:
+                raise InvalidCursorError("Cursors only page through the default order")
+            data_query = self.keyset.apply(data_query, model, params, keyset)
+
         if paginate:
             data_query = self.pagination.apply(
                 query=data_query,
                 params=params,
                 max_page_size=getattr(self.schema, "max_page_size", None),
+                seek=seek,
             )
 
         count_query = None
         if with_counts:
-            count_query = select(func.count()).select_from(base_query.subquery())
+            count_query = self.counting.apply(base_query, params, self.schema.count_cap)
 
         return data_query, count_query
+
+    def count_value(self, result):
+        """The total from what the count query of ``build`` returned."""
+        return self.counting.value(self.schema.params, result)
@@ -1,20 +1,56 @@
-from sqlalchemy import or_, select
+import json
+import math
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import cast, func, literal, not_, or_, select
+from sqlalchemy.dialects.postgresql import JSONPATH, REGCONFIG
 
 from flux_watch_api.database.query_builder.base import QueryFeature
+from flux_watch_api.schema.utils.promoted import PROMOTED_INFO_KEY
 
 
 class ModelFeature(QueryFeature):
     """
     Initializes the query with the ORM model and stores it on the schema
     so subsequent features can access it via schema.model.
+
+    With ``fields`` in the params only those columns are selected, and rows
+    come back as Row tuples instead of model instances.
     """
 
     def __init__(self, model):
         self.model = model
 
+    def project(self, fields: str):
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        columns = []
+        for name in dict.fromkeys(names):
+            if name not in self.model.__mapper__.column_attrs:
+                raise Exception(f"No column named {name} on model {self.model}")
+            columns.append(getattr(self.model, name))
+        if not columns:
+            raise Exception(f"No fields selected on model {self.model}")
+        return select(*columns)
+
     def apply(self, query, schema):
         schema.model = self.model
-        return select(self.model)
+        fields = getattr(schema.params, "fields", None)
+        return self.project(fields) if fields else select(self.model)
+
+    def compile(self, plan):
+        plan.model = self.model
+        # Select is immutable: every query can start from the same object
+        base = select(self.model)
+        # the field sets a listing asks for are few
+        project = lru_cache(maxsize=64)(self.project)
+
+        def step(query, schema):
+            schema.model = self.model
+            fields = getattr(schema.params, "fields", None)
+            return project(fields) if fields else base
+
+        return step
 
 
 class FilterFeature(QueryFeature):
@@ -38,26 +74,219 @@ class FilterFeature(QueryFeature):
         self.field = field
         self.param_prefix = param_prefix or field
 
+    def operator(self, key: str):
+        """The operator for param ``key``, or None when this filter ignores it."""
+        if not key.startswith(self.param_prefix):
+            return None
+        parts = key.split("__")
+        return self.OPERATORS.get(parts[1] if len(parts) > 1 else "eq")
+
+    def column(self, model):
+        column = getattr(model, self.field, None)
+        if column is None:
+            raise Exception(f"No column named {self.field} on model {model}")
+        return column
+
     def apply(self, query, schema):
-        model = schema.model
-        params = schema.params.model_dump(exclude_none=True)
+        column = self.column(schema.model)
+        for key, value in schema.params.model_dump(exclude_none=True).items():
+            operator = self.operator(key)
+            if operator:
+                query = query.where(operator(column, value))
+        return query
+
+    def compile(self, plan):
+        column = self.column(plan.model)
+        # the declared params this filter consumes, in declaration order
+        consumed = [
+            (name, operator) for name in plan.param_names if (operator := self.operator(name))
+        ]
+
+        def step(query, schema):
+            params = schema.params
+            for name, operator in consumed:
+                value = getattr(params, name)
+                if value is not None:
+                    query = query.where(operator(column, value))
+            for key, value in (params.model_extra or {}).items():
+                operator = self.operator(key)
+                if operator and value is not None:
+                    query = query.where(operator(column, value))
+            return query
+
+        return step
+
+
+class InvalidJsonFilterError(ValueError):
+    """A JSON filter value that no JSON document can hold."""
+
+
+def _not_json(constant: str):
+    raise ValueError(constant)
+
+
+def _json_scalar(value: Any) -> Any:
+    # query strings carry no types: 100 / true / null are read as JSON, anything
+    # else stays a string ("100" quoted forces the string; NaN and Infinity are
+    # not JSON and stay strings too)
+    if not isinstance(value, str):
+        return value
+    try:
+        parsed = json.loads(value, parse_constant=_not_json)
+    except ValueError:
+        return value
+    if isinstance(parsed, float) and not math.isfinite(parsed):
+        raise InvalidJsonFilterError(f"Number {value} is out of range")
+    return parsed if not isinstance(parsed, dict | list) else value
+
+
+def _fits(python_type: type, value: Any) -> bool:
+    """Whether a promoted column of ``python_type`` holds ``value`` exactly for
+    the JSON values that equal it, and only for those."""
+    if python_type is str:
+        # ->> renders numbers, booleans and objects as text as well; only a
+        # string that is not valid JSON itself cannot have come from one of them
+        if not isinstance(value, str):
+            return False
+        try:
+            json.loads(value)
+        except ValueError:
+            return True
+        return False
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def parse_json_filter(key: str, field: str) -> tuple[list[str], str]:
+    """``payload__order__total__gt`` -> (["order", "total"], "gt").
+
+    The last part is the operator when it is one, otherwise the filter is an eq.
+    """
+    parts = key.split("__")[1:]
+    op = "eq"
+    if len(parts) > 1 and parts[-1] in JsonFilterFeature.OPERATORS:
+        op = parts.pop()
+    if not parts or not all(parts):
+        raise ValueError(f"Invalid {field} filter '{key}': expected {field}__<key>[__<op>]")
+    return parts, op
 
+
+class JsonFilterFeature(QueryFeature):
+    """
+    Filters on keys inside a JSONB column, the path and operator separated by __:
+    ?payload__amount__gt=100, ?context__env=prod, ?payload__customer__tier__in=a,b,
+    ?context__trace_id__exists=true
+
+    Equality compiles to containment (``payload @> '{"customer": {"tier": "a"}}'``)
+    and everything else to a jsonpath predicate (``payload @? '$."amount" ? (@ > 100)'``);
+    both operators are served by a ``jsonb_path_ops`` GIN index on the column.
+
+    Keys promoted to generated columns (``promoted_column``) are filtered on the
+    column instead, so its btree index turns point lookups into index seeks.
+    """
+
+    COMPARISONS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+    OPERATORS = {"eq", "ne", "in", "exists", *COMPARISONS}
+
+    def __init__(self, field: str):
+        self.field = field
+
+    @staticmethod
+    def _nested(keys: list[str], value: Any) -> dict[str, Any]:
+        for key in reversed(keys):
+            value = {key: value}
+        return value
+
+    @classmethod
+    def promoted_condition(cls, column, op: str, value: Any):
+        """The filter on a promoted column, or None where it would not answer
+        exactly like the JSON condition, which is then used instead.
+
+        ``ne`` and ``exists`` are never rewritten: rows without the JSON column,
+        keys holding JSON null and (on numeric columns) non-numbers all leave
+        the column NULL. Text columns take string equality only, as ``->>``
+        compares every JSON type as text.
+        """
+        python_type = column.type.python_type
+        if op in ("ne", "exists") or (python_type is str and op in cls.COMPARISONS):
+            return None
+        values = (
+            [_json_scalar(v) for v in value.split(",")] if op == "in" else [_json_scalar(value)]
+        )
+        if not all(_fits(python_type, v) for v in values):
+            return None
+        if op == "in":
+            return column.in_(values)
+        if op == "eq":
+            return column == values[0]
+        return FilterFeature.OPERATORS[op](column, values[0])
+
+    def condition(self, column, keys: list[str], op: str, value: Any):
+        if op == "eq":
+            return column.contains(self._nested(keys, _json_scalar(value)))
+        if op == "ne":
+            return not_(column.contains(self._nested(keys, _json_scalar(value))))
+        if op == "in":
+            return or_(
+                *(column.contains(self._nested(keys, _json_scalar(v))) for v in value.split(","))
+            )
+
+        path = "$" + "".join(f".{json.dumps(key)}" for key in keys)
+        if op == "exists":
+            exists = column.path_exists(cast(path, JSONPATH))
+            return not_(exists) if _json_scalar(value) is False else exists
+        predicate = f"{path} ? (@ {self.COMPARISONS[op]} {json.dumps(_json_scalar(value))})"
+        return column.path_exists(cast(predicate, JSONPATH))
+
+    def column(self, model):
         column = getattr(model, self.field, None)
         if column is None:
             raise Exception(f"No column named {self.field} on model {model}")
+        return column
 
-        for key, value in params.items():
-            if not key.startswith(self.param_prefix):
+    def promoted(self, model) -> dict[str, Any]:
+        """``key -> column`` for the keys of this field promoted to columns."""
+        promoted = {}
+        for prop in model.__mapper__.column_attrs:
+            source = prop.columns[0].info.get(PROMOTED_INFO_KEY)
+            if source and source[0] == self.field:
+                promoted[source[1]] = getattr(model, prop.key)
+        return promoted
+
+    def filter(self, query, schema, column, promoted: dict[str, Any]):
+        prefix = f"{self.field}__"
+        for key, value in (schema.params.model_extra or {}).items():
+            if value is None or not key.startswith(prefix):
                 continue
+            keys, op = parse_json_filter(key, self.field)
+            condition = None
+            if len(keys) == 1 and keys[0] in promoted:
+                condition = self.promoted_condition(promoted[keys[0]], op, value)
+            if condition is None:
+                condition = self.condition(column, keys, op, value)
+            query = query.where(condition)
+        return query
 
-            parts = key.split("__")
-            op = parts[1] if len(parts) > 1 else "eq"
+    def apply(self, query, schema):
+        return self.filter(query, schema, self.column(schema.model), self.promoted(schema.model))
 
-            operator = self.OPERATORS.get(op)
-            if operator:
-                query = query.where(operator(column, value))
+    def compile(self, plan):
+        column, promoted = self.column(plan.model), self.promoted(plan.model)
+
+        def step(query, schema):
+            if not schema.params.model_extra:
+                return query
+            return self.filter(query, schema, column, promoted)
+
+        return step
+
+
+class InvalidSearchError(ValueError):
+    """A search term the search mode cannot serve."""
 
-        return query
+
+def _like_literal(value: str) -> str:
+    # backslash is the default LIKE escape character in PostgreSQL
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class SearchFeature(QueryFeature):
@@ -65,11 +294,36 @@ class SearchFeature(QueryFeature):
     Handles:
     ?search=harsh
     across multiple fields
+
+    ``mode="ilike"`` matches ``ILIKE '%harsh%'`` on text columns, which no btree
+    index can serve. ``mode="websearch"`` matches tsvector columns against
+    ``websearch_to_tsquery`` (quoted phrases, ``or``, ``-word``), served by a
+    GIN index, and adds a ``rank`` order (``?order=-rank``) by ``ts_rank_cd``.
+    ``mode="trigram"`` is a literal, case-insensitive substring match (``%``
+    and ``_`` match themselves) for columns with a ``gin_trgm_ops`` index.
+    pg_trgm cannot narrow terms shorter than a trigram, so those are refused
+    with InvalidSearchError instead of reading the whole index.
     """
 
-    def __init__(self, param_name: str, fields: list[str]):
+    ILIKE = "ilike"
+    WEBSEARCH = "websearch"
+    TRIGRAM = "trigram"
+
+    def __init__(
+        self,
+        param_name: str,
+        fields: list[str],
+        mode: str = ILIKE,
+        config: str = "simple",
+        min_length: int = 3,
+    ):
+        if mode not in (self.ILIKE, self.WEBSEARCH, self.TRIGRAM):
+            raise ValueError(f"Unsupported search mode '{mode}'")
         self.param_name = param_name
         self.fields = fields
+        self.mode = mode
+        self.config = config
+        self.min_length = min_length
 
     def apply(self, query, schema):
         model = schema.model
@@ -77,8 +331,24 @@ class SearchFeature(QueryFeature):
         if not value:
             return query
 
-        conditions = [
-            getattr(model, f).ilike(f"%{value}%") for f in self.fields if hasattr(model, f)
-        ]
+        columns = [getattr(model, f) for f in self.fields if hasattr(model, f)]
+        if not columns:
+            return query
+
+        if self.mode == self.WEBSEARCH:
+            vector = columns[0]
+            for column in columns[1:]:
+                vector = vector.op("||")(column)
+            tsquery = func.websearch_to_tsquery(literal(self.config, REGCONFIG), value)
+            schema.order_expressions = {"rank": func.ts_rank_cd(vector, tsquery)}
+            return query.where(vector.op("@@")(tsquery))
+
+        if self.mode == self.TRIGRAM:
+            if len(value) < self.min_length:
+                raise InvalidSearchError(
+                    f"{self.param_name} needs at least {self.min_length} characters"
+                )
+            pattern = f"%{_like_literal(value)}%"
+            return query.where(or_(*(column.ilike(pattern) for column in columns)))
 
-        return query.where(or_(*conditions)) if conditions else query
+        return query.where(or_(*(column.ilike(f"%{value}%") for column in columns)))
@@ -1,8 +1,51 @@
+import base64
+import json
+from collections.abc import Sequence
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(row: Any, columns: Sequence[str]) -> str:
+    """Opaque token for the position right after ``row`` in a keyset listing."""
+    values = [getattr(row, name) for name in columns]
+    raw = json.dumps([v.isoformat() if hasattr(v, "isoformat") else str(v) for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, columns: Sequence[Any]) -> list[Any]:
+    """The values ``encode_cursor`` stored, typed like ``columns``."""
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        if not isinstance(raw, list) or len(raw) != len(columns):
+            raise ValueError("wrong number of values")
+        values = []
+        for column, value in zip(columns, raw, strict=True):
+            python_type = column.type.python_type
+            if hasattr(python_type, "fromisoformat"):
+                values.append(python_type.fromisoformat(value))
+            else:
+                values.append(python_type(value))
+        return values
+    except (ValueError, TypeError) as err:
+        raise InvalidCursorError(f"Invalid cursor '{token}'") from err
+
+
 class Sorting:
     def __init__(self, param_name: str = "order"):
         self.param_name = param_name
 
-    def apply(self, query, model, params, default_ordering=None):
+    def apply(self, query, model, params, default_ordering=None, expressions=None):
+        """``expressions`` are orderable names besides the model columns, such
+        as a search rank."""
         raw = getattr(params, self.param_name, None)
 
         fields = raw.split(",") if raw else (default_ordering or [])
@@ -13,7 +56,7 @@ class Sorting:
             desc = field.startswith("-")
             name = field[1:] if desc else field
 
-            column = getattr(model, name, None)
+            column = (expressions or {}).get(name, getattr(model, name, None))
             if column is not None:
                 query = query.order_by(column.desc() if desc else column.asc())
 
@@ -25,12 +68,103 @@ class Pagination:
         self.page_param = page_param
         self.size_param = size_param
 
-    def apply(self, query, params, max_page_size=None):
-        page = getattr(params, self.page_param, 1)
+    def page_size(self, params, max_page_size=None) -> int:
         size = getattr(params, self.size_param, 20)
+        return min(size, max_page_size) if max_page_size else size
 
-        if max_page_size:
-            size = min(size, max_page_size)
+    def apply(self, query, params, max_page_size=None, seek: bool = False):
+        size = self.page_size(params, max_page_size)
+        if seek:
+            # a keyset seek already starts at the right row, page does not apply
+            return query.limit(size)
 
+        page = getattr(params, self.page_param, 1)
         offset = (page - 1) * size
         return query.offset(offset).limit(size)
+
+
+class Keyset:
+    """
+    Seek pagination over ``columns`` for listings ordered by them descending:
+    ``WHERE (occurred_at, id) < (:occurred_at, :id)`` continues right after the
+    row a cursor was taken from, so deep pages cost an index seek instead of
+    scanning and discarding everything before them. The last column has to
+    make the order unique.
+    """
+
+    def __init__(self, param_name: str = "cursor"):
+        self.param_name = param_name
+
+    def apply(self, query, model, params, columns: Sequence[str]):
+        token = getattr(params, self.param_name, None)
+        if not token:
+            return query
+        keys = [getattr(model, name) for name in columns]
+        return query.where(tuple_(*keys) < tuple_(*decode_cursor(token, keys)))
+
+
+class CountMode(StrEnum):
+    EXACT = "exact"
+    # the planner's row estimate, from EXPLAIN; free but can be far off
+    ESTIMATE = "estimate"
+    # exact up to QueryModel.count_cap, reported as the cap beyond it
+    CAPPED = "capped"
+    NONE = "none"
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <statement>``, with the statement's bound parameters."""
+
+    __visit_name__ = "explain"
+    # never cached (no traversal internals): on a compiled cache hit the
+    # result is adapted through the statement's selected columns, which an
+    # EXPLAIN does not have, and the repeat fails with NotImplementedError
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+class Counting:
+    """
+    The total of a listing, in the ``count`` mode its params ask for. A capped
+    count stops scanning after ``cap + 1`` rows; ``report`` turns that into
+    the cap and which mode the number actually came from.
+    """
+
+    def __init__(self, param_name: str = "count"):
+        self.param_name = param_name
+
+    def mode(self, params) -> CountMode:
+        return CountMode(getattr(params, self.param_name, None) or CountMode.EXACT)
+
+    def apply(self, query, params, cap: int):
+        mode = self.mode(params)
+        if mode is CountMode.NONE:
+            return None
+        if mode is CountMode.ESTIMATE:
+            return Explain(query)
+        if mode is CountMode.CAPPED:
+            query = query.limit(cap + 1)
+        return select(func.count()).select_from(query.subquery())
+
+    def value(self, params, result: Any) -> int:
+        """The count from the single value the count query returned."""
+        if self.mode(params) is CountMode.ESTIMATE:
+            plan = json.loads(result) if isinstance(result, str) else result
+            return int(plan[0]["Plan"]["Plan Rows"])
+        return result
+
+    @staticmethod
+    def report(mode: CountMode, total: int | None, cap: int) -> tuple[int | None, CountMode]:
+        if mode is CountMode.NONE:
+            return None, mode
+        if mode is CountMode.CAPPED:
+            # under the cap the number is exact
+            return (cap, mode) if total > cap else (total, CountMode.EXACT)
+        return total, mode
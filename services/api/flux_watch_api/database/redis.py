@@ -1,8 +1,9 @@
 import logging
 
 import redis
+import redis.asyncio
 
-from flux_watch_api.utils.constants import REDIS_BUFFER_SIZE, REDIS_STREAM_MAPPING
+from flux_watch_api.utils.constants import REDIS_STREAM_MAPPING
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +19,6 @@ class Redis:
         except redis.exceptions.ConnectionError:
             logger.error("Unable to connect to Redis server.")
 
-        self._buffer: list[tuple[str, dict]] = []
-
     def _ensure_consumer_groups(self):
         """Create all consumer groups on the stream if they don't already exist.
         Each group gets an independent cursor — adding a new group here means it
@@ -38,21 +37,51 @@ class Redis:
                     else:
                         raise
 
-    def publish(self, stream: str, fields: dict) -> None:
-        """Buffer a message and flush to the stream once the buffer is full."""
-        self._buffer.append((stream, fields))
-        if len(self._buffer) >= REDIS_BUFFER_SIZE:
-            self.flush()
-
-    def flush(self) -> None:
-        if not self._buffer:
-            return
-        pipe = self.client.pipeline()
-        for stream, fields in self._buffer:
-            pipe.xadd(stream, fields)
-        pipe.execute()
-        self._buffer.clear()
-
     def xadd(self, stream: str, fields: dict, maxlen: int | None = None) -> str:
         """Add a single message to a stream immediately. Returns the generated message ID."""
         return self.client.xadd(stream, fields, maxlen=maxlen, approximate=True)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncRedis:
+    """
+    asyncio client for the request path: the outbox relay's XADDs and the
+    caches. Consumer groups are created by the sync client at startup, so this
+    only needs the connection.
+    """
+
+    def __init__(self, redis_url):
+        logger.info("Creating async Redis client")
+        self.client = redis.asyncio.Redis.from_url(url=redis_url)
+
+    async def xadd(self, stream: str, fields: dict, maxlen: int | None = None) -> str:
+        """Add a single message to a stream immediately. Returns the generated message ID."""
+        return await self.client.xadd(stream, fields, maxlen=maxlen, approximate=True)
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def set_many(self, values: dict[str, str | bytes], ttl: int) -> None:
+        """SET every key with the same expiry in one pipeline round trip."""
+        if not values:
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+
+    async def incr_many(self, keys: list[str]) -> None:
+        """INCR every key in one pipeline round trip."""
+        if not keys:
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+            await pipe.execute()
+
+    async def close(self) -> None:
+        await self.client.aclose()
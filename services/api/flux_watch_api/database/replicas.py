@@ -0,0 +1,142 @@
+import logging
+from collections.abc import Iterator
+from itertools import count
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from flux_watch_api.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_PROBE = text("SELECT 1")
+
+
+class Replica:
+    """One read replica: its engine, session factory and health. The pool
+    gauges come with the engine (``db.pool.<name>.*``)."""
+
+    def __init__(self, name: str, engine: Any, session_local: Any):
+        self.name = name
+        self.engine = engine
+        self.session_local = session_local
+        self.down_since: float | None = None
+
+        metrics.register_gauge(f"db.{name}.healthy", lambda: float(self.down_since is None))
+
+
+class ReplicaPool:
+    """
+    Round-robin over read replicas.
+
+    A replica whose read fails is taken out of rotation for ``cooldown_s``;
+    after that it is probed with ``SELECT 1`` before it gets traffic again, so
+    a dead replica costs one failed read per cooldown instead of one per request.
+    """
+
+    def __init__(self, replicas: list[Replica], cooldown_s: int = 30):
+        self.replicas = replicas
+        self.cooldown = cooldown_s
+        self._turn = count()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def candidates(self) -> Iterator[tuple[Replica, bool]]:
+        """Replicas in round-robin order, each with whether it has to be probed
+        first; replicas still cooling down are skipped."""
+        if not self.replicas:
+            return
+        start = next(self._turn)
+        now = monotonic()
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            if replica.down_since is None:
+                yield replica, False
+            elif now - replica.down_since >= self.cooldown:
+                yield replica, True
+
+    def mark_down(self, replica: Replica) -> None:
+        if replica.down_since is None:
+            logger.warning(f"Read replica {replica.name} is down, reading from the primary")
+        replica.down_since = monotonic()
+        metrics.incr(f"db.{replica.name}.failures")
+
+    def mark_up(self, replica: Replica) -> None:
+        if replica.down_since is not None:
+            logger.info(f"Read replica {replica.name} is back")
+        replica.down_since = None
+
+    def probe(self, replica: Replica) -> bool:
+        try:
+            with replica.engine.connect() as conn:
+                conn.execute(_PROBE)
+        except DBAPIError:
+            self.mark_down(replica)
+            return False
+        self.mark_up(replica)
+        return True
+
+    async def aprobe(self, replica: Replica) -> bool:
+        try:
+            async with replica.engine.connect() as conn:
+                await conn.execute(_PROBE)
+        except DBAPIError:
+            self.mark_down(replica)
+            return False
+        self.mark_up(replica)
+        return True
+
+
+class ReadSessions:
+    """
+    The replica session of one request, opened on first use.
+
+    ``get`` returns None when reads have to go to the primary: no replicas are
+    configured, the request opted out, or every replica is down. After a
+    failed replica read the request stays on the primary.
+    """
+
+    def __init__(self, db: Any, enabled: bool = True):
+        self._db = db
+        self.enabled = enabled and db.has_replicas
+        self._session = None
+
+    def get(self):
+        if self.enabled and self._session is None:
+            self._session = self._db.replica_session()
+            self.enabled = self._session is not None
+        return self._session
+
+    def failed(self) -> None:
+        self._db.replicas.mark_down(self._session.info["replica"])
+        self.close()
+        self.enabled = False
+
+    def close(self) -> None:
+        # replica sessions only read; closing rolls the snapshot back
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class AsyncReadSessions(ReadSessions):
+    """asyncio counterpart of ReadSessions."""
+
+    async def get(self):
+        if self.enabled and self._session is None:
+            self._session = await self._db.replica_session()
+            self.enabled = self._session is not None
+        return self._session
+
+    async def failed(self) -> None:
+        self._db.replicas.mark_down(self._session.info["replica"])
+        await self.close()
+        self.enabled = False
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
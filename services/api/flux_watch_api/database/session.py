@@ -1,14 +1,41 @@
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Generator
+from contextlib import asynccontextmanager
 from enum import Enum
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy import create_engine, orm
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from flux_watch_api.core.config import get_env
 from flux_watch_api.core.registry import registry
+from flux_watch_api.database.pool_metrics import register_pool_gauges, timed_pool
+from flux_watch_api.database.replicas import AsyncReadSessions, ReadSessions, Replica, ReplicaPool
+from flux_watch_api.utils.constants import READ_FROM_HEADER, READ_FROM_PRIMARY
 
 logger = logging.getLogger(__name__)
 
+# session.info key of the callbacks run_after_commit awaits, by name
+AFTER_COMMIT = "after_commit"
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """Await the callbacks registered for ``session``'s last commit, for work
+    that must not happen before other sessions can see the rows."""
+    for callback in session.info.pop(AFTER_COMMIT, {}).values():
+        await callback()
+
+
+def _pool(name: str, size: int, overflow: int, timeout: int) -> dict:
+    # DB_POOL_<NAME>_SIZE / _OVERFLOW / _TIMEOUT override the defaults
+    return {
+        "pool_size": int(get_env(f"DB_POOL_{name}_SIZE", size)),
+        "max_overflow": int(get_env(f"DB_POOL_{name}_OVERFLOW", overflow)),
+        "pool_timeout": int(get_env(f"DB_POOL_{name}_TIMEOUT", timeout)),
+        "pool_recycle": 3600,
+    }
+
 
 class DatabaseConnectionConfig(Enum):
     API = {
@@ -17,15 +44,51 @@ class DatabaseConnectionConfig(Enum):
         "pool_timeout": 60,
         "pool_recycle": 3600,
     }
+    # one pool per workload so a burst of one cannot starve the others
+    AUTH = _pool("AUTH", size=5, overflow=5, timeout=10)
+    INGEST = _pool("INGEST", size=10, overflow=10, timeout=5)
+    QUERY = _pool("QUERY", size=10, overflow=5, timeout=30)
+    # SSE connections hold a session for the life of the stream
+    STREAM = _pool("STREAM", size=5, overflow=20, timeout=60)
+
+
+def _psycopg_url(url: str) -> str:
+    # Normalise the dialect to psycopg3 regardless of what the URL says
+    return url.replace("postgresql://", "postgresql+psycopg://", 1)
+
+
+def _engine(url: str, config: DatabaseConnectionConfig, name: str):
+    engine = create_engine(_psycopg_url(url), poolclass=timed_pool(QueuePool, name), **config.value)
+    register_pool_gauges(name, engine)
+    return engine
+
+
+def _async_engine(url: str, config: DatabaseConnectionConfig, name: str):
+    engine = create_async_engine(
+        _psycopg_url(url), poolclass=timed_pool(AsyncAdaptedQueuePool, name), **config.value
+    )
+    register_pool_gauges(name, engine)
+    return engine
 
 
 class Database:
-    def __init__(self, url: str, config: DatabaseConnectionConfig):
+    """
+    The primary engine plus optional read replicas. Replica sessions are only
+    handed out through ``replica_session``; everything else uses the primary.
+    The pool is reported as ``db.pool.<name>.*`` on /metrics.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        config: DatabaseConnectionConfig,
+        replica_urls: list[str] | None = None,
+        replica_cooldown_s: int = 30,
+        name: str = "primary",
+    ):
         logger.info("Initializing Postgres Engine.")
         try:
-            # Normalise the dialect to psycopg3 regardless of what the URL says
-            url = url.replace("postgresql://", "postgresql+psycopg://", 1)
-            self.engine = create_engine(url, **config.value)
+            self.engine = _engine(url, config, name)
             logger.info("Initialized Postgres Engine.")
         except Exception as e:
             logger.error("Failed to initialize Postgres Engine: " + str(e))
@@ -34,6 +97,27 @@ class Database:
             autocommit=False, autoflush=False, bind=self.engine, expire_on_commit=False
         )
 
+        replicas = []
+        for i, replica_url in enumerate(replica_urls or []):
+            engine = _engine(replica_url, config, f"{name}_replica{i}")
+            session_local = orm.sessionmaker(autoflush=False, bind=engine, expire_on_commit=False)
+            replicas.append(Replica(f"{name}_replica{i}", engine, session_local))
+        self.replicas = ReplicaPool(replicas, cooldown_s=replica_cooldown_s)
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    def replica_session(self) -> orm.Session | None:
+        """A session on the next healthy replica, or None to read from the primary."""
+        for replica, probe in self.replicas.candidates():
+            if probe and not self.replicas.probe(replica):
+                continue
+            session = replica.session_local()
+            session.info["replica"] = replica
+            return session
+        return None
+
     def get_session(self) -> Generator[orm.Session, None, None]:
         session = self.session_local()
         try:
@@ -46,6 +130,88 @@ class Database:
             session.close()
 
 
+class AsyncDatabase:
+    """
+    asyncio counterpart of Database. psycopg3 speaks asyncio natively, so the
+    same URL works for both; routes using it are bounded by the pool size
+    instead of by the threadpool.
+
+    Besides the default pool (``name``), ``pools`` adds named pools with their
+    own engine; ``session_scope(pool=...)`` picks one and unknown names fall
+    back to the default. Routes choose theirs with ``UsePool``.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        config: DatabaseConnectionConfig,
+        replica_urls: list[str] | None = None,
+        replica_cooldown_s: int = 30,
+        name: str = "primary",
+        pools: dict[str, DatabaseConnectionConfig] | None = None,
+    ):
+        logger.info("Initializing async Postgres Engine.")
+        try:
+            self.engine = _async_engine(url, config, name)
+            self.engines = {
+                pool: _async_engine(url, pool_config, pool)
+                for pool, pool_config in (pools or {}).items()
+            }
+            logger.info("Initialized async Postgres Engine.")
+        except Exception as e:
+            logger.error("Failed to initialize async Postgres Engine: " + str(e))
+
+        self.session_local = async_sessionmaker(
+            autoflush=False, bind=self.engine, expire_on_commit=False
+        )
+        self.session_locals = {
+            pool: async_sessionmaker(autoflush=False, bind=engine, expire_on_commit=False)
+            for pool, engine in self.engines.items()
+        }
+
+        replicas = []
+        for i, replica_url in enumerate(replica_urls or []):
+            engine = _async_engine(replica_url, config, f"{name}_replica{i}")
+            session_local = async_sessionmaker(autoflush=False, bind=engine, expire_on_commit=False)
+            replicas.append(Replica(f"{name}_replica{i}", engine, session_local))
+        self.replicas = ReplicaPool(replicas, cooldown_s=replica_cooldown_s)
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    async def replica_session(self) -> AsyncSession | None:
+        for replica, probe in self.replicas.candidates():
+            if probe and not await self.replicas.aprobe(replica):
+                continue
+            session = replica.session_local()
+            session.info["replica"] = replica
+            return session
+        return None
+
+    @asynccontextmanager
+    async def session_scope(self, pool: str | None = None) -> AsyncIterator[AsyncSession]:
+        """Session that commits on success and rolls back on error; used both for
+        request injection and by background workers."""
+        session = self.session_locals.get(pool, self.session_local)()
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise e
+        finally:
+            await session.close()
+        await run_after_commit(session)
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        for engine in self.engines.values():
+            await engine.dispose()
+        for replica in self.replicas.replicas:
+            await replica.engine.dispose()
+
+
 # hack
 def InjectSession():
     def _session():
@@ -53,3 +219,50 @@ def InjectSession():
         yield from db.get_session()
 
     return Depends(_session)
+
+
+def UsePool(name: str):
+    """Route / router dependency picking the AsyncDatabase pool for the request's
+    session; it has to run before the session is injected, which route and
+    router ``dependencies=[...]`` do."""
+
+    def _use_pool(request: Request):
+        request.state.db_pool = name
+
+    return Depends(_use_pool)
+
+
+def InjectAsyncSession():
+    async def _session(request: Request):
+        db = registry.resolve(AsyncDatabase)
+        async with db.session_scope(pool=getattr(request.state, "db_pool", None)) as session:
+            yield session
+
+    return Depends(_session)
+
+
+def _reads_enabled(request: Request) -> bool:
+    # per-request opt-out, e.g. a client that just wrote and reads it back
+    return request.headers.get(READ_FROM_HEADER, "").lower() != READ_FROM_PRIMARY
+
+
+def InjectReadSessions():
+    def _reads(request: Request):
+        reads = ReadSessions(registry.resolve(Database), enabled=_reads_enabled(request))
+        try:
+            yield reads
+        finally:
+            reads.close()
+
+    return Depends(_reads)
+
+
+def InjectAsyncReadSessions():
+    async def _reads(request: Request):
+        reads = AsyncReadSessions(registry.resolve(AsyncDatabase), enabled=_reads_enabled(request))
+        try:
+            yield reads
+        finally:
+            await reads.close()
+
+    return Depends(_reads)
@@ -2,6 +2,11 @@ from fastapi import HTTPException
 from starlette import status
 
 
+class BadRequestError(HTTPException):
+    def __init__(self, detail: str = "Bad request"):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
 class NotFoundError(HTTPException):
     def __init__(self, detail: str = "Record not found"):
         super().__init__(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
@@ -22,6 +27,24 @@ class TooManyRequestsError(HTTPException):
         super().__init__(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=detail)
 
 
+class PayloadTooLargeError(HTTPException):
+    def __init__(self, detail: str = "Request payload too large"):
+        super().__init__(status_code=status.HTTP_413_CONTENT_TOO_LARGE, detail=detail)
+
+
+class UnsupportedMediaTypeError(HTTPException):
+    def __init__(self, detail: str = "Unsupported media type"):
+        super().__init__(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=detail)
+
+
+class ServiceUnavailableError(HTTPException):
+    def __init__(self, detail: str = "Service unavailable", retry_after: int | None = None):
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail, headers=headers
+        )
+
+
 class ServerError(HTTPException):
     def __init__(self, detail: str = "An internal server error occurred"):
         super().__init__(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail)
@@ -6,7 +6,7 @@ from flux_watch_api.managers.auth.plugins.abstract import Plugin
 from flux_watch_api.managers.auth.plugins.builder import build_plugins
 from flux_watch_api.models.account import AccountSession, Sessions
 from flux_watch_api.models.auth import LogoutScope
-from flux_watch_api.models.common import AccountSearch
+from flux_watch_api.models.common import AccountSearch, SessionSearch
 from flux_watch_api.models.user import AuthUser
 from flux_watch_api.schema import AccountCredsORM, AccountORM, AccountSessionORM
 from flux_watch_api.utils.auth import AuthUtils
@@ -79,11 +79,7 @@ class AuthManager:
         if scope == LogoutScope.CURRENT:
             return self.repo.delete_one(session)
         else:
-            all_session = [
-                s for s in session.account.sessions if not s.expired
-            ]  # back population??
-            for session in all_session:
-                self.repo.delete_one(session)
+            self.repo.soft_delete_where(SessionSearch, account_id=session.account_id)
             return None
 
     def new_temp_session(
@@ -94,11 +90,10 @@ class AuthManager:
             auth_user, _ = self._build_auth_user(auth_header=auth_header)
 
         email = email if email else auth_user.principal
-        account: AccountORM = self.repo.get_one(AccountSearch, principal=email)
+        account: AccountORM = self.repo.get_one(AccountSearch, principal=email, use_primary=True)
 
         if delete_previous:
-            for session in account.sessions:
-                self.repo.delete_one(session)
+            self.repo.soft_delete_where(SessionSearch, account_id=account.id)
 
         temp_session = self.auth_utils.make_session(account=account, ttl_days=0.1)
         s = self.repo.add_one(temp_session)
@@ -120,15 +115,14 @@ class AuthManager:
         hashed_pass = self.auth_utils.hash_password(new_password)
 
         _account = self.repo.session_account
-        account = self.repo.get_one(AccountSearch, principal=_account.principal)
+        account = self.repo.get_one(AccountSearch, principal=_account.principal, use_primary=True)
 
         if self.auth_utils.validate_password(new_password, account.credentials.password_hash):
             raise AlreadyExistsError(detail="New password cannot be same as old password")
 
         account.credentials.password_hash = hashed_pass
 
-        for session in list(account.sessions):
-            self.repo.delete_one(session)
+        self.repo.soft_delete_where(SessionSearch, account_id=account.id)
 
         self.repo.add_one(account)
         return True
@@ -36,7 +36,8 @@ class KeyPlugin(Plugin):
     def authenticate(self, auth_user: AuthUser, **kwargs) -> AccountSessionORM:
         now = datetime.now(timezone.utc)
 
-        candidates, _ = self._handler.get_many(KeySearch, is_active=True)
+        # usage counters on the matched key are updated below
+        candidates, _ = self._handler.get_many(KeySearch, is_active=True, use_primary=True)
 
         key = None
         for key_obj in candidates:
@@ -22,8 +22,9 @@ class TokenPlugin(Plugin):
 
     def authenticate(self, auth_user: AuthUser, **kwargs) -> AccountSessionORM:
         try:
+            # authentication updates the account / session rows it loads
             account: AccountORM = self._handler.get_one(
-                AccountSearch, principal=auth_user.principal
+                AccountSearch, principal=auth_user.principal, use_primary=True
             )
         except NotFoundError as e:
             raise UnauthorizedError("Invalid credentials") from e
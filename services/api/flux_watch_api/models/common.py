@@ -1,6 +1,8 @@
+from uuid import UUID
+
 from flux_watch_api.database.query_builder.base import ParamsBase, QueryModel
 from flux_watch_api.database.query_builder.features import FilterFeature, ModelFeature
-from flux_watch_api.schema import AccountORM
+from flux_watch_api.schema import AccountORM, AccountSessionORM
 
 
 class AccountSearch(QueryModel):
@@ -13,3 +15,15 @@ class AccountSearch(QueryModel):
         ModelFeature(AccountORM),
         FilterFeature("principal"),
     ]
+
+
+class SessionSearch(QueryModel):
+    class Params(ParamsBase):
+        account_id: UUID
+
+    params: Params
+
+    features = [
+        ModelFeature(AccountSessionORM),
+        FilterFeature("account_id"),
+    ]
@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import Any, Literal
+from uuid import UUID
 
 from pydantic import Field, model_validator
 
@@ -41,6 +42,9 @@ class EventCreate(APIModel):
     actor: EventActor | None = None
     context: EventContext | None = None
     payload: dict[str, Any] = Field(default_factory=dict)
+    # retries carrying the same key and occurredAt (per account) return the first
+    # stored event; the same key with another occurredAt is stored as a new event
+    idempotency_key: str | None = Field(default=None, min_length=1, max_length=255)
 
     @model_validator(mode="after")
     def validate_event_type(self):
@@ -55,3 +59,58 @@ class EventCreate(APIModel):
 class Event(EventCreate, ResourceModel):
     event_version: int
     parent: str
+
+
+class PartialEvent(APIModel):
+    """An Event cut down to the ``fields=`` of a listing; fields that were not
+    asked for are left out of the response rather than sent as null."""
+
+    id: UUID | None = None
+    entity: EventEntity | None = None
+    event_type: str | None = None
+    event_version: int | None = None
+    occurred_at: datetime | None = None
+    producer: str | None = None
+    actor: EventActor | None = None
+    context: EventContext | None = None
+    payload: dict[str, Any] | None = None
+    parent: str | None = None
+    idempotency_key: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class EventIngestResult(APIModel):
+    index: int
+    id: UUID | None = None
+    error: str | None = None
+
+
+class BatchIngestResponse(APIModel):
+    accepted: int
+    rejected: int
+    results: list[EventIngestResult]
+
+
+class LineError(APIModel):
+    line: int
+    error: str
+
+
+class StreamIngestResponse(APIModel):
+    accepted: int
+    rejected: int
+    chunks: int
+    errors: list[LineError]
+    errors_truncated: bool = False
+
+
+class IngestAccepted(APIModel):
+    id: UUID
+
+
+class EventRef(APIModel):
+    """Minimal ingest response (``Prefer: return=minimal``)."""
+
+    id: UUID
+    occurred_at: datetime
@@ -1,12 +1,22 @@
+from datetime import datetime
+
 from fastapi import Query as Q
 from pydantic import BaseModel
 
+from flux_watch_api.database.query_builder.processor import CountMode
+
 
 class Query(BaseModel):
     page_size: int | None = Q(alias="pageSize", default=10)
     page: int | None = Q(default=1)
     search: str | None = Q(default=None)
     order: str | None = Q(default=None)
+    # meta.nextCursor of the previous page; replaces page when set
+    cursor: str | None = Q(default=None)
+    # how meta.totalCount is computed; exact gets expensive on large tenants
+    count: CountMode = Q(default=CountMode.EXACT)
+    # comma separated response fields, e.g. eventType,entity,occurredAt
+    fields: str | None = Q(default=None)
 
     def as_dict(self):
         return {
@@ -14,4 +24,39 @@ class Query(BaseModel):
             "page": self.page,
             "search": self.search,
             "order": self.order,
+            "cursor": self.cursor,
+            "count": self.count,
+            "fields": self.fields,
         }
+
+
+class EventsQuery(Query):
+    # half-open [since, until) range on occurred_at; lets Postgres skip partitions
+    occurred_since: datetime | None = Q(alias="since", default=None)
+    occurred_until: datetime | None = Q(alias="until", default=None)
+    # one type, or several comma separated
+    event_type: str | None = Q(alias="eventType", default=None)
+    entity_type: str | None = Q(alias="entityType", default=None)
+    entity_id: str | None = Q(alias="entityId", default=None)
+    # part of an entity id, at least 3 characters
+    entity_id_contains: str | None = Q(alias="entityIdContains", default=None)
+    producer: str | None = Q(default=None)
+    actor_id: str | None = Q(alias="actorId", default=None)
+
+    def as_dict(self):
+        return {
+            **super().as_dict(),
+            "occurred_at__gte": self.occurred_since,
+            "occurred_at__lt": self.occurred_until,
+            **self._event_type(),
+            "entity_type": self.entity_type,
+            "entity_id": self.entity_id,
+            "entity_id__contains": self.entity_id_contains,
+            "producer": self.producer,
+            "actor_id": self.actor_id,
+        }
+
+    def _event_type(self):
+        if self.event_type and "," in self.event_type:
+            return {"event_type__in": self.event_type}
+        return {"event_type": self.event_type}
@@ -1,5 +1,6 @@
 from typing import Generic, TypeVar
 
+from flux_watch_api.database.query_builder.processor import CountMode
 from flux_watch_api.models.base import APIModel
 
 T = TypeVar("T")
@@ -7,7 +8,11 @@ T = TypeVar("T")
 
 class Meta(APIModel):
     returned_count: int
-    total_count: int
+    # None with count=none; a lower bound when count_mode is capped
+    total_count: int | None
+    count_mode: CountMode = CountMode.EXACT
+    # pass as ?cursor= to fetch the page after this one; None on the last page
+    next_cursor: str | None = None
 
 
 class ListResponse(APIModel, Generic[T]):
@@ -27,7 +27,10 @@ class ApiKeysRepository:
         return acc.api_key
 
     def generate_new_key(self):
-        acc: AccountORM = self.repo.get_one(AccountSearch, principal=self.repo.principal)
+        # the account is modified below, so it has to come from the primary
+        acc: AccountORM = self.repo.get_one(
+            AccountSearch, principal=self.repo.principal, use_primary=True
+        )
 
         now = datetime.now(timezone.utc)
         expires_at = now + timedelta(days=self.repo.app_config.API_KEY_TTL_DAYS)
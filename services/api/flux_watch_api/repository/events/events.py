@@ -1,21 +1,123 @@
-from typing import cast
+import asyncio
+import hashlib
+import json
+import logging
+import math
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime
+from typing import Any, cast
+from uuid import uuid4
 
 from fastapi import Depends
+from pydantic import ConfigDict, ValidationError, field_validator, model_validator
+from redis.exceptions import RedisError
 
-from flux_watch_api.core.base_repository import Repository
+from flux_watch_api.core.base_repository import AsyncRepository
+from flux_watch_api.core.metrics import metrics
+from flux_watch_api.core.registry import registry
+from flux_watch_api.database.client import AsyncSQLClient
 from flux_watch_api.database.query_builder.base import ParamsBase, QueryModel
-from flux_watch_api.database.query_builder.features import FilterFeature, ModelFeature
-from flux_watch_api.models.events import Event, EventCreate
+from flux_watch_api.database.query_builder.features import (
+    FilterFeature,
+    InvalidJsonFilterError,
+    InvalidSearchError,
+    JsonFilterFeature,
+    ModelFeature,
+    SearchFeature,
+    parse_json_filter,
+)
+from flux_watch_api.database.query_builder.processor import (
+    Counting,
+    CountMode,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from flux_watch_api.database.session import AsyncDatabase
+from flux_watch_api.errors.rest_errors import BadRequestError, PayloadTooLargeError
+from flux_watch_api.models.base import to_camel
+from flux_watch_api.models.events import (
+    BatchIngestResponse,
+    Event,
+    EventCreate,
+    EventIngestResult,
+    EventRef,
+    IngestAccepted,
+    LineError,
+    PartialEvent,
+    StreamIngestResponse,
+)
 from flux_watch_api.models.response_schema import ListResponse, Meta
-from flux_watch_api.schema.events import EventORM
+from flux_watch_api.schema.events import (
+    EVENT_FIELD_COLUMNS,
+    IDEMPOTENCY_INDEX,
+    EventORM,
+    event_values,
+)
 from flux_watch_api.schema.utils.meta import MetaFields
-from flux_watch_api.utils.constants import REDIS_EVENT_PROCESSOR_KEY
+from flux_watch_api.schema.utils.search import SEARCH_CONFIG
+from flux_watch_api.services.archive import EventArchive
+from flux_watch_api.services.write_behind import WriteBehindQueue
+from flux_watch_api.utils.constants import (
+    COUNT_CACHE_PREFIX,
+    IDEMPOTENCY_CACHE_PREFIX,
+    LIST_CACHE_PREFIX,
+    LIST_VERSION_PREFIX,
+    REDIS_EVENT_PROCESSOR_KEY,
+)
+from flux_watch_api.utils.utilities import format_validation_error, to_naive_utc
+
+logger = logging.getLogger(__name__)
+
+
+_CONFLICT_COLUMNS = ("parent", "idempotency_key", "occurred_at")
+
+
+def _conflict_key(row: dict[str, Any]) -> tuple:
+    # occurred_at is stored naive, match it the way it comes back
+    return row["parent"], row["idempotency_key"], to_naive_utc(row["occurred_at"])
+
+
+def _idempotency_cache_key(parent: str, key: str, occurred_at: datetime) -> str:
+    # same identity as IDEMPOTENCY_INDEX: a key resent with another occurred_at
+    # is a new event for the cache too, not only once the entry expired
+    return f"{IDEMPOTENCY_CACHE_PREFIX}:{parent}:{key}:{to_naive_utc(occurred_at).isoformat()}"
+
+
+# JSONB columns filterable by key path, e.g. payload__amount__gt=100
+JSON_FILTER_FIELDS = ("payload", "context")
 
 
 class EventsSearch(QueryModel):
     class Params(ParamsBase):
+        # payload__* / context__* filters are open-ended, so they arrive as extras
+        model_config = ConfigDict(extra="allow")
+
         id: str | None = None
         parent: str | None = None
+        event_type: str | None = None
+        # comma separated
+        event_type__in: str | None = None
+        entity_type: str | None = None
+        entity_id: str | None = None
+        # substring of entity_id, e.g. part of an order id
+        entity_id__contains: str | None = None
+        producer: str | None = None
+        actor_id: str | None = None
+        # compared to the bare column so the planner can prune partitions
+        occurred_at__gte: datetime | None = None
+        occurred_at__lt: datetime | None = None
+
+        _naive_occurred_at = field_validator("occurred_at__gte", "occurred_at__lt")(to_naive_utc)
+
+        @model_validator(mode="after")
+        def _json_filters_only(self):
+            for key in self.model_extra or {}:
+                field = key.split("__", 1)[0]
+                if field not in JSON_FILTER_FIELDS:
+                    raise ValueError(f"Unknown filter '{key}'")
+                parse_json_filter(key, field)
+            return self
 
     params: Params
 
@@ -23,36 +125,656 @@ class EventsSearch(QueryModel):
         ModelFeature(EventORM),
         FilterFeature(field=MetaFields.ID),
         FilterFeature(field=MetaFields.PARENT),
+        FilterFeature(field="event_type"),
+        FilterFeature(field="entity_type"),
+        FilterFeature(field="entity_id"),
+        FilterFeature(field="producer"),
+        FilterFeature(field="actor_id"),
+        FilterFeature(field="occurred_at"),
+        *(JsonFilterFeature(field=field) for field in JSON_FILTER_FIELDS),
+        # ?search= is full-text over EventORM.search_vector; ?order=-rank ranks it
+        SearchFeature(
+            param_name="search",
+            fields=["search_vector"],
+            mode=SearchFeature.WEBSEARCH,
+            config=SEARCH_CONFIG,
+        ),
+        SearchFeature(
+            param_name="entity_id__contains", fields=["entity_id"], mode=SearchFeature.TRIGRAM
+        ),
     ]
 
-    default_ordering = ["-occurred_at"]
+    # id breaks occurred_at ties, which makes the order unique enough to seek on
+    default_ordering = ["-occurred_at", "-id"]
+    keyset = ("occurred_at", "id")
     max_page_size = 100
 
 
+def _page_size(kwargs: dict[str, Any]) -> int:
+    return min(kwargs.get("page_size") or 10, EventsSearch.max_page_size)
+
+
+# params that only shape the page of a listing, not which rows are in it
+_PAGING_PARAMS = ("page", "page_size", "order", "cursor", "count", "fields")
+
+# the column filters the Parquet archive can answer as well
+_ARCHIVE_FILTERS = ("event_type", "entity_type", "entity_id", "producer", "actor_id")
+
+# fields= accepts the response (camelCase) and the snake_case names
+_FIELD_NAMES = {
+    **{to_camel(f): f for f in EVENT_FIELD_COLUMNS},
+    **{f: f for f in EVENT_FIELD_COLUMNS},
+}
+
+
+def _event_fields(raw: str | None) -> list[str] | None:
+    if not raw:
+        return None
+    fields = []
+    for name in filter(None, (name.strip() for name in raw.split(","))):
+        if name not in _FIELD_NAMES:
+            raise BadRequestError(detail=f"Unknown field '{name}'")
+        fields.append(_FIELD_NAMES[name])
+    return list(dict.fromkeys(fields)) or None
+
+
+def _projection(fields: list[str] | None) -> str | None:
+    """The columns to select for ``fields``; the keyset columns are always
+    included so the page still yields a next cursor."""
+    if not fields:
+        return None
+    columns = {column for field in fields for column in EVENT_FIELD_COLUMNS[field]}
+    return ",".join(sorted(columns | set(EventsSearch.keyset)))
+
+
+def _archive_filters(kwargs: dict[str, Any]) -> dict[str, Any]:
+    filters = {name: kwargs.get(name) for name in _ARCHIVE_FILTERS}
+    if kwargs.get("event_type__in"):
+        filters["event_type__in"] = kwargs["event_type__in"].split(",")
+    filters["entity_id__contains"] = kwargs.get("entity_id__contains")
+    return filters
+
+
+def _to_result(row: Any, fields: list[str] | None) -> Event | PartialEvent:
+    return PartialEvent(**event_values(row, fields)) if fields else row.to_model()
+
+
+def _count_cache_key(parent: str, kwargs: dict[str, Any]) -> str:
+    filters = {k: v for k, v in kwargs.items() if k not in _PAGING_PARAMS and v is not None}
+    digest = hashlib.sha1(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{COUNT_CACHE_PREFIX}:{parent}:{digest}"
+
+
+def _list_cache_key(schema_cls: type[QueryModel], parent: str, kwargs: dict[str, Any]) -> str:
+    params = {k: v for k, v in kwargs.items() if v is not None}
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    return f"{LIST_CACHE_PREFIX}:{schema_cls.__name__}:{parent}:{digest}"
+
+
+def _list_version_key(parent: str) -> str:
+    return f"{LIST_VERSION_PREFIX}:{parent}"
+
+
+def _encode(response: ListResponse) -> bytes:
+    # what the route's response_model with response_model_exclude_unset produces
+    return response.model_dump_json(by_alias=True, exclude_unset=True).encode()
+
+
+def _list_cache_hit_ratio() -> float:
+    hits = metrics.counter("events.list_cache.hits")
+    lookups = hits + metrics.counter("events.list_cache.misses")
+    return hits / lookups if lookups else 0.0
+
+
+metrics.register_gauge("events.list_cache.hit_ratio", _list_cache_hit_ratio)
+
+
+def _cursor_after(kwargs: dict[str, Any]) -> list[Any] | None:
+    """The keyset values of the ``cursor`` param, for listings Postgres does not page."""
+    if not kwargs.get("cursor"):
+        return None
+    try:
+        return decode_cursor(
+            kwargs["cursor"], [getattr(EventORM, name) for name in EventsSearch.keyset]
+        )
+    except InvalidCursorError as err:
+        raise BadRequestError(detail=str(err)) from err
+
+
+def _next_cursor(events: list[EventORM], page_size: int) -> str | None:
+    # a short page is the last one
+    if not events or len(events) < page_size:
+        return None
+    return encode_cursor(events[-1], EventsSearch.keyset)
+
+
 class EventsRepository:
-    def __init__(self, repo: Repository = Depends()):
+    def __init__(self, repo: AsyncRepository = Depends()):
         self.repo = repo
+        self.ingest_queue: WriteBehindQueue = registry.resolve(WriteBehindQueue)
+        self.archive: EventArchive = registry.resolve(EventArchive)
+        # tenants whose cached list pages the current transaction makes stale
+        self._stale_lists: set[str] = set()
+        # idempotency cache entries to write once the current transaction commits
+        self._uncached_events: dict[str, str] = {}
+
+    async def ingest_event(self, event: EventCreate) -> Event:
+        if event.idempotency_key:
+            row = EventORM.values_from_model(event, parent=self.repo.principal)
+            (stored,) = await self._write_idempotent([row])
+            return stored if isinstance(stored, Event) else stored.to_model()
 
-    def ingest_event(self, event: EventCreate) -> Event:
         serialized_event = EventORM.from_model(event, parent=self.repo.session_account.principal)
-        result: EventORM = self.repo.add_one(serialized_event)
+        result: EventORM = await self.repo.add_one(serialized_event)
 
-        self.repo.publish(REDIS_EVENT_PROCESSOR_KEY, result.to_stream_message())
+        await self.repo.add_to_outbox(REDIS_EVENT_PROCESSOR_KEY, [result.to_stream_message()])
+        self._invalidate_lists([result.parent])
 
         return result.to_model()
 
-    def get_event_by_id(self, event_id: str) -> Event:
-        raw_event: EventORM = self.repo.get_one(
+    async def ingest_event_ref(self, event: EventCreate) -> EventRef:
+        """``ingest_event`` without the refresh SELECT and the ORM -> Event round
+        trip; only the id and occurred_at come back, through RETURNING."""
+        row = EventORM.values_from_model(event, parent=self.repo.principal)
+        if event.idempotency_key:
+            (stored,) = await self._write_idempotent([row])
+            return EventRef(id=stored.id, occurred_at=stored.occurred_at)
+
+        # the id is needed for the stream message before the insert returns
+        row["id"] = uuid4()
+        (ref,) = await self.repo.insert_returning(EventORM, [row], ("id", "occurred_at"))
+        await self.repo.add_to_outbox(
+            REDIS_EVENT_PROCESSOR_KEY, [EventORM(**row).to_stream_message()]
+        )
+        self._invalidate_lists([row["parent"]])
+        return EventRef(id=ref.id, occurred_at=ref.occurred_at)
+
+    async def enqueue_event(self, event: EventCreate) -> IngestAccepted:
+        """Hand the event to the write-behind queue; the id is assigned up front so
+        the caller gets it back before the row exists.
+
+        A keyed event is written here instead: only the dedupe can tell whether
+        the key was stored before, and with which id.
+        """
+        row = EventORM.values_from_model(event, parent=self.repo.principal)
+        if event.idempotency_key:
+            (stored,) = await self._write_idempotent([row])
+            return IngestAccepted(id=stored.id)
+        row["id"] = uuid4()
+        self.ingest_queue.submit(row)
+        return IngestAccepted(id=row["id"])
+
+    @staticmethod
+    async def flush_queued(rows: list[dict[str, Any]]) -> None:
+        """Flush callback of the write-behind queue; runs outside any request."""
+        db: AsyncDatabase = registry.resolve(AsyncDatabase)
+        async with db.session_scope(pool="ingest") as session:
+            # no request here, the rows already carry their parent
+            repo = AsyncRepository(request=None, client=AsyncSQLClient(session))
+            await EventsRepository(repo=repo)._write_rows(rows)
+
+    async def ingest_events(self, raw_events: list[dict[str, Any]]) -> BatchIngestResponse:
+        """Validate every item independently, then persist the valid ones with one
+        multi-row insert, plus one for their outbox stream messages."""
+        max_size = self.repo.app_config.INGEST_BATCH_MAX_SIZE
+        if len(raw_events) > max_size:
+            raise PayloadTooLargeError(detail=f"Batch exceeds the maximum of {max_size} events")
+
+        parent = self.repo.principal
+        results: list[EventIngestResult | None] = [None] * len(raw_events)
+        indexes: list[int] = []
+        rows: list[dict[str, Any]] = []
+
+        for index, raw in enumerate(raw_events):
+            try:
+                event = EventCreate.model_validate(raw)
+            except ValidationError as err:
+                results[index] = EventIngestResult(index=index, error=format_validation_error(err))
+                continue
+            indexes.append(index)
+            rows.append(EventORM.values_from_model(event, parent=parent))
+
+        inserted = await self._write_rows(rows)
+        for index, event in zip(indexes, inserted, strict=True):
+            results[index] = EventIngestResult(index=index, id=event.id)
+
+        return BatchIngestResponse(
+            accepted=len(inserted),
+            rejected=len(raw_events) - len(inserted),
+            results=results,
+        )
+
+    async def ingest_stream(
+        self, lines: AsyncIterator[tuple[int, bytes | None]]
+    ) -> StreamIngestResponse:
+        """Validate NDJSON lines as they arrive and commit them in fixed-size chunks.
+
+        Only one chunk of rows is held at a time. Malformed lines are collected
+        (up to a cap) and reported at the end; they never abort the chunks that
+        were already committed.
+        """
+        config = self.repo.app_config
+        parent = self.repo.principal
+
+        rows: list[dict[str, Any]] = []
+        errors: list[LineError] = []
+        accepted = rejected = chunks = 0
+
+        async for line_no, line in lines:
+            if line is None:
+                error = f"line exceeds {config.INGEST_STREAM_MAX_LINE_BYTES} bytes"
+            else:
+                try:
+                    event = EventCreate.model_validate_json(line)
+                except ValidationError as err:
+                    error = format_validation_error(err)
+                else:
+                    rows.append(EventORM.values_from_model(event, parent=parent))
+                    if len(rows) >= config.INGEST_STREAM_CHUNK_SIZE:
+                        accepted += await self._commit_chunk(rows)
+                        chunks += 1
+                        rows = []
+                    continue
+
+            rejected += 1
+            if len(errors) < config.INGEST_STREAM_MAX_REPORTED_ERRORS:
+                errors.append(LineError(line=line_no, error=error))
+
+        if rows:
+            accepted += await self._commit_chunk(rows)
+            chunks += 1
+
+        return StreamIngestResponse(
+            accepted=accepted,
+            rejected=rejected,
+            chunks=chunks,
+            errors=errors,
+            errors_truncated=rejected > len(errors),
+        )
+
+    async def _write_rows(self, rows: list[dict[str, Any]]) -> list[EventORM | Event]:
+        """Persist and publish ``rows``, returning one stored event per row.
+
+        Rows carrying an idempotency key go through the dedupe path; a retry
+        comes back as the event that was stored first, as ORM object or as the
+        ``Event`` cached in Redis.
+        """
+        keyed = [i for i, row in enumerate(rows) if row.get("idempotency_key")]
+        if not keyed:
+            return await self._insert_rows(rows)
+
+        results: list[EventORM | Event | None] = [None] * len(rows)
+        keyed_set = set(keyed)
+        plain = [i for i in range(len(rows)) if i not in keyed_set]
+        for i, event in zip(plain, await self._insert_rows([rows[i] for i in plain]), strict=True):
+            results[i] = event
+        stored = await self._write_idempotent([rows[i] for i in keyed])
+        for i, event in zip(keyed, stored, strict=True):
+            results[i] = event
+        return results
+
+    async def _insert_rows(self, rows: list[dict[str, Any]]) -> list[EventORM]:
+        if not rows:
+            return []
+        if len(rows) >= self.repo.app_config.INGEST_COPY_THRESHOLD:
+            # COPY fills the generated ids in on the row dicts, that is all the
+            # stream message and the per-item results need
+            await self.repo.copy_many(EventORM, rows)
+            inserted = [EventORM(**row) for row in rows]
+        else:
+            inserted = await self.repo.add_many(EventORM, rows)
+        await self.repo.add_to_outbox(
+            REDIS_EVENT_PROCESSOR_KEY, [event.to_stream_message() for event in inserted]
+        )
+        self._invalidate_lists(row["parent"] for row in rows)
+        return inserted
+
+    async def _write_idempotent(self, rows: list[dict[str, Any]]) -> list[EventORM | Event]:
+        """Recent keys are answered from Redis; the rest are inserted with
+        ON CONFLICT DO NOTHING and whatever did not insert is read back. Only
+        newly inserted events are published."""
+        results: list[EventORM | Event | None] = await self._cached_events(rows)
+        pending = [i for i, hit in enumerate(results) if hit is None]
+        metrics.incr("idempotency.cache_hits", len(rows) - len(pending))
+        if not pending:
+            return results
+
+        pending_rows = [rows[i] for i in pending]
+        for row in pending_rows:
+            # inserted rows come back unordered, the id is how they are matched
+            row["id"] = row.get("id") or uuid4()
+        inserted = await self.repo.add_many_skip_conflicts(
+            EventORM, pending_rows, IDEMPOTENCY_INDEX
+        )
+        by_id = {event.id: event for event in inserted}
+
+        missing = [_conflict_key(row) for row in pending_rows if row["id"] not in by_id]
+        existing = {}
+        if missing:
+            metrics.incr("idempotency.duplicates", len(missing))
+            for event in await self.repo.get_by_keys(EventORM, _CONFLICT_COLUMNS, missing):
+                existing[(event.parent, event.idempotency_key, event.occurred_at)] = event
+
+        for i, row in zip(pending, pending_rows, strict=True):
+            results[i] = by_id.get(row["id"]) or existing[_conflict_key(row)]
+
+        if inserted:
+            await self.repo.add_to_outbox(
+                REDIS_EVENT_PROCESSOR_KEY, [event.to_stream_message() for event in inserted]
+            )
+            self._invalidate_lists(event.parent for event in inserted)
+        self._cache_events([results[i] for i in pending])
+        return results
+
+    async def _cached_events(self, rows: list[dict[str, Any]]) -> list[Event | None]:
+        keys = [_idempotency_cache_key(*_conflict_key(row)) for row in rows]
+        try:
+            cached = await self.repo.cache_get_many(keys)
+        except RedisError:
+            # the cache only saves a round trip, the unique index is the real guard
+            logger.warning("Idempotency cache lookup failed, falling back to Postgres")
+            return [None] * len(rows)
+        return [Event.model_validate_json(value) if value else None for value in cached]
+
+    def _cache_events(self, events: list[EventORM]) -> None:
+        """Cache ``events`` under their keys once the transaction commits. Caching
+        earlier would answer a retry with an id that a rollback never stored."""
+        self._uncached_events.update(
+            (
+                _idempotency_cache_key(event.parent, event.idempotency_key, event.occurred_at),
+                event.to_model().model_dump_json(),
+            )
+            for event in events
+        )
+        self.repo.after_commit(IDEMPOTENCY_CACHE_PREFIX, self._write_cached_events)
+
+    async def _write_cached_events(self) -> None:
+        values, self._uncached_events = self._uncached_events, {}
+        try:
+            await self.repo.cache_set_many(
+                values, ttl=self.repo.app_config.IDEMPOTENCY_WINDOW_SECONDS
+            )
+        except RedisError:
+            logger.warning("Failed to cache idempotency keys")
+
+    def _invalidate_lists(self, parents: Iterable[str]) -> None:
+        """Bump the list version of ``parents`` once the transaction commits.
+        Bumping earlier would let a concurrent listing cache the rows from
+        before the commit under the new version. Cached counts are tagged with
+        the same version, so they need the bump as well."""
+        config = self.repo.app_config
+        if not (config.EVENTS_LIST_CACHE_TTL_S or config.EVENTS_COUNT_CACHE_TTL_S):
+            return
+        self._stale_lists.update(parents)
+        self.repo.after_commit(LIST_VERSION_PREFIX, self._bump_list_versions)
+
+    async def _bump_list_versions(self) -> None:
+        keys = [_list_version_key(parent) for parent in sorted(self._stale_lists)]
+        self._stale_lists.clear()
+        try:
+            await self.repo.cache_incr_many(keys)
+        except RedisError:
+            # pages and counts still expire after their TTLs
+            logger.warning("Failed to invalidate cached event listings")
+
+    async def _commit_chunk(self, rows: list[dict[str, Any]]) -> int:
+        inserted = await self._write_rows(rows)
+        await self.repo.explicit_commit()
+        return len(inserted)
+
+    async def get_event_by_id(self, event_id: str) -> Event:
+        raw_event: EventORM = await self.repo.get_one(
             EventsSearch, id=event_id, parent=self.repo.principal
         )
         return raw_event.to_model()
 
-    def get_all_events(self, **kwargs) -> ListResponse[Event]:
-        raw_events, total_count = cast(
-            tuple[list[EventORM], int],
-            self.repo.get_many(EventsSearch, parent=self.repo.principal, **kwargs),
+    async def get_all_events_json(self, **kwargs) -> bytes:
+        """
+        ``get_all_events`` as the encoded response body, cached in Redis.
+
+        Pages are keyed by tenant and params and tagged with the tenant's list
+        version, read in the same round trip before the query runs. An ingest
+        bumps the version after it commits, which turns every cached page of
+        the tenant into a miss. A hit skips Postgres and serialization.
+
+        A miss is read from a replica like any other listing. The replica's lag
+        is read first and bounds how long the page is cached: a lagging replica
+        may not have the rows the version already counts, and its page must not
+        outlive the lag by much.
+        """
+        ttl = self.repo.app_config.EVENTS_LIST_CACHE_TTL_S
+        if not ttl:
+            return _encode(await self.get_all_events(**kwargs))
+
+        parent = self.repo.principal
+        key = _list_cache_key(EventsSearch, parent, kwargs)
+        try:
+            version, cached = await self.repo.cache_get_many([_list_version_key(parent), key])
+        except RedisError:
+            logger.warning("List cache lookup failed, reading from Postgres")
+            return _encode(await self.get_all_events(**kwargs))
+
+        version = version or b"0"
+        if cached is not None:
+            tag, _, body = cached.partition(b":")
+            if tag == version:
+                metrics.incr("events.list_cache.hits")
+                return body
+        metrics.incr("events.list_cache.misses")
+
+        lag = await self.repo.read_lag()
+        metrics.observe("events.list_cache.fill_lag", lag)
+        body = _encode(await self.get_all_events(**kwargs))
+        if lag:
+            ttl = min(ttl, max(1, math.ceil(lag)))
+        try:
+            await self.repo.cache_set_many({key: version + b":" + body}, ttl=ttl)
+        except RedisError:
+            logger.warning("Failed to cache the events listing")
+        return body
+
+    async def get_all_events(self, **kwargs) -> ListResponse[Event | PartialEvent]:
+        if self.archive.covers(kwargs.get("occurred_at__lt")):
+            if any(key.startswith(JSON_FILTER_FIELDS) for key in kwargs):
+                raise BadRequestError(detail="JSON filters are not available on archived ranges")
+            if kwargs.get("search"):
+                raise BadRequestError(detail="Search is not available on archived ranges")
+            return await asyncio.to_thread(self._get_archived_events, **kwargs)
+        if self.archive.straddles(kwargs.get("occurred_at__gte"), kwargs.get("occurred_at__lt")):
+            return await self._get_straddling_events(**kwargs)
+
+        fields = _event_fields(kwargs.pop("fields", None))
+        count = CountMode(kwargs.pop("count", None) or CountMode.EXACT)
+        cache_key = cached = None
+        if count is CountMode.EXACT and self.repo.app_config.EVENTS_COUNT_CACHE_TTL_S:
+            cache_key = _count_cache_key(self.repo.principal, kwargs)
+            version, cached = await self._cached_count(cache_key)
+
+        try:
+            raw_events, total_count = cast(
+                tuple[list[EventORM], int | None],
+                await self.repo.get_many(
+                    EventsSearch,
+                    parent=self.repo.principal,
+                    count=CountMode.NONE if cached is not None else count,
+                    fields=_projection(fields),
+                    **kwargs,
+                ),
+            )
+        except (InvalidCursorError, InvalidSearchError, InvalidJsonFilterError) as err:
+            raise BadRequestError(detail=str(err)) from err
+
+        if cached is not None:
+            total_count = cached
+        elif cache_key is not None:
+            await self._cache_count(cache_key, version, total_count)
+        total_count, count = Counting.report(count, total_count, EventsSearch.count_cap)
+
+        # custom orders have no keyset to resume from
+        next_cursor = None if kwargs.get("order") else _next_cursor(raw_events, _page_size(kwargs))
+        return ListResponse(
+            meta=Meta(
+                total_count=total_count,
+                returned_count=len(raw_events),
+                count_mode=count,
+                next_cursor=next_cursor,
+            ),
+            results=[_to_result(event, fields) for event in raw_events],
+        )
+
+    async def _cached_count(self, key: str) -> tuple[bytes, int | None]:
+        """The tenant's list version and the count cached under ``key`` for
+        it. Counts are tagged with the version like cached pages, so an ingest
+        makes them stale at once rather than after the TTL."""
+        try:
+            version, value = await self.repo.cache_get_many(
+                [_list_version_key(self.repo.principal), key]
+            )
+        except RedisError:
+            logger.warning("Count cache lookup failed, counting in Postgres")
+            return b"", None
+        version = version or b"0"
+        if value is not None:
+            tag, _, total = value.partition(b":")
+            if tag == version:
+                return version, int(total)
+        return version, None
+
+    async def _cache_count(self, key: str, version: bytes, total: int) -> None:
+        if not version:
+            # the lookup failed, there is no version to tag the count with
+            return
+        try:
+            await self.repo.cache_set_many(
+                {key: version + b":" + str(total).encode()},
+                ttl=self.repo.app_config.EVENTS_COUNT_CACHE_TTL_S,
+            )
+        except RedisError:
+            logger.warning("Failed to cache the listing count")
+
+    async def _get_straddling_events(self, **kwargs) -> ListResponse[Event | PartialEvent]:
+        """``get_all_events`` for a range that starts in the archive and ends in
+        Postgres. Every hot event is newer than every archived one, so a page is
+        the Postgres events at its position followed by as many archived events
+        as it has room for. The archive is only read for rows when the hot events
+        leave room on the page, and only counted when the count mode needs it."""
+        watermark = self.archive.watermark()
+        if (
+            kwargs.get("search")
+            or kwargs.get("order")
+            or any(key.startswith(JSON_FILTER_FIELDS) for key in kwargs)
+        ):
+            raise BadRequestError(
+                detail=(
+                    "Search, JSON filters and custom orders are not available on archived "
+                    f"events; set occurred_at__gte to {watermark.isoformat()} or later"
+                )
+            )
+
+        count = CountMode(kwargs.get("count") or CountMode.EXACT)
+        page_size = _page_size(kwargs)
+        after = _cursor_after(kwargs)
+        # a cursor before the watermark is past every hot event
+        cold_after = after if after and to_naive_utc(after[0]) < watermark else None
+        offset = 0 if after else ((kwargs.get("page") or 1) - 1) * page_size
+        hot_kwargs = {**kwargs, "occurred_at__gte": watermark}
+
+        hot = None
+        if not (cold_after and count is CountMode.NONE):
+            hot = await self.get_all_events(
+                **{**hot_kwargs, "cursor": None if cold_after else kwargs.get("cursor")},
+            )
+        hot_results = [] if hot is None or cold_after else hot.results
+        hot_total = hot.meta.total_count if hot is not None else None
+        hot_mode = hot.meta.count_mode if hot is not None else count
+
+        cold: list[EventORM] = []
+        cold_total = None
+        parent = self.repo.principal
+        since = kwargs.get("occurred_at__gte")
+        filters = _archive_filters(kwargs)
+        room = page_size - len(hot_results)
+        if room > 0:
+            if hot_results or not offset:
+                # the hot events ran out on this page
+                cold_offset = 0
+            elif hot_mode is CountMode.EXACT:
+                cold_offset = offset - hot_total
+            else:
+                # paging by offset past the hot events needs their exact number
+                exact = await self.get_all_events(**{**hot_kwargs, "count": CountMode.EXACT})
+                cold_offset = offset - exact.meta.total_count
+            rows, cold_total = await asyncio.to_thread(
+                self.archive.list_events,
+                parent=parent,
+                since=since,
+                until=watermark,
+                filters=filters,
+                offset=max(cold_offset, 0),
+                limit=room,
+                after=cold_after,
+            )
+            cold = [EventORM(**row) for row in rows]
+        elif count is not CountMode.NONE and hot_mode is not CountMode.CAPPED:
+            # a capped hot count is already past the cap, the archive cannot lower it
+            cold_total = await asyncio.to_thread(
+                self.archive.count_events,
+                parent=parent,
+                since=since,
+                until=watermark,
+                filters=filters,
+                estimate=count is CountMode.ESTIMATE,
+            )
+
+        fields = _event_fields(kwargs.get("fields"))
+        results = [*hot_results, *(_to_result(event, fields) for event in cold)]
+        next_cursor = hot.meta.next_cursor if hot is not None and not cold_after else None
+        if cold:
+            next_cursor = (
+                encode_cursor(cold[-1], EventsSearch.keyset) if len(results) == page_size else None
+            )
+
+        total_count = None
+        if count is not CountMode.NONE:
+            total_count, count = (
+                (hot_total, hot_mode)
+                if hot_mode is CountMode.CAPPED
+                else Counting.report(count, hot_total + cold_total, EventsSearch.count_cap)
+            )
+        return ListResponse(
+            meta=Meta(
+                total_count=total_count,
+                returned_count=len(results),
+                count_mode=count,
+                next_cursor=next_cursor,
+            ),
+            results=results,
+        )
+
+    def _get_archived_events(self, **kwargs) -> ListResponse[Event | PartialEvent]:
+        """``get_all_events`` for a range that is older than the hot data; always
+        ordered newest first, like the default listing."""
+        page_size = _page_size(kwargs)
+        fields = _event_fields(kwargs.get("fields"))
+        after = _cursor_after(kwargs)
+        rows, total_count = self.archive.list_events(
+            parent=self.repo.principal,
+            since=kwargs.get("occurred_at__gte"),
+            until=kwargs.get("occurred_at__lt"),
+            filters=_archive_filters(kwargs),
+            offset=0 if after else ((kwargs.get("page") or 1) - 1) * page_size,
+            limit=page_size,
+            after=after,
         )
+        events = [EventORM(**row) for row in rows]
+        # the archive counts exactly as a side effect of paging
+        count = CountMode.NONE if kwargs.get("count") == CountMode.NONE else CountMode.EXACT
         return ListResponse(
-            meta=Meta(total_count=total_count, returned_count=len(raw_events)),
-            results=[event.to_model() for event in raw_events],
+            meta=Meta(
+                total_count=total_count if count is CountMode.EXACT else None,
+                returned_count=len(events),
+                count_mode=count,
+                next_cursor=_next_cursor(events, page_size),
+            ),
+            results=[_to_result(event, fields) for event in events],
         )
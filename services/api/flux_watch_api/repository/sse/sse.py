@@ -1,5 +1,6 @@
 import asyncio
 import hashlib
+import inspect
 import json
 import logging
 from collections.abc import Callable
@@ -30,7 +31,10 @@ class ServerSentEvents:
                 logger.debug("SSE request disconnected")
                 break
 
-            data = await asyncio.to_thread(fn, **args)
+            if inspect.iscoroutinefunction(fn):
+                data = await fn(**args)
+            else:
+                data = await asyncio.to_thread(fn, **args)
             data_json = json.dumps(data, sort_keys=True, default=str)
             current_hash = hashlib.sha256(data_json.encode()).hexdigest()
 
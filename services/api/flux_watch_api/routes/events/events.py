@@ -1,28 +1,128 @@
-from fastapi import APIRouter, Depends
+from typing import Any
+
+from fastapi import APIRouter, Body, Depends, Header, Request, Response
 from starlette import status
 
-from flux_watch_api.models.events import Event, EventCreate
-from flux_watch_api.models.query import Query
+from flux_watch_api.core.config import AppConfig
+from flux_watch_api.database.query_builder.features import parse_json_filter
+from flux_watch_api.database.session import UsePool
+from flux_watch_api.errors.rest_errors import BadRequestError, UnsupportedMediaTypeError
+from flux_watch_api.models.events import (
+    BatchIngestResponse,
+    Event,
+    EventCreate,
+    PartialEvent,
+    StreamIngestResponse,
+)
+from flux_watch_api.models.query import EventsQuery
 from flux_watch_api.models.response_schema import ListResponse
-from flux_watch_api.repository.events.events import EventsRepository
+from flux_watch_api.repository.events.events import JSON_FILTER_FIELDS, EventsRepository
+from flux_watch_api.utils.constants import (
+    NDJSON_MEDIA_TYPES,
+    PREFER_RESPOND_ASYNC,
+    PREFER_RETURN_MINIMAL,
+)
+from flux_watch_api.utils.utilities import iter_ndjson_lines, parse_prefer
 
 events_router = APIRouter()
 
 
-@events_router.post("/ingest", tags=["ingest"], status_code=status.HTTP_201_CREATED)
-def ingest(event: EventCreate, repo: EventsRepository = Depends()):
-    return repo.ingest_event(event)
+def json_filters(request: Request) -> dict[str, str]:
+    """``payload__…`` / ``context__…`` query parameters; the key paths are
+    free-form so they cannot be declared on EventsQuery."""
+    filters = {}
+    for key, value in request.query_params.items():
+        field = key.split("__", 1)[0]
+        if field not in JSON_FILTER_FIELDS or "__" not in key:
+            continue
+        try:
+            parse_json_filter(key, field)
+        except ValueError as err:
+            raise BadRequestError(detail=str(err)) from err
+        filters[key] = value
+    return filters
+
+
+@events_router.post(
+    "/ingest",
+    tags=["ingest"],
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[UsePool("ingest")],
+)
+async def ingest(
+    event: EventCreate,
+    response: Response,
+    prefer: str | None = Header(default=None),
+    repo: EventsRepository = Depends(),
+):
+    preferences = parse_prefer(prefer)
+    if PREFER_RESPOND_ASYNC in preferences:
+        response.status_code = status.HTTP_202_ACCEPTED
+        return await repo.enqueue_event(event)
+    if PREFER_RETURN_MINIMAL in preferences:
+        response.headers["Preference-Applied"] = PREFER_RETURN_MINIMAL
+        return await repo.ingest_event_ref(event)
+    return await repo.ingest_event(event)
+
+
+@events_router.post(
+    "/ingest/batch",
+    tags=["ingest"],
+    status_code=status.HTTP_200_OK,
+    dependencies=[UsePool("ingest")],
+    response_model=BatchIngestResponse,
+)
+async def ingest_batch(
+    events: list[dict[str, Any]] = Body(...), repo: EventsRepository = Depends()
+):
+    # items are validated one by one in the repository so a single bad event
+    # is reported back instead of rejecting the whole batch with a 422
+    return await repo.ingest_events(events)
+
+
+@events_router.post(
+    "/ingest/stream",
+    tags=["ingest"],
+    status_code=status.HTTP_200_OK,
+    dependencies=[UsePool("ingest")],
+    response_model=StreamIngestResponse,
+)
+async def ingest_stream(
+    request: Request, repo: EventsRepository = Depends(), config: AppConfig = Depends()
+):
+    content_type = request.headers.get("Content-Type", "").split(";", 1)[0].strip()
+    if content_type not in NDJSON_MEDIA_TYPES:
+        raise UnsupportedMediaTypeError(detail="Expected an application/x-ndjson body")
+
+    lines = iter_ndjson_lines(request.stream(), max_line_bytes=config.INGEST_STREAM_MAX_LINE_BYTES)
+    return await repo.ingest_stream(lines)
 
 
 @events_router.get(
-    "/{event_id}", tags=["events"], status_code=status.HTTP_200_OK, response_model=Event
+    "/{event_id}",
+    tags=["events"],
+    status_code=status.HTTP_200_OK,
+    response_model=Event,
+    dependencies=[UsePool("query")],
 )
-def get_event(event_id: str, repo: EventsRepository = Depends()):
-    return repo.get_event_by_id(event_id)
+async def get_event(event_id: str, repo: EventsRepository = Depends()):
+    return await repo.get_event_by_id(event_id)
 
 
 @events_router.get(
-    "", tags=["events"], status_code=status.HTTP_200_OK, response_model=ListResponse[Event]
+    "",
+    tags=["events"],
+    status_code=status.HTTP_200_OK,
+    response_model=ListResponse[Event | PartialEvent],
+    # keeps the fields a fields= listing left out from coming back as null
+    response_model_exclude_unset=True,
+    dependencies=[UsePool("query")],
 )
-def get_events(query_params: Query = Depends(), repo: EventsRepository = Depends()):
-    return repo.get_all_events(**query_params.as_dict())
+async def get_events(
+    query_params: EventsQuery = Depends(),
+    filters: dict[str, str] = Depends(json_filters),
+    repo: EventsRepository = Depends(),
+):
+    # already encoded (and possibly cached); response_model only documents it
+    body = await repo.get_all_events_json(**query_params.as_dict(), **filters)
+    return Response(content=body, media_type="application/json")
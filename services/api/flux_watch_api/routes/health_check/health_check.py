@@ -4,6 +4,7 @@ from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
+from flux_watch_api.core.metrics import metrics
 from flux_watch_api.core.registry import registry
 from flux_watch_api.database.redis import Redis
 from flux_watch_api.database.session import Database
@@ -39,3 +40,8 @@ def health_check():
         status_code=200 if all_ok else 503,
         content={"status": "ok" if all_ok else "degraded", "checks": checks},
     )
+
+
+@health_check_router.get("/metrics")
+def get_metrics():
+    return metrics.snapshot()
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 
+from flux_watch_api.database.session import UsePool
 from flux_watch_api.routes.sse.events.events import sse_events_router
 
-sse_router = APIRouter()
+# SSE polls hold their session for the whole stream; keep them off the query pool
+sse_router = APIRouter(dependencies=[UsePool("stream")])
 
 sse_router.include_router(router=sse_events_router, prefix="/events", tags=["events"])
@@ -4,4 +4,5 @@ from flux_watch_api.schema.account_creds import AccountCredsORM
 from flux_watch_api.schema.account_keys import AccountApiKeyORM
 from flux_watch_api.schema.alerts import AlertORM
 from flux_watch_api.schema.events import EventORM
+from flux_watch_api.schema.outbox import OutboxORM
 from flux_watch_api.schema.session import AccountSessionORM
@@ -1,18 +1,95 @@
 import json
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import DateTime, Integer, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import DateTime, Double, Index, Integer, PrimaryKeyConstraint, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, TEXT
 from sqlalchemy.orm import Mapped, mapped_column
 
 from flux_watch_api.models.events import Event, EventActor, EventContext, EventEntity
 from flux_watch_api.schema.mixins.parent_mixin import ParentMixin
 from flux_watch_api.schema.utils.base import Base
+from flux_watch_api.schema.utils.meta import MetaFields
+from flux_watch_api.schema.utils.promoted import promoted_column
+from flux_watch_api.schema.utils.search import search_vector_column
+
+# retries of the same event collapse onto one row; keys are only unique per account.
+# Unique indexes on a partitioned table must contain the partition key, so a
+# retry has to resend the same occurred_at to be recognised here.
+IDEMPOTENCY_INDEX = Index(
+    "uq_events_parent_idempotency_key",
+    "parent",
+    "idempotency_key",
+    "occurred_at",
+    unique=True,
+    postgresql_where=text("idempotency_key IS NOT NULL"),
+)
+
+
+# Event field -> the columns it is built from; a fields= listing selects only these
+EVENT_FIELD_COLUMNS: dict[str, tuple[str, ...]] = {
+    "id": ("id",),
+    "entity": ("entity_type", "entity_id"),
+    "event_type": ("event_type",),
+    "event_version": ("event_version",),
+    "occurred_at": ("occurred_at",),
+    "producer": ("producer",),
+    "actor": ("actor_type", "actor_id"),
+    "context": ("context",),
+    "payload": ("payload",),
+    "parent": ("parent",),
+    "idempotency_key": ("idempotency_key",),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+}
+
+# fields that are not a single column as is
+_FIELD_VALUES = {
+    "entity": lambda row: EventEntity(type=row.entity_type, id=row.entity_id),
+    "actor": lambda row: (
+        EventActor(type=row.actor_type, id=row.actor_id) if row.actor_type or row.actor_id else None
+    ),
+    "context": lambda row: EventContext(**row.context) if row.context else None,
+    "payload": lambda row: row.payload or {},
+}
+
+
+def event_values(row: Any, fields: Iterable[str]) -> dict[str, Any]:
+    """Event values for ``fields`` from ``row``: an EventORM, or a projected row
+    that has at least the columns of those fields."""
+    return {
+        field: _FIELD_VALUES[field](row) if field in _FIELD_VALUES else getattr(row, field)
+        for field in fields
+    }
+
+
+# payload keys whose text is searchable; changing this needs a migration that
+# redefines events.search_vector
+SEARCH_PAYLOAD_KEYS = ("message", "name", "title", "description", "status", "error")
+
+# what ?search= matches, by weight: the event type (also split at dots, so
+# "cancelled" finds order.cancelled) ranks above the entity and producer, and
+# those above payload text
+SEARCH_VECTOR_PARTS = {
+    "A": ["event_type", "translate(event_type, '._', '  ')"],
+    "B": ["entity_id", "producer"],
+    "C": [f"coalesce(payload ->> '{key}', '')" for key in SEARCH_PAYLOAD_KEYS],
+}
 
 
 class EventORM(Base, ParentMixin):
     __tablename__ = "events"
+    __table_args__ = (
+        # occurred_at is the partition key, so it has to be part of the primary key
+        PrimaryKeyConstraint("id", "occurred_at", name="events_pkey"),
+        IDEMPOTENCY_INDEX,
+        # partitions are created and dropped by database.partitions.PartitionManager
+        {"postgresql_partition_by": "RANGE (occurred_at)"},
+    )
+
+    # no single-column index: every index below leads with parent
+    parent: Mapped[str] = mapped_column(MetaFields.PARENT, TEXT, nullable=False)
 
     entity_type: Mapped[str] = mapped_column(Text, nullable=False)
     entity_id: Mapped[str] = mapped_column(Text, nullable=False)
@@ -20,7 +97,7 @@ class EventORM(Base, ParentMixin):
     event_type: Mapped[str] = mapped_column(Text, nullable=False)
     event_version: Mapped[int] = mapped_column(Integer, default=1)
 
-    occurred_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True, nullable=False)
     producer: Mapped[str] = mapped_column(Text, nullable=False)
 
     actor_type: Mapped[str | None] = mapped_column(Text)
@@ -29,23 +106,19 @@ class EventORM(Base, ParentMixin):
     context: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
     payload: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
 
+    idempotency_key: Mapped[str | None] = mapped_column(Text)
+
+    # promoted JSON keys: generated from context / payload, never written directly
+    context_trace_id: Mapped[str | None] = promoted_column("context", "trace_id")
+    context_session_id: Mapped[str | None] = promoted_column("context", "session_id")
+    context_source: Mapped[str | None] = promoted_column("context", "source")
+    payload_latency_ms: Mapped[float | None] = promoted_column("payload", "latency_ms", Double)
+
+    # full-text search over what identifies an event, see SEARCH_VECTOR_PARTS
+    search_vector: Mapped[Any] = search_vector_column(SEARCH_VECTOR_PARTS)
+
     def to_model(self):
-        return Event(
-            id=self.id,
-            entity=EventEntity(type=self.entity_type, id=self.entity_id),  # type: ignore[arg-type]
-            event_type=self.event_type,
-            event_version=self.event_version,
-            occurred_at=self.occurred_at,
-            producer=self.producer,
-            actor=EventActor(type=self.actor_type, id=self.actor_id)
-            if self.actor_type or self.actor_id
-            else None,
-            context=EventContext(**self.context) if self.context else None,
-            payload=self.payload or {},
-            parent=self.parent,
-            created_at=self.created_at,
-            updated_at=self.updated_at,
-        )
+        return Event(**event_values(self, EVENT_FIELD_COLUMNS))
 
     def to_stream_message(self) -> dict[str, str]:
         """Serialize to a flat string dict for publishing to a Redis stream."""
@@ -64,18 +137,103 @@ class EventORM(Base, ParentMixin):
             "parent": self.parent,
         }
 
+    @classmethod
+    def values_from_model(cls, event: Any, parent: str) -> dict[str, Any]:
+        """Column values for an insert, shared by single-row and bulk writes."""
+        return {
+            "entity_type": event.entity.type,
+            "entity_id": event.entity.id,
+            "event_type": event.event_type,
+            "event_version": 1,
+            "occurred_at": event.occurred_at,
+            "producer": event.producer,
+            "actor_type": event.actor.type if event.actor else None,
+            "actor_id": event.actor.id if event.actor else None,
+            "context": event.context.model_dump() if event.context else None,
+            "payload": event.payload,
+            "parent": parent,
+            "idempotency_key": event.idempotency_key,
+        }
+
     @classmethod
     def from_model(cls, event: Any, parent: str) -> "EventORM":
-        return cls(
-            entity_type=event.entity.type,
-            entity_id=event.entity.id,
-            event_type=event.event_type,
-            event_version=1,
-            occurred_at=event.occurred_at,
-            producer=event.producer,
-            actor_type=event.actor.type if event.actor else None,
-            actor_id=event.actor.id if event.actor else None,
-            context=event.context.model_dump() if event.context else None,
-            payload=event.payload,
-            parent=parent,
-        )
+        return cls(**cls.values_from_model(event, parent=parent))
+
+
+# listing indexes, matching EventsSearch filters and its default -occurred_at, -id
+# order; the first one also serves the (occurred_at, id) < (...) cursor seek
+Index(
+    "ix_events_parent_occurred_at_id_desc",
+    EventORM.parent,
+    EventORM.occurred_at.desc(),
+    EventORM.id.desc(),
+)
+Index(
+    "ix_events_parent_event_type_occurred_at",
+    EventORM.parent,
+    EventORM.event_type,
+    EventORM.occurred_at,
+)
+Index(
+    "ix_events_parent_entity_occurred_at",
+    EventORM.parent,
+    EventORM.entity_type,
+    EventORM.entity_id,
+    EventORM.occurred_at,
+)
+Index(
+    "ix_events_parent_producer_occurred_at",
+    EventORM.parent,
+    EventORM.producer,
+    EventORM.occurred_at,
+)
+# most events have no actor; an actor_id filter implies IS NOT NULL
+Index(
+    "ix_events_parent_actor_id_occurred_at",
+    EventORM.parent,
+    EventORM.actor_id,
+    EventORM.occurred_at,
+    postgresql_where=EventORM.actor_id.isnot(None),
+)
+
+Index("ix_events_search_vector", EventORM.search_vector, postgresql_using="gin")
+
+# entity_id__contains is a substring match: trigrams, not btree (pg_trgm)
+Index(
+    "ix_events_entity_id_trgm",
+    EventORM.entity_id,
+    postgresql_using="gin",
+    postgresql_ops={"entity_id": "gin_trgm_ops"},
+)
+
+# JsonFilterFeature compiles payload__* / context__* filters to @> and @?, the
+# two operators jsonb_path_ops supports; smaller and faster than the default
+# jsonb_ops, which also covers key-existence operators we never emit
+Index(
+    "ix_events_payload_path",
+    EventORM.payload,
+    postgresql_using="gin",
+    postgresql_ops={"payload": "jsonb_path_ops"},
+)
+Index(
+    "ix_events_context_path",
+    EventORM.context,
+    postgresql_using="gin",
+    postgresql_ops={"context": "jsonb_path_ops"},
+)
+
+# point lookups on the promoted keys; partial so events without the key cost nothing
+for _column in (
+    EventORM.context_trace_id,
+    EventORM.context_session_id,
+    EventORM.context_source,
+    EventORM.payload_latency_ms,
+):
+    Index(
+        f"ix_events_parent_{_column.key}",
+        EventORM.parent,
+        _column,
+        postgresql_where=_column.isnot(None),
+    )
+
+del _column
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from flux_watch_api.schema.utils.base import Base
+
+
+class OutboxORM(Base):
+    """
+    Stream messages written in the same transaction as the rows they describe.
+
+    The OutboxRelay moves them to Redis after commit, so a rolled back request
+    never publishes and a crash never loses a committed message.
+    """
+
+    __tablename__ = "stream_outbox"
+    __table_args__ = (
+        # the relay only ever scans unsent rows in insertion order
+        Index("ix_stream_outbox_pending", "seq", postgresql_where=text("sent_at IS NULL")),
+    )
+
+    seq: Mapped[int] = mapped_column(BigInteger, Identity(always=True), nullable=False)
+    stream: Mapped[str] = mapped_column(Text, nullable=False)
+    fields: Mapped[dict[str, str]] = mapped_column(JSONB, nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
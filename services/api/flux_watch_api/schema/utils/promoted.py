@@ -0,0 +1,30 @@
+from typing import Any
+
+from sqlalchemy import Computed, Double, Text
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.types import TypeEngine
+
+PROMOTED_INFO_KEY = "promoted_from"
+
+
+def promoted_column(source: str, key: str, type_: type[TypeEngine] = Text) -> Any:
+    """
+    A STORED generated column holding the top-level ``key`` of the JSONB column
+    ``source``, so a hot key can get a plain btree index.
+
+    JsonFilterFeature finds these through ``Column.info`` and rewrites
+    ``<source>__<key>`` filters to the column. Numeric columns are NULL when the
+    JSON value is not a number, so a stray string never fails an insert.
+    """
+    if type_ is Text:
+        expression = f"({source} ->> '{key}')"
+    elif type_ is Double:
+        expression = (
+            f"CASE WHEN jsonb_typeof({source} -> '{key}') = 'number' "
+            f"THEN ({source} ->> '{key}')::double precision END"
+        )
+    else:
+        raise TypeError(f"Cannot promote a JSON key to {type_.__name__}")
+    return mapped_column(
+        type_, Computed(expression, persisted=True), info={PROMOTED_INFO_KEY: (source, key)}
+    )
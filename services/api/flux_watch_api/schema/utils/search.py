@@ -0,0 +1,34 @@
+from typing import Any
+
+from sqlalchemy import Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import mapped_column
+
+# text search configuration of search vectors and the queries against them;
+# "simple" only lowercases, identifiers like order.created are not stemmed
+SEARCH_CONFIG = "simple"
+
+
+def search_vector_expression(weighted: dict[str, list[str]]) -> str:
+    """SQL for a tsvector over text expressions grouped by weight (A-D).
+
+    Every part must be a NOT NULL text expression: ``||`` with a NULL would
+    blank the whole group.
+    """
+    groups = []
+    for weight, parts in weighted.items():
+        text = " || ' ' || ".join(parts)
+        groups.append(f"setweight(to_tsvector('{SEARCH_CONFIG}', {text}), '{weight}')")
+    return " || ".join(groups)
+
+
+def search_vector_column(weighted: dict[str, list[str]]) -> Any:
+    """
+    A STORED generated tsvector column for SearchFeature's websearch mode, to
+    be indexed with GIN.
+
+    Deferred: listings never load it, it only appears in WHERE / ORDER BY.
+    """
+    return mapped_column(
+        TSVECTOR, Computed(search_vector_expression(weighted), persisted=True), deferred=True
+    )
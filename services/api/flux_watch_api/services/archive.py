@@ -0,0 +1,278 @@
+"""
+Parquet cold storage for events that aged out of Postgres.
+
+Files are laid out hive style, one directory per tenant and day::
+
+    <root>/parent=<quoted parent>/day=YYYY-MM-DD/<source partition>.parquet
+
+so a tenant's time range maps to a handful of directories. ``_watermark``
+in the root holds the upper bound of everything archived so far; readers use
+it to decide whether a time range still lives in Postgres.
+
+pyarrow comes with the ``archive`` extra (``poetry install --extras archive``);
+without it, or without ``EVENTS_ARCHIVE_DIR``, the archive reports itself
+disabled.
+"""
+
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from flux_watch_api.utils.utilities import to_naive_utc
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pa = pc = ds = pq = None
+
+logger = logging.getLogger(__name__)
+
+# columns stored as JSON text; Parquet has no type for free-form objects
+_JSON_COLUMNS = ("context", "payload")
+
+
+def _schema():
+    return pa.schema(
+        [
+            ("id", pa.string()),
+            ("parent", pa.string()),
+            ("entity_type", pa.string()),
+            ("entity_id", pa.string()),
+            ("event_type", pa.string()),
+            ("event_version", pa.int32()),
+            ("occurred_at", pa.timestamp("us")),
+            ("producer", pa.string()),
+            ("actor_type", pa.string()),
+            ("actor_id", pa.string()),
+            ("context", pa.string()),
+            ("payload", pa.string()),
+            ("idempotency_key", pa.string()),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("updated_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+
+
+def _to_record(row: Mapping[str, Any]) -> dict[str, Any]:
+    record = {name: row.get(name) for name in _schema().names}
+    record["id"] = str(record["id"])
+    for name in _JSON_COLUMNS:
+        if record[name] is not None:
+            record[name] = json.dumps(record[name])
+    return record
+
+
+def _from_record(record: dict[str, Any]) -> dict[str, Any]:
+    for name in _JSON_COLUMNS:
+        if record[name] is not None:
+            record[name] = json.loads(record[name])
+    return record
+
+
+class EventArchive:
+    """
+    ``watermark_ttl`` lets readers reuse the watermark for that many seconds
+    instead of reading ``_watermark`` on every listing; the archive CLI waits
+    as long between moving the watermark and dropping the partitions behind it.
+    """
+
+    def __init__(
+        self, root: str | None = None, row_group_size: int = 50_000, watermark_ttl: float = 0
+    ):
+        self.root = Path(root) if root else None
+        self.row_group_size = row_group_size
+        self.watermark_ttl = watermark_ttl
+        # (monotonic time read, value)
+        self._watermark: tuple[float, datetime | None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None and pa is not None
+
+    def _require(self) -> None:
+        if pa is None:
+            raise RuntimeError("The events archive needs the archive extra (pyarrow)")
+        if self.root is None:
+            raise RuntimeError("EVENTS_ARCHIVE_DIR is not configured")
+
+    def tenant_dir(self, parent: str) -> Path:
+        return self.root / f"parent={quote(parent, safe='')}"
+
+    def day_dir(self, parent: str, day: date) -> Path:
+        return self.tenant_dir(parent) / f"day={day.isoformat()}"
+
+    def watermark(self) -> datetime | None:
+        """Everything before this instant has been archived."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        if self._watermark is not None and now - self._watermark[0] < self.watermark_ttl:
+            return self._watermark[1]
+        try:
+            value = datetime.fromisoformat((self.root / "_watermark").read_text().strip())
+        except FileNotFoundError:
+            value = None
+        self._watermark = (now, value)
+        return value
+
+    def advance_watermark(self, value: datetime) -> None:
+        current = self.watermark()
+        if current is not None and current >= value:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / "_watermark.tmp"
+        tmp.write_text(value.isoformat())
+        os.replace(tmp, self.root / "_watermark")
+        self._watermark = (time.monotonic(), value)
+
+    def covers(self, until: datetime | None) -> bool:
+        """Whether a range ending at ``until`` is entirely in the archive."""
+        watermark = self.watermark()
+        return until is not None and watermark is not None and to_naive_utc(until) <= watermark
+
+    def straddles(self, since: datetime | None, until: datetime | None) -> bool:
+        """Whether the range ``[since, until)`` starts in the archive and ends in
+        Postgres; ``None`` leaves that end open. An open start never straddles:
+        listings only reach into the archive when asked for a time before the
+        watermark."""
+        watermark = self.watermark()
+        if watermark is None or since is None or to_naive_utc(since) >= watermark:
+            return False
+        return until is None or to_naive_utc(until) > watermark
+
+    def write(self, rows: Iterable[Mapping[str, Any]], name: str) -> int:
+        """Write rows ordered by ``(parent, occurred_at)`` to one file per tenant
+        and day, called ``<name>.parquet``.
+
+        Files are written under a temporary name and renamed when complete, and
+        re-running with the same ``name`` overwrites instead of duplicating, so
+        an interrupted archive run can simply be repeated.
+        """
+        self._require()
+        schema = _schema()
+        count = 0
+        key = writer = path = None
+        buffer: list[dict[str, Any]] = []
+
+        def flush():
+            if buffer:
+                writer.write_table(pa.Table.from_pylist(buffer, schema=schema))
+                buffer.clear()
+
+        def close():
+            if writer is not None:
+                flush()
+                writer.close()
+                os.replace(path.with_suffix(".tmp"), path)
+
+        for row in rows:
+            row_key = (row["parent"], row["occurred_at"].date())
+            if row_key != key:
+                close()
+                key = row_key
+                directory = self.day_dir(*key)
+                directory.mkdir(parents=True, exist_ok=True)
+                path = directory / f"{name}.parquet"
+                writer = pq.ParquetWriter(path.with_suffix(".tmp"), schema, compression="zstd")
+            buffer.append(_to_record(row))
+            count += 1
+            if len(buffer) >= self.row_group_size:
+                flush()
+        close()
+        return count
+
+    def _scan(
+        self, parent: str, since: datetime | None, until: datetime | None, filters: dict[str, Any]
+    ) -> tuple[list[str], Any]:
+        """The files that can hold a tenant's events in ``[since, until)`` and the
+        filter expression selecting them."""
+        self._require()
+        since, until = to_naive_utc(since), to_naive_utc(until)
+
+        files = []
+        tenant = self.tenant_dir(parent)
+        for directory in tenant.glob("day=*") if tenant.exists() else []:
+            day = date.fromisoformat(directory.name.removeprefix("day="))
+            if since is not None and day < since.date():
+                continue
+            if until is not None and day > until.date():
+                continue
+            files.extend(str(path) for path in directory.glob("*.parquet"))
+
+        expression = pc.field("parent") == parent
+        if since is not None:
+            expression &= pc.field("occurred_at") >= since
+        if until is not None:
+            expression &= pc.field("occurred_at") < until
+        for key, value in filters.items():
+            if value is None:
+                continue
+            # "<column>__in" takes a list, "<column>__contains" a case-insensitive
+            # substring, anything else is an equality
+            column, _, op = key.partition("__")
+            if op == "in":
+                expression &= pc.field(column).isin(value)
+            elif op == "contains":
+                expression &= pc.match_substring(pc.field(column), value, ignore_case=True)
+            else:
+                expression &= pc.field(column) == value
+        return files, expression
+
+    def list_events(
+        self,
+        parent: str,
+        since: datetime | None,
+        until: datetime | None,
+        filters: dict[str, Any],
+        offset: int,
+        limit: int,
+        after: tuple[datetime, Any] | None = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """One page of a tenant's archived events, newest first, and the total.
+
+        ``after`` is the ``(occurred_at, id)`` of the last event of the previous
+        page when paging by cursor instead of ``offset``.
+        """
+        files, expression = self._scan(parent, since, until, filters)
+        if not files:
+            return [], 0
+
+        table = ds.dataset(files, schema=_schema(), format="parquet").to_table(filter=expression)
+        total = table.num_rows
+        if after is not None:
+            occurred_at, event_id = to_naive_utc(after[0]), str(after[1])
+            table = table.filter(
+                (pc.field("occurred_at") < occurred_at)
+                | ((pc.field("occurred_at") == occurred_at) & (pc.field("id") < event_id))
+            )
+        # ids are stored as canonical UUID text, which sorts like the uuid column
+        table = table.sort_by([("occurred_at", "descending"), ("id", "descending")])
+        page = table.slice(offset, limit).to_pylist()
+        return [_from_record(record) for record in page], total
+
+    def count_events(
+        self,
+        parent: str,
+        since: datetime | None,
+        until: datetime | None,
+        filters: dict[str, Any],
+        estimate: bool = False,
+    ) -> int:
+        """The total of ``list_events`` without loading the events: only the
+        filtered columns are read. ``estimate`` takes the row counts from the
+        file footers instead, which ignores the filters and where in its first
+        and last day the range starts and ends."""
+        files, expression = self._scan(parent, since, until, filters)
+        if not files:
+            return 0
+        dataset = ds.dataset(files, schema=_schema(), format="parquet")
+        return dataset.count_rows() if estimate else dataset.count_rows(filter=expression)
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from datetime import timedelta
+from time import monotonic
+
+from sqlalchemy import delete, func, select, update
+
+from flux_watch_api.core.metrics import metrics
+from flux_watch_api.core.registry import registry
+from flux_watch_api.database.redis import AsyncRedis
+from flux_watch_api.database.session import AsyncDatabase
+from flux_watch_api.schema.outbox import OutboxORM
+
+logger = logging.getLogger(__name__)
+
+# counting a backlog stops here; past it the exact depth does not change what to do
+PENDING_COUNT_CAP = 100_000
+
+
+class OutboxRelay:
+    """
+    Background task moving committed outbox rows to their Redis streams.
+
+    Each pass locks up to ``batch_size`` unsent rows with ``FOR UPDATE SKIP
+    LOCKED`` (so every API worker can run a relay), XADDs them through one
+    pipeline and marks them sent in the same transaction. A failed XADD rolls
+    the pass back and the rows are retried; a crash between XADD and commit
+    sends them again, so consumers must tolerate the odd duplicate.
+
+    A message waits at most ``poll_interval_ms`` plus one pass before it is
+    sent, and at most ``batch_size`` rows are held in memory. The unsent
+    backlog is exported as the ``outbox_relay.pending`` gauge and the time of
+    each pass as the ``outbox_relay.batch`` timer.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        poll_interval_ms: int = 50,
+        retention_seconds: int = 3600,
+    ):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval_ms / 1000
+        self.retention = timedelta(seconds=retention_seconds)
+
+        self._task: asyncio.Task | None = None
+        self._stopping: asyncio.Event | None = None
+        self._last_purge = 0.0
+        self.pending = 0
+
+        metrics.register_gauge("outbox_relay.pending", lambda: self.pending)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """Stop polling after relaying everything that is already committed."""
+        if not self.running:
+            return
+        self._stopping.set()
+        await self._task
+
+    async def relay_once(self) -> int:
+        """Relay one batch; returns how many messages were sent."""
+        db: AsyncDatabase = registry.resolve(AsyncDatabase)
+        redis: AsyncRedis = registry.resolve(AsyncRedis)
+
+        started = monotonic()
+        async with db.session_scope(pool="ingest") as session:
+            pending = (
+                await session.execute(
+                    select(OutboxORM.id, OutboxORM.stream, OutboxORM.fields)
+                    .where(OutboxORM.sent_at.is_(None))
+                    .order_by(OutboxORM.seq)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            ).all()
+            if not pending:
+                self.pending = 0
+                return 0
+            # counted before the XADDs so the gauge still grows while Redis is
+            # down; a short batch already reached the end of the backlog
+            self.pending = (
+                await self._count_pending(session) - len(pending)
+                if len(pending) == self.batch_size
+                else 0
+            )
+
+            with metrics.timer("outbox_relay.send"):
+                async with redis.client.pipeline(transaction=False) as pipe:
+                    for row in pending:
+                        pipe.xadd(row.stream, row.fields)
+                    await pipe.execute()
+
+            await session.execute(
+                update(OutboxORM)
+                .where(OutboxORM.id.in_([row.id for row in pending]))
+                .values(sent_at=func.now())
+            )
+
+        metrics.observe("outbox_relay.batch", monotonic() - started)
+        metrics.incr("outbox_relay.sent", len(pending))
+        return len(pending)
+
+    @staticmethod
+    async def _count_pending(session) -> int:
+        unsent = select(OutboxORM.seq).where(OutboxORM.sent_at.is_(None)).limit(PENDING_COUNT_CAP)
+        return (
+            await session.execute(select(func.count()).select_from(unsent.subquery()))
+        ).scalar_one()
+
+    async def purge_sent(self) -> None:
+        """Drop sent rows older than the retention window."""
+        db: AsyncDatabase = registry.resolve(AsyncDatabase)
+        async with db.session_scope(pool="ingest") as session:
+            await session.execute(
+                delete(OutboxORM).where(OutboxORM.sent_at < func.now() - self.retention)
+            )
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                sent = await self.relay_once()
+                if monotonic() - self._last_purge > self.retention.total_seconds() / 10:
+                    await self.purge_sent()
+                    self._last_purge = monotonic()
+            except Exception:
+                metrics.incr("outbox_relay.failed")
+                logger.exception("Outbox relay pass failed, will retry")
+                sent = 0
+
+            # a full batch means there is a backlog, keep going without sleeping
+            if sent < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                except TimeoutError:
+                    pass
+
+        try:
+            while await self.relay_once() == self.batch_size:
+                pass
+        except Exception:
+            logger.exception("Outbox relay failed to drain on shutdown")
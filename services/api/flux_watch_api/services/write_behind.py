@@ -0,0 +1,164 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+from flux_watch_api.core.metrics import metrics
+from flux_watch_api.errors.rest_errors import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# ceiling of the pause between failed flushes
+_MAX_BACKOFF = 5.0
+
+FlushFn = Callable[[list[Any]], Awaitable[Any]]
+
+
+class WriteBehindQueue:
+    """
+    Bounded in-process queue drained by a background task.
+
+    Items are flushed in batches when either ``flush_size`` items are waiting
+    or the oldest waiting item is ``max_latency_ms`` old, whichever comes first.
+    ``submit`` never waits: when the queue is full it raises a 503 with
+    ``Retry-After`` so callers back off instead of piling up latency.
+
+    A batch that fails to flush is put back in front of newer items, as far as
+    ``max_size`` allows, and retried after a growing pause; the producers
+    already got their 202. Only what does not fit, or is still failing at
+    ``stop``, is dropped.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        flush_size: int = 500,
+        max_latency_ms: int = 200,
+        retry_after: int = 1,
+        retry_backoff_ms: int = 100,
+        name: str = "ingest_queue",
+    ):
+        self.max_size = max_size
+        self.flush_size = flush_size
+        self.max_latency = max_latency_ms / 1000
+        self.retry_after = retry_after
+        self.retry_backoff = retry_backoff_ms / 1000
+        self.name = name
+
+        self._queue: asyncio.Queue | None = None
+        # failed items waiting for the next attempt, oldest first
+        self._retry: list[tuple[float, Any]] = []
+        self._task: asyncio.Task | None = None
+        self._flush: FlushFn | None = None
+        self._closing = False
+        # set by stop, cuts the pause before a retry short
+        self._stopping: asyncio.Event | None = None
+
+        metrics.register_gauge(f"{name}.depth", lambda: self.depth)
+
+    @property
+    def depth(self) -> int:
+        return (self._queue.qsize() if self._queue else 0) + len(self._retry)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self, flush: FlushFn) -> None:
+        # the queue is created here so it binds to the serving event loop
+        self._queue = asyncio.Queue()
+        self._flush = flush
+        self._closing = False
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name=f"{self.name}-flusher")
+
+    async def stop(self) -> None:
+        """Stop accepting items and wait until everything queued is flushed."""
+        if not self.running:
+            return
+        self._closing = True
+        self._stopping.set()
+        self._queue.put_nowait(_STOP)
+        await self._task
+
+    def submit(self, item: Any) -> None:
+        if not self.running or self._closing:
+            raise ServiceUnavailableError(
+                detail="Write-behind ingest is not available", retry_after=self.retry_after
+            )
+        # the bound is enforced here rather than with Queue(maxsize) so the
+        # stop sentinel can always be enqueued
+        if self.depth >= self.max_size:
+            metrics.incr(f"{self.name}.rejected")
+            raise ServiceUnavailableError(
+                detail="Ingest queue is full", retry_after=self.retry_after
+            )
+        self._queue.put_nowait((monotonic(), item))
+        metrics.incr(f"{self.name}.accepted")
+
+    async def _next_batch(self) -> tuple[list[tuple[float, Any]], bool]:
+        if self._retry:
+            batch = self._retry[: self.flush_size]
+            del self._retry[: self.flush_size]
+            return batch, False
+
+        first = await self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = first[0] + self.max_latency
+        while len(batch) < self.flush_size:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _run(self) -> None:
+        stop = False
+        backoff = self.retry_backoff
+        while not stop or self._retry:
+            batch, stopping = await self._next_batch()
+            stop = stop or stopping
+            if not batch:
+                continue
+
+            metrics.observe(f"{self.name}.batch_age", monotonic() - batch[0][0])
+            last_attempt = self._closing
+            try:
+                with metrics.timer(f"{self.name}.flush"):
+                    await self._flush([item for _, item in batch])
+            except Exception:
+                logger.exception(f"{self.name}: failed to flush {len(batch)} items")
+                if last_attempt:
+                    # stopping, there is no later attempt to keep them for
+                    metrics.incr(f"{self.name}.failed", len(batch))
+                    continue
+                self._requeue(batch)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF)
+            else:
+                metrics.incr(f"{self.name}.flushed", len(batch))
+                backoff = self.retry_backoff
+
+    def _requeue(self, batch: list[tuple[float, Any]]) -> None:
+        keep = batch[: max(self.max_size - self.depth, 0)]
+        self._retry[:0] = keep
+        if len(keep) < len(batch):
+            metrics.incr(f"{self.name}.failed", len(batch) - len(keep))
+            logger.error(f"{self.name}: dropped {len(batch) - len(keep)} items, queue is full")
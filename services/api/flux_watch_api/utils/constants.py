@@ -1,4 +1,18 @@
-REDIS_BUFFER_SIZE = 10
+IDEMPOTENCY_CACHE_PREFIX = "fw:idem"
+COUNT_CACHE_PREFIX = "fw:count"
+LIST_CACHE_PREFIX = "fw:list"
+# per-tenant counter bumped by every ingest; cached list pages carry the value
+# they were read under
+LIST_VERSION_PREFIX = "fw:listver"
+
+PREFER_RESPOND_ASYNC = "respond-async"
+PREFER_RETURN_MINIMAL = "return=minimal"
+
+# `X-Read-From: primary` keeps a request's reads off the replicas
+READ_FROM_HEADER = "X-Read-From"
+READ_FROM_PRIMARY = "primary"
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
 
 REDIS_EVENT_PROCESSOR_KEY = "analytics_events"
 
@@ -7,4 +7,5 @@ ALLOWED_HEADERS = [
     "DNT",
     "If-Modified-Since",
     "Keep-Alive",
+    "Prefer",
 ]
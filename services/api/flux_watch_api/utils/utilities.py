@@ -1,4 +1,9 @@
 import base64
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic import ValidationError
 
 from flux_watch_api.errors.rest_errors import UnauthorizedError
 from flux_watch_api.models.auth import Scheme
@@ -15,3 +20,69 @@ def extract_auth_user(scheme: Scheme, encoded: str) -> AuthUser:
 
 def key_auth_user(scheme: Scheme, encoded: str) -> AuthUser:
     return AuthUser(auth_scheme=scheme, credentials=encoded, principal="")
+
+
+def to_naive_utc(value: Any) -> Any:
+    """Aware datetimes as naive UTC, for ``timestamp without time zone`` columns.
+
+    Comparing such a column with a timestamptz makes Postgres cast the column,
+    which also defeats partition pruning on it.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def format_validation_error(err: ValidationError) -> str:
+    """Flatten a pydantic ValidationError into a single readable line."""
+    return "; ".join(
+        f"{'.'.join(str(p) for p in e['loc']) or 'body'}: {e['msg']}" for e in err.errors()
+    )
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Split a byte stream into numbered lines without buffering the whole body.
+
+    Yields ``(line_number, line)`` for every non-blank line. A line longer than
+    ``max_line_bytes`` is discarded as it streams in and yielded as ``None`` so
+    the caller can report it without ever holding it in memory.
+    """
+    buffer = bytearray()
+    line_no = 1
+    overflow = False
+
+    async for chunk in chunks:
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            if overflow:
+                yield line_no, None
+            elif len(buffer) + end - start > max_line_bytes:
+                yield line_no, None
+            else:
+                buffer += chunk[start:end]
+                if buffer.strip():
+                    yield line_no, bytes(buffer)
+            buffer.clear()
+            overflow = False
+            line_no += 1
+            start = end + 1
+
+        if not overflow:
+            buffer += chunk[start:]
+            if len(buffer) > max_line_bytes:
+                buffer.clear()
+                overflow = True
+
+    if overflow:
+        yield line_no, None
+    elif buffer.strip():
+        yield line_no, bytes(buffer)
+
+
+def parse_prefer(header: str | None) -> set[str]:
+    """Preferences from an RFC 7240 ``Prefer`` header, e.g. ``{"respond-async"}``."""
+    if not header:
+        return set()
+    return {token.split(";", 1)[0].strip().lower() for token in header.split(",") if token.strip()}
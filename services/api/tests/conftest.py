@@ -14,8 +14,9 @@ Strategy
 from __future__ import annotations
 
 from collections.abc import Generator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -24,10 +25,12 @@ from starlette.requests import Request
 
 from flux_watch_api.core.config import AppConfig
 from flux_watch_api.core.registry import registry
-from flux_watch_api.database.redis import Redis
-from flux_watch_api.database.session import Database
+from flux_watch_api.database.partitions import PartitionManager
+from flux_watch_api.database.redis import AsyncRedis, Redis
+from flux_watch_api.database.session import AsyncDatabase, Database
 from flux_watch_api.middlewares.auth import auth_middleware
 from flux_watch_api.models.account import Account
+from flux_watch_api.services.outbox_relay import OutboxRelay
 
 # ---------------------------------------------------------------------------
 # Infrastructure mocks (session-scoped — created once for the whole run)
@@ -47,6 +50,24 @@ def mock_db() -> MagicMock:
         yield MagicMock()
 
     db.get_session.side_effect = _session_gen
+    # no read replicas: every read goes through get_session
+    db.has_replicas = False
+    return db
+
+
+@pytest.fixture(scope="session")
+def mock_async_db() -> MagicMock:
+    db = MagicMock(spec=AsyncDatabase)
+    db.engine = MagicMock()
+
+    # same reasoning as mock_db: session_scope must be a real async context
+    # manager for InjectAsyncSession to enter it
+    @asynccontextmanager
+    async def _session_scope(pool=None):
+        yield AsyncMock()
+
+    db.session_scope.side_effect = _session_scope
+    db.has_replicas = False
     return db
 
 
@@ -54,23 +75,50 @@ def mock_db() -> MagicMock:
 def mock_redis() -> MagicMock:
     r = MagicMock(spec=Redis)
     r.client = MagicMock()
-    r._buffer = []
-    r.flush = MagicMock()
     return r
 
 
+@pytest.fixture(scope="session")
+def mock_async_redis() -> MagicMock:
+    r = MagicMock(spec=AsyncRedis)
+    r.client = MagicMock()
+    return r
+
+
+@pytest.fixture(scope="session")
+def mock_outbox_relay() -> MagicMock:
+    # the lifespan starts the relay; a real one would poll the mocked database
+    return MagicMock(spec=OutboxRelay)
+
+
+@pytest.fixture(scope="session")
+def mock_partition_manager() -> MagicMock:
+    return MagicMock(spec=PartitionManager)
+
+
 # ---------------------------------------------------------------------------
 # Application fixture
 # ---------------------------------------------------------------------------
 
 
 @pytest.fixture(scope="session")
-def app(mock_db: MagicMock, mock_redis: MagicMock):
+def app(
+    mock_db: MagicMock,
+    mock_async_db: MagicMock,
+    mock_redis: MagicMock,
+    mock_async_redis: MagicMock,
+    mock_outbox_relay: MagicMock,
+    mock_partition_manager: MagicMock,
+):
     # Pre-populate the singleton registry so registry.resolve() works
     # without running the real register_common_deps().
     registry._dependencies[AppConfig] = AppConfig()
     registry._dependencies[Database] = mock_db
+    registry._dependencies[AsyncDatabase] = mock_async_db
     registry._dependencies[Redis] = mock_redis
+    registry._dependencies[AsyncRedis] = mock_async_redis
+    registry._dependencies[OutboxRelay] = mock_outbox_relay
+    registry._dependencies[PartitionManager] = mock_partition_manager
 
     # Patch register_common_deps where it is *used* (create_app module)
     # so no real DB / Redis connections are attempted.
@@ -11,6 +11,7 @@ app.dependency_overrides after every test so overrides don't bleed.
 
 from __future__ import annotations
 
+from functools import partial
 from unittest.mock import MagicMock
 
 import pytest
@@ -36,7 +37,12 @@ def mock_auth_manager() -> MagicMock:
 
 @pytest.fixture
 def mock_events_repo() -> MagicMock:
-    return MagicMock(spec=EventsRepository)
+    repo = MagicMock(spec=EventsRepository)
+    # GET /events serves get_all_events_json; with the list cache off that
+    # encodes whatever get_all_events is stubbed to return
+    repo.repo = MagicMock(app_config=MagicMock(EVENTS_LIST_CACHE_TTL_S=0))
+    repo.get_all_events_json.side_effect = partial(EventsRepository.get_all_events_json, repo)
+    return repo
 
 
 @pytest.fixture
@@ -9,8 +9,18 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from flux_watch_api.errors.rest_errors import NotFoundError
-from flux_watch_api.models.events import Event, EventEntity
+from flux_watch_api.database.query_builder.processor import CountMode
+from flux_watch_api.errors.rest_errors import NotFoundError, ServiceUnavailableError
+from flux_watch_api.models.events import (
+    BatchIngestResponse,
+    Event,
+    EventEntity,
+    EventIngestResult,
+    EventRef,
+    IngestAccepted,
+    PartialEvent,
+    StreamIngestResponse,
+)
 from flux_watch_api.models.response_schema import ListResponse, Meta
 from flux_watch_api.repository.events.events import EventsRepository
 
@@ -55,6 +65,72 @@ class TestIngestEvent:
         assert response.status_code == 201
         mock_events_repo.ingest_event.assert_called_once()
 
+    def test_prefer_respond_async_returns_202(self, authed_client, app, mock_events_repo):
+        event_id = uuid4()
+        mock_events_repo.enqueue_event.return_value = IngestAccepted(id=event_id)
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.post(
+            f"{BASE}/ingest",
+            json={
+                "entity": {"type": "user", "id": "user-1"},
+                "eventType": "user.login",
+                "producer": "test-service",
+                "occurredAt": datetime.now(timezone.utc).isoformat(),
+            },
+            headers={"Prefer": "respond-async"},
+        )
+
+        assert response.status_code == 202
+        assert response.json() == {"id": str(event_id)}
+        mock_events_repo.ingest_event.assert_not_called()
+
+    def test_prefer_return_minimal_returns_id_and_occurred_at(
+        self, authed_client, app, mock_events_repo
+    ):
+        event_id = uuid4()
+        occurred_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        mock_events_repo.ingest_event_ref.return_value = EventRef(
+            id=event_id, occurred_at=occurred_at
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.post(
+            f"{BASE}/ingest",
+            json={
+                "entity": {"type": "user", "id": "user-1"},
+                "eventType": "user.login",
+                "producer": "test-service",
+                "occurredAt": occurred_at.isoformat(),
+            },
+            headers={"Prefer": "return=minimal"},
+        )
+
+        assert response.status_code == 201
+        assert response.headers["Preference-Applied"] == "return=minimal"
+        assert response.json() == {"id": str(event_id), "occurredAt": "2026-01-01T00:00:00Z"}
+        mock_events_repo.ingest_event.assert_not_called()
+
+    def test_full_ingest_queue_returns_503(self, authed_client, app, mock_events_repo):
+        mock_events_repo.enqueue_event.side_effect = ServiceUnavailableError(
+            detail="Ingest queue is full", retry_after=1
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.post(
+            f"{BASE}/ingest",
+            json={
+                "entity": {"type": "user", "id": "user-1"},
+                "eventType": "user.login",
+                "producer": "test-service",
+                "occurredAt": datetime.now(timezone.utc).isoformat(),
+            },
+            headers={"Prefer": "respond-async"},
+        )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
     def test_invalid_event_type_for_entity_returns_422(self, authed_client):
         # Validation is handled by Pydantic before the repo is called
         response = authed_client.post(
@@ -99,6 +175,80 @@ class TestIngestEvent:
         assert response.status_code == 401
 
 
+class TestIngestBatch:
+    def test_returns_per_item_results(self, authed_client, app, mock_events_repo):
+        event_id = uuid4()
+        mock_events_repo.ingest_events.return_value = BatchIngestResponse(
+            accepted=1,
+            rejected=1,
+            results=[
+                EventIngestResult(index=0, id=event_id),
+                EventIngestResult(index=1, error="eventType: field required"),
+            ],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.post(
+            f"{BASE}/ingest/batch",
+            json=[
+                {
+                    "entity": {"type": "user", "id": "user-1"},
+                    "eventType": "user.login",
+                    "producer": "test-service",
+                    "occurredAt": datetime.now(timezone.utc).isoformat(),
+                },
+                {"entity": {"type": "user", "id": "user-1"}},
+            ],
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["accepted"] == 1
+        assert body["results"][0]["id"] == str(event_id)
+        assert body["results"][1]["error"]
+
+    def test_invalid_items_do_not_fail_the_request(self, authed_client, app, mock_events_repo):
+        mock_events_repo.ingest_events.return_value = BatchIngestResponse(
+            accepted=0, rejected=1, results=[EventIngestResult(index=0, error="bad")]
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.post(f"{BASE}/ingest/batch", json=[{"entity": {}}])
+
+        assert response.status_code == 200
+        mock_events_repo.ingest_events.assert_called_once_with([{"entity": {}}])
+
+    def test_non_list_body_returns_422(self, authed_client):
+        response = authed_client.post(f"{BASE}/ingest/batch", json={"entity": {}})
+        assert response.status_code == 422
+
+
+class TestIngestStream:
+    def test_ndjson_body_is_streamed_to_repo(self, authed_client, app, mock_events_repo):
+        mock_events_repo.ingest_stream.return_value = StreamIngestResponse(
+            accepted=2, rejected=0, chunks=1, errors=[]
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.post(
+            f"{BASE}/ingest/stream",
+            content=b'{"a": 1}\n{"b": 2}\n',
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["accepted"] == 2
+        mock_events_repo.ingest_stream.assert_called_once()
+
+    def test_wrong_content_type_returns_415(self, authed_client, app, mock_events_repo):
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.post(f"{BASE}/ingest/stream", json=[])
+
+        assert response.status_code == 415
+        mock_events_repo.ingest_stream.assert_not_called()
+
+
 class TestGetEventById:
     def test_existing_event_returns_200(self, authed_client, app, mock_events_repo):
         event = _make_event()
@@ -170,3 +320,118 @@ class TestListEvents:
         call_kwargs = mock_events_repo.get_all_events.call_args.kwargs
         assert call_kwargs["page_size"] == 20
         assert call_kwargs["page"] == 2
+
+    def test_cursor_is_passed_and_next_cursor_returned(self, authed_client, app, mock_events_repo):
+        mock_events_repo.get_all_events.return_value = ListResponse(
+            meta=Meta(total_count=9, returned_count=0, next_cursor="abc"),
+            results=[],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.get(BASE, params={"cursor": "xyz"})
+
+        assert mock_events_repo.get_all_events.call_args.kwargs["cursor"] == "xyz"
+        assert response.json()["meta"]["nextCursor"] == "abc"
+
+    def test_count_mode_is_passed_and_reported(self, authed_client, app, mock_events_repo):
+        mock_events_repo.get_all_events.return_value = ListResponse(
+            meta=Meta(total_count=None, returned_count=0, count_mode=CountMode.NONE),
+            results=[],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.get(BASE, params={"count": "none"})
+
+        assert mock_events_repo.get_all_events.call_args.kwargs["count"] == CountMode.NONE
+        assert response.json()["meta"]["countMode"] == "none"
+        assert response.json()["meta"]["totalCount"] is None
+
+    def test_partial_events_only_carry_the_requested_fields(
+        self, authed_client, app, mock_events_repo
+    ):
+        mock_events_repo.get_all_events.return_value = ListResponse(
+            meta=Meta(total_count=1, returned_count=1),
+            results=[PartialEvent(event_type="order.created", actor=None)],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.get(BASE, params={"fields": "eventType,actor"})
+
+        assert mock_events_repo.get_all_events.call_args.kwargs["fields"] == "eventType,actor"
+        assert response.json()["results"] == [{"eventType": "order.created", "actor": None}]
+
+    def test_full_events_keep_null_fields(self, authed_client, app, mock_events_repo):
+        mock_events_repo.get_all_events.return_value = ListResponse(
+            meta=Meta(total_count=1, returned_count=1),
+            # as EventORM.to_model builds them: every field set, nulls included
+            results=[_make_event(idempotency_key=None)],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        (event,) = authed_client.get(BASE).json()["results"]
+
+        assert set(event) >= {"id", "entity", "eventType", "actor", "idempotencyKey", "payload"}
+
+    def test_unknown_count_mode_returns_422(self, authed_client, app, mock_events_repo):
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        assert authed_client.get(BASE, params={"count": "lots"}).status_code == 422
+
+    def test_time_range_becomes_occurred_at_filters(self, authed_client, app, mock_events_repo):
+        mock_events_repo.get_all_events.return_value = ListResponse(
+            meta=Meta(total_count=0, returned_count=0),
+            results=[],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        authed_client.get(
+            BASE, params={"since": "2026-01-01T00:00:00Z", "until": "2026-01-08T00:00:00Z"}
+        )
+
+        call_kwargs = mock_events_repo.get_all_events.call_args.kwargs
+        assert call_kwargs["occurred_at__gte"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert call_kwargs["occurred_at__lt"] == datetime(2026, 1, 8, tzinfo=timezone.utc)
+
+    def test_column_filters_are_passed_through(self, authed_client, app, mock_events_repo):
+        mock_events_repo.get_all_events.return_value = ListResponse(
+            meta=Meta(total_count=0, returned_count=0),
+            results=[],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        authed_client.get(
+            BASE,
+            params={"eventType": "order.created", "producer": "checkout", "actorId": "user-1"},
+        )
+        call_kwargs = mock_events_repo.get_all_events.call_args.kwargs
+        assert call_kwargs["event_type"] == "order.created"
+        assert (call_kwargs["producer"], call_kwargs["actor_id"]) == ("checkout", "user-1")
+
+        authed_client.get(BASE, params={"eventType": "order.created,order.cancelled"})
+        call_kwargs = mock_events_repo.get_all_events.call_args.kwargs
+        assert call_kwargs["event_type__in"] == "order.created,order.cancelled"
+        assert "event_type" not in call_kwargs
+
+    def test_json_path_filters_are_passed_through(self, authed_client, app, mock_events_repo):
+        mock_events_repo.get_all_events.return_value = ListResponse(
+            meta=Meta(total_count=0, returned_count=0),
+            results=[],
+        )
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        authed_client.get(
+            BASE, params={"payload__amount__gt": "100", "context__env": "prod", "other": "x"}
+        )
+
+        call_kwargs = mock_events_repo.get_all_events.call_args.kwargs
+        assert call_kwargs["payload__amount__gt"] == "100"
+        assert call_kwargs["context__env"] == "prod"
+        assert "other" not in call_kwargs
+
+    def test_malformed_json_path_filter_returns_400(self, authed_client, app, mock_events_repo):
+        app.dependency_overrides[EventsRepository] = lambda: mock_events_repo
+
+        response = authed_client.get(BASE, params={"payload____gt": "1"})
+
+        assert response.status_code == 400
+        mock_events_repo.get_all_events.assert_not_called()
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 from sqlalchemy.exc import OperationalError
 
+from flux_watch_api.core.config import AppConfig
+
 HEALTH_URL = "/api/v1/health"
 
 
@@ -90,3 +92,25 @@ class TestHealthEndpoint:
         assert "checks" in body
         assert "database" in body["checks"]
         assert "redis" in body["checks"]
+
+
+class TestMetricsEndpoint:
+    def test_metrics_require_auth_by_default(self, client):
+        response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 401
+
+    def test_metrics_can_be_made_public(self, client, monkeypatch):
+        monkeypatch.setattr(AppConfig, "METRICS_PUBLIC", True)
+
+        response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+
+    def test_metrics_snapshot(self, authed_client):
+        response = authed_client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == {"counters", "gauges", "timers"}
+        assert "ingest_queue.depth" in body["gauges"]
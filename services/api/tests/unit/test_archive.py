@@ -0,0 +1,178 @@
+"""
+Unit tests for the Parquet events archive.
+
+Files are written to a temporary directory; the tests are skipped when
+pyarrow is not installed.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from flux_watch_api.services.archive import EventArchive  # noqa: E402
+
+_START = datetime(2026, 1, 5)
+
+
+def _row(parent: str, minutes: int, event_type: str = "order.created") -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "parent": parent,
+        "entity_type": "order",
+        "entity_id": "order-1",
+        "event_type": event_type,
+        "event_version": 1,
+        "occurred_at": _START + timedelta(minutes=minutes),
+        "producer": "checkout",
+        "actor_type": None,
+        "actor_id": None,
+        "context": None,
+        "payload": {"total": minutes},
+        "idempotency_key": None,
+        "created_at": datetime(2026, 1, 5, tzinfo=timezone.utc),
+        "updated_at": datetime(2026, 1, 5, tzinfo=timezone.utc),
+    }
+
+
+@pytest.fixture
+def archive(tmp_path) -> EventArchive:
+    return EventArchive(root=str(tmp_path), row_group_size=2)
+
+
+class TestEventArchive:
+    def test_disabled_without_root(self):
+        archive = EventArchive()
+        assert not archive.enabled
+        assert archive.watermark() is None
+        assert not archive.covers(_START)
+        with pytest.raises(RuntimeError):
+            archive.write([], name="events_p20260105")
+
+    def test_write_splits_files_by_tenant_and_day(self, archive, tmp_path):
+        rows = [_row("b@x.io", m) for m in (0, 10, 24 * 60)] + [_row("a@x.io", 5)]
+
+        assert archive.write(rows, name="events_p20260105") == 4
+        files = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.parquet"))
+        assert files == [
+            "parent=a%40x.io/day=2026-01-05/events_p20260105.parquet",
+            "parent=b%40x.io/day=2026-01-05/events_p20260105.parquet",
+            "parent=b%40x.io/day=2026-01-06/events_p20260105.parquet",
+        ]
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_list_events_is_newest_first_and_paginated(self, archive):
+        archive.write([_row("a@x.io", m) for m in range(5)], name="events_p20260105")
+
+        page, total = archive.list_events("a@x.io", None, None, {}, offset=1, limit=2)
+
+        assert total == 5
+        assert [r["payload"]["total"] for r in page] == [3, 2]
+        assert page[0]["occurred_at"] == _START + timedelta(minutes=3)
+
+    def test_list_events_applies_range_and_filters(self, archive):
+        rows = [_row("a@x.io", m, "order.paid" if m % 2 else "order.created") for m in range(6)]
+        archive.write(rows + [_row("b@x.io", 1, "order.paid")], name="events_p20260105")
+
+        page, total = archive.list_events(
+            "a@x.io",
+            since=_START + timedelta(minutes=1),
+            until=_START + timedelta(minutes=5),
+            filters={"event_type": "order.paid", "entity_id": None},
+            offset=0,
+            limit=10,
+        )
+
+        assert total == 2
+        assert [r["payload"]["total"] for r in page] == [3, 1]
+
+    def test_list_events_matches_any_of_an_in_filter(self, archive):
+        types = ["order.created", "order.paid", "order.cancelled"]
+        archive.write([_row("a@x.io", m, types[m % 3]) for m in range(6)], name="events_p20260105")
+
+        page, total = archive.list_events(
+            "a@x.io", None, None, {"event_type__in": ["order.paid", "order.cancelled"]}, 0, 10
+        )
+
+        assert total == 4
+        assert {r["event_type"] for r in page} == {"order.paid", "order.cancelled"}
+
+    def test_list_events_matches_a_substring_case_insensitively(self, archive):
+        rows = [_row("a@x.io", m) for m in range(3)]
+        rows[1]["entity_id"] = "ORDER_1234"
+        archive.write(rows, name="events_p20260105")
+
+        page, total = archive.list_events(
+            "a@x.io", None, None, {"entity_id__contains": "der_12"}, 0, 10
+        )
+
+        assert total == 1
+        assert page[0]["entity_id"] == "ORDER_1234"
+
+    def test_list_events_resumes_after_a_cursor(self, archive):
+        rows = [_row("a@x.io", m) for m in range(4)] + [_row("a@x.io", 2)]
+        archive.write(rows, name="events_p20260105")
+        first, _ = archive.list_events("a@x.io", None, None, {}, offset=0, limit=2)
+
+        last = first[-1]
+        page, total = archive.list_events(
+            "a@x.io", None, None, {}, offset=0, limit=10, after=(last["occurred_at"], last["id"])
+        )
+
+        assert total == 5
+        assert [r["payload"]["total"] for r in first + page] == [3, 2, 2, 1, 0]
+        assert {r["id"] for r in first}.isdisjoint(r["id"] for r in page)
+
+    def test_rewriting_a_partition_does_not_duplicate(self, archive):
+        archive.write([_row("a@x.io", 0)], name="events_p20260105")
+        archive.write([_row("a@x.io", 0)], name="events_p20260105")
+
+        assert archive.list_events("a@x.io", None, None, {}, 0, 10)[1] == 1
+
+    def test_watermark_only_moves_forward(self, archive):
+        archive.advance_watermark(datetime(2026, 1, 12))
+        archive.advance_watermark(datetime(2026, 1, 5))
+
+        assert archive.watermark() == datetime(2026, 1, 12)
+        assert archive.covers(datetime(2026, 1, 12, tzinfo=timezone.utc))
+        assert not archive.covers(datetime(2026, 1, 12, 0, 1))
+        assert not archive.covers(None)
+
+    def test_straddles_the_watermark(self, archive):
+        assert not archive.straddles(datetime(2026, 1, 5), None)
+        archive.advance_watermark(datetime(2026, 1, 12))
+
+        assert archive.straddles(datetime(2026, 1, 5), None)
+        assert archive.straddles(datetime(2026, 1, 5), datetime(2026, 1, 20))
+        assert not archive.straddles(datetime(2026, 1, 12), None)
+        assert not archive.straddles(datetime(2026, 1, 5), datetime(2026, 1, 12))
+        # only an explicit start reaches into the archive
+        assert not archive.straddles(None, None)
+        assert not archive.straddles(None, datetime(2026, 1, 20))
+
+    def test_watermark_is_reused_for_its_ttl(self, tmp_path):
+        writer = EventArchive(root=str(tmp_path))
+        reader = EventArchive(root=str(tmp_path), watermark_ttl=60)
+        writer.advance_watermark(datetime(2026, 1, 5))
+        assert reader.watermark() == datetime(2026, 1, 5)
+
+        writer.advance_watermark(datetime(2026, 1, 12))
+
+        assert reader.watermark() == datetime(2026, 1, 5)
+        assert writer.watermark() == datetime(2026, 1, 12)
+        reader._watermark = (reader._watermark[0] - 60, reader._watermark[1])
+        assert reader.watermark() == datetime(2026, 1, 12)
+
+    def test_count_events_matches_list_events(self, archive):
+        rows = [_row("a@x.io", m, "order.paid" if m % 2 else "order.created") for m in range(6)]
+        archive.write(rows + [_row("b@x.io", 1, "order.paid")], name="events_p20260105")
+        args = ("a@x.io", _START + timedelta(minutes=1), None, {"event_type": "order.paid"})
+
+        assert archive.count_events(*args) == archive.list_events(*args, 0, 10)[1] == 3
+        # the footers only know the tenant's rows per file
+        assert archive.count_events(*args, estimate=True) == 6
+        assert archive.count_events("c@x.io", None, None, {}) == 0
@@ -0,0 +1,53 @@
+"""
+Unit tests for the COPY based bulk loader.
+
+Only statement generation and row shaping are covered here; the copy itself
+needs a live Postgres connection.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from flux_watch_api.database.bulk import CopyLoader
+from flux_watch_api.schema.events import EventORM
+
+
+class TestCopyLoader:
+    def test_statement_skips_server_default_columns(self):
+        statement = CopyLoader(None, EventORM).statement
+
+        assert statement.startswith('COPY "events" (')
+        assert statement.endswith("FROM STDIN (FORMAT BINARY)")
+        assert '"created_at"' not in statement
+        assert '"is_expired"' in statement
+
+    def test_text_format_statement(self):
+        assert CopyLoader(None, EventORM, binary=False).statement.endswith("FROM STDIN")
+
+    def test_python_defaults_are_written_back_to_the_row(self):
+        loader = CopyLoader(None, EventORM)
+        row = {"payload": None}
+
+        loader._apply_defaults(row)
+
+        assert isinstance(row["id"], UUID)
+        assert row["expired"] is False
+        assert row["event_version"] == 1
+        assert row["payload"] == {}
+
+    def test_aware_timestamps_are_normalised_to_utc(self):
+        loader = CopyLoader(None, EventORM)
+        occurred_at = datetime(2026, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+
+        values = dict(
+            zip(
+                [name for _, name, _, _ in loader._columns],
+                loader._values({"occurred_at": occurred_at}),
+                strict=True,
+            )
+        )
+
+        assert values["occurred_at"] == datetime(2026, 1, 1, 10)
+        assert values["context"] is None
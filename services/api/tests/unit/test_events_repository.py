@@ -0,0 +1,818 @@
+"""
+Unit tests for EventsRepository write paths.
+
+The base AsyncRepository is replaced by a MagicMock so only the per-item
+validation and result bookkeeping is exercised.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from flux_watch_api.core.base_repository import AsyncRepository
+from flux_watch_api.core.metrics import metrics
+from flux_watch_api.database.query_builder.features import (
+    InvalidJsonFilterError,
+    InvalidSearchError,
+)
+from flux_watch_api.database.query_builder.processor import (
+    CountMode,
+    InvalidCursorError,
+    encode_cursor,
+)
+from flux_watch_api.errors.rest_errors import BadRequestError, PayloadTooLargeError
+from flux_watch_api.models.events import Event, EventCreate
+from flux_watch_api.repository.events.events import EventsRepository, EventsSearch
+from flux_watch_api.schema.events import EventORM
+from flux_watch_api.services.archive import EventArchive
+
+
+def _raw_event(**overrides) -> dict:
+    raw = {
+        "entity": {"type": "order", "id": "order-1"},
+        "eventType": "order.created",
+        "producer": "test-service",
+        "occurredAt": datetime.now(timezone.utc).isoformat(),
+    }
+    raw.update(overrides)
+    return raw
+
+
+@pytest.fixture
+def base_repo() -> MagicMock:
+    repo = MagicMock(spec=AsyncRepository)
+    repo.principal = "test@example.com"
+    repo.app_config = MagicMock(
+        INGEST_BATCH_MAX_SIZE=3,
+        INGEST_COPY_THRESHOLD=100,
+        INGEST_STREAM_CHUNK_SIZE=2,
+        INGEST_STREAM_MAX_LINE_BYTES=1024,
+        INGEST_STREAM_MAX_REPORTED_ERRORS=1,
+        EVENTS_COUNT_CACHE_TTL_S=0,
+        EVENTS_LIST_CACHE_TTL_S=0,
+    )
+
+    def _add_many(model, rows):
+        return [model(id=uuid4(), **row) for row in rows]
+
+    repo.add_many.side_effect = _add_many
+    repo.read_lag.return_value = 0.0
+    return repo
+
+
+class TestIngestEvents:
+    def test_valid_and_invalid_items_are_reported_in_order(self, base_repo):
+        response = asyncio.run(
+            EventsRepository(repo=base_repo).ingest_events(
+                [_raw_event(), _raw_event(eventType="user.login"), _raw_event()]
+            )
+        )
+
+        assert response.accepted == 2
+        assert response.rejected == 1
+        assert [r.index for r in response.results] == [0, 1, 2]
+        assert response.results[0].id is not None
+        assert response.results[1].id is None
+        assert "Invalid event_type" in response.results[1].error
+
+    def test_valid_items_are_written_in_one_call(self, base_repo):
+        asyncio.run(EventsRepository(repo=base_repo).ingest_events([_raw_event(), _raw_event()]))
+
+        base_repo.add_many.assert_called_once()
+        model, rows = base_repo.add_many.call_args.args
+        assert model is EventORM
+        assert len(rows) == 2
+        assert all(row["parent"] == "test@example.com" for row in rows)
+
+    def test_inserted_events_are_staged_in_the_outbox_together(self, base_repo):
+        asyncio.run(EventsRepository(repo=base_repo).ingest_events([_raw_event(), _raw_event()]))
+
+        base_repo.add_to_outbox.assert_called_once()
+        _, messages = base_repo.add_to_outbox.call_args.args
+        assert len(messages) == 2
+
+    def test_large_batches_are_copied(self, base_repo):
+        base_repo.app_config.INGEST_COPY_THRESHOLD = 2
+
+        def _copy_many(model, rows):
+            for row in rows:
+                row["id"] = uuid4()
+            return len(rows)
+
+        base_repo.copy_many.side_effect = _copy_many
+
+        response = asyncio.run(
+            EventsRepository(repo=base_repo).ingest_events([_raw_event(), _raw_event()])
+        )
+
+        base_repo.add_many.assert_not_called()
+        base_repo.copy_many.assert_called_once()
+        assert all(r.id is not None for r in response.results)
+
+    def test_oversized_batch_is_rejected(self, base_repo):
+        with pytest.raises(PayloadTooLargeError):
+            asyncio.run(EventsRepository(repo=base_repo).ingest_events([_raw_event()] * 4))
+        base_repo.add_many.assert_not_called()
+
+
+async def _lines(*items: tuple[int, bytes | None]):
+    for item in items:
+        yield item
+
+
+def _ndjson(**overrides) -> bytes:
+    return json.dumps(_raw_event(**overrides)).encode()
+
+
+class TestIngestStream:
+    def test_rows_are_committed_in_chunks(self, base_repo):
+        lines = _lines(*[(n, _ndjson()) for n in range(1, 6)])
+
+        response = asyncio.run(EventsRepository(repo=base_repo).ingest_stream(lines))
+
+        assert response.accepted == 5
+        assert response.chunks == 3
+        assert [len(c.args[1]) for c in base_repo.add_many.call_args_list] == [2, 2, 1]
+        assert base_repo.explicit_commit.call_count == 3
+
+    def test_malformed_lines_are_reported_with_line_numbers(self, base_repo):
+        lines = _lines((1, _ndjson()), (2, b"{not json"), (3, None), (4, _ndjson()))
+
+        response = asyncio.run(EventsRepository(repo=base_repo).ingest_stream(lines))
+
+        assert response.accepted == 2
+        assert response.rejected == 2
+        # only one error is kept because of INGEST_STREAM_MAX_REPORTED_ERRORS
+        assert [e.line for e in response.errors] == [2]
+        assert response.errors_truncated is True
+
+
+def _stored(model, row: dict):
+    now = datetime.now(timezone.utc)
+    return model(**{**row, "id": row.get("id") or uuid4()}, created_at=now, updated_at=now)
+
+
+class TestIdempotency:
+    @pytest.fixture
+    def idem_repo(self, base_repo) -> MagicMock:
+        base_repo.app_config.IDEMPOTENCY_WINDOW_SECONDS = 60
+        base_repo.cache_get_many.side_effect = lambda keys: [None] * len(keys)
+        base_repo.add_many_skip_conflicts.side_effect = lambda model, rows, index: [
+            _stored(model, row) for row in rows
+        ]
+        return base_repo
+
+    @staticmethod
+    def _commit(repo: MagicMock) -> None:
+        # what run_after_commit does with the callbacks, last registration wins
+        callbacks = {c.args[0]: c.args[1] for c in repo.after_commit.call_args_list}
+        for callback in callbacks.values():
+            asyncio.run(callback())
+
+    def test_new_key_is_inserted_published_and_cached(self, idem_repo):
+        occurred_at = "2026-01-01T12:00:00+00:00"
+        event = EventCreate.model_validate(
+            _raw_event(idempotencyKey="retry-1", occurredAt=occurred_at)
+        )
+
+        stored = asyncio.run(EventsRepository(repo=idem_repo).ingest_event(event))
+
+        assert stored.idempotency_key == "retry-1"
+        idem_repo.add_one.assert_not_called()
+        idem_repo.add_to_outbox.assert_called_once()
+        # a rollback must not leave the key cached with an id that was never stored
+        idem_repo.cache_set_many.assert_not_called()
+        self._commit(idem_repo)
+        values = idem_repo.cache_set_many.call_args.args[0]
+        assert list(values) == ["fw:idem:test@example.com:retry-1:2026-01-01T12:00:00"]
+
+    def test_key_resent_with_another_occurred_at_is_a_new_event(self, idem_repo):
+        # the unique index includes occurred_at; the cache has to agree with it,
+        # or the same retry would be deduped only while the key is cached
+        cache: dict[str, str] = {}
+        idem_repo.cache_get_many.side_effect = lambda keys: [cache.get(k) for k in keys]
+        idem_repo.cache_set_many.side_effect = lambda values, ttl: cache.update(values)
+
+        def _ingest(occurred_at: str) -> Event:
+            event = EventCreate.model_validate(
+                _raw_event(idempotencyKey="retry-1", occurredAt=occurred_at)
+            )
+            stored = asyncio.run(EventsRepository(repo=idem_repo).ingest_event(event))
+            self._commit(idem_repo)
+            return stored
+
+        first = _ingest("2026-01-01T12:00:00+00:00")
+        same = _ingest("2026-01-01T13:00:00+01:00")
+        moved = _ingest("2026-01-01T12:00:01+00:00")
+
+        assert same.id == first.id
+        assert moved.id != first.id
+        assert idem_repo.add_many_skip_conflicts.call_count == 2
+
+    def test_cached_key_skips_postgres(self, idem_repo):
+        event = EventCreate.model_validate(_raw_event(idempotencyKey="retry-1"))
+        original = _stored(EventORM, EventORM.values_from_model(event, "test@example.com"))
+        idem_repo.cache_get_many.side_effect = None
+        idem_repo.cache_get_many.return_value = [original.to_model().model_dump_json()]
+
+        stored = asyncio.run(EventsRepository(repo=idem_repo).ingest_event(event))
+
+        assert isinstance(stored, Event)
+        assert stored.id == original.id
+        idem_repo.add_many_skip_conflicts.assert_not_called()
+        idem_repo.add_to_outbox.assert_not_called()
+
+    def test_conflicting_rows_return_the_stored_event_without_publishing(self, idem_repo):
+        occurred_at = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        dup = _raw_event(idempotencyKey="dup", occurredAt=occurred_at.isoformat())
+        event = EventCreate.model_validate(dup)
+        # occurred_at is a timestamp without time zone, it comes back naive
+        stored_naive = occurred_at.replace(tzinfo=None)
+        original = _stored(
+            EventORM,
+            {**EventORM.values_from_model(event, "test@example.com"), "occurred_at": stored_naive},
+        )
+        idem_repo.add_many_skip_conflicts.side_effect = lambda model, rows, index: [
+            _stored(model, row) for row in rows if row["idempotency_key"] != "dup"
+        ]
+        idem_repo.get_by_keys.return_value = [original]
+
+        response = asyncio.run(
+            EventsRepository(repo=idem_repo).ingest_events(
+                [dup, _raw_event(idempotencyKey="new"), _raw_event()]
+            )
+        )
+
+        assert response.accepted == 3
+        assert response.results[0].id == original.id
+        idem_repo.get_by_keys.assert_called_once_with(
+            EventORM,
+            ("parent", "idempotency_key", "occurred_at"),
+            [("test@example.com", "dup", stored_naive)],
+        )
+        # the plain row and the new keyed row are published, the duplicate is not
+        published = [c.args[1] for c in idem_repo.add_to_outbox.call_args_list]
+        assert sum(len(messages) for messages in published) == 2
+
+    def test_async_ingest_returns_the_stored_id_for_a_known_key(self, idem_repo):
+        event = EventCreate.model_validate(_raw_event(idempotencyKey="retry-1"))
+        row = EventORM.values_from_model(event, "test@example.com")
+        original = _stored(
+            EventORM, {**row, "occurred_at": row["occurred_at"].replace(tzinfo=None)}
+        )
+        # the key is not cached (any more), only Postgres knows the stored id
+        idem_repo.add_many_skip_conflicts.side_effect = lambda model, rows, index: []
+        idem_repo.get_by_keys.return_value = [original]
+        repository = EventsRepository(repo=idem_repo)
+        repository.ingest_queue = MagicMock()
+
+        accepted = asyncio.run(repository.enqueue_event(event))
+
+        assert accepted.id == original.id
+        repository.ingest_queue.submit.assert_not_called()
+
+    def test_cache_outage_falls_back_to_postgres(self, idem_repo):
+        idem_repo.cache_get_many.side_effect = RedisConnectionError
+        idem_repo.cache_set_many.side_effect = RedisConnectionError
+
+        response = asyncio.run(
+            EventsRepository(repo=idem_repo).ingest_events([_raw_event(idempotencyKey="k")])
+        )
+        self._commit(idem_repo)
+
+        assert response.accepted == 1
+        idem_repo.add_many_skip_conflicts.assert_called_once()
+
+
+class TestIngestEventRef:
+    def test_only_returning_columns_are_read_back(self, base_repo):
+        base_repo.insert_returning.side_effect = lambda model, rows, columns: [
+            MagicMock(id=row["id"], occurred_at=row["occurred_at"]) for row in rows
+        ]
+        event = EventCreate.model_validate(_raw_event())
+
+        ref = asyncio.run(EventsRepository(repo=base_repo).ingest_event_ref(event))
+
+        _, rows, columns = base_repo.insert_returning.call_args.args
+        assert columns == ("id", "occurred_at")
+        assert ref.id == rows[0]["id"]
+        assert ref.occurred_at == event.occurred_at
+        base_repo.add_one.assert_not_called()
+        (message,) = base_repo.add_to_outbox.call_args.args[1]
+        assert message["event_id"] == str(ref.id)
+
+
+def _archived_row(occurred_at: datetime) -> dict:
+    row = EventORM.values_from_model(
+        EventCreate.model_validate(_raw_event()), parent="test@example.com"
+    )
+    row.update(id=uuid4(), occurred_at=occurred_at, created_at=occurred_at, updated_at=occurred_at)
+    return row
+
+
+class TestArchiveFallback:
+    @pytest.fixture
+    def archive(self) -> MagicMock:
+        archive = MagicMock(spec=EventArchive)
+        # everything before 2025 is archived
+        archive.watermark.return_value = datetime(2025, 1, 1)
+        archive.covers.side_effect = lambda until: EventArchive.covers(archive, until)
+        archive.straddles.side_effect = lambda since, until: EventArchive.straddles(
+            archive, since, until
+        )
+        return archive
+
+    def test_archived_range_is_read_from_parquet(self, base_repo, archive):
+        row = EventORM.values_from_model(
+            EventCreate.model_validate(_raw_event()), parent="test@example.com"
+        )
+        stamp = datetime(2024, 12, 1, tzinfo=timezone.utc)
+        row.update(id=uuid4(), created_at=stamp, updated_at=stamp)
+        archive.list_events.return_value = ([row], 7)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        response = asyncio.run(
+            repository.get_all_events(
+                occurred_at__lt=datetime(2025, 1, 1), page=2, page_size=5, event_type="order.paid"
+            )
+        )
+
+        kwargs = archive.list_events.call_args.kwargs
+        assert (kwargs["offset"], kwargs["limit"]) == (5, 5)
+        assert kwargs["filters"]["event_type"] == "order.paid"
+        assert response.meta.total_count == 7
+        assert response.results[0].event_type == "order.created"
+        base_repo.get_many.assert_not_called()
+
+    def test_range_after_the_watermark_stays_in_postgres(self, base_repo, archive):
+        base_repo.get_many.return_value = ([], 0)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        asyncio.run(repository.get_all_events(occurred_at__gte=datetime(2025, 1, 1)))
+
+        base_repo.get_many.assert_called_once()
+        archive.list_events.assert_not_called()
+
+    def test_straddling_range_continues_into_the_archive(self, base_repo, archive):
+        hot = [
+            EventORM(**_archived_row(datetime(2025, 2, day, tzinfo=timezone.utc)))
+            for day in (3, 2, 1)
+        ]
+        base_repo.get_many.return_value = (hot, 3)
+        cold = [_archived_row(datetime(2024, 12, day)) for day in (31, 30)]
+        archive.list_events.return_value = (cold, 7)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        response = asyncio.run(
+            repository.get_all_events(occurred_at__gte=datetime(2024, 12, 1), page_size=5)
+        )
+
+        # Postgres is only asked for what the archive does not have
+        assert base_repo.get_many.call_args.kwargs["occurred_at__gte"] == datetime(2025, 1, 1)
+        kwargs = archive.list_events.call_args.kwargs
+        assert (kwargs["since"], kwargs["until"]) == (datetime(2024, 12, 1), datetime(2025, 1, 1))
+        assert (kwargs["offset"], kwargs["limit"]) == (0, 2)
+        assert [event.id for event in response.results] == [
+            *(event.id for event in hot),
+            *(row["id"] for row in cold),
+        ]
+        assert response.meta.total_count == 10
+        assert response.meta.next_cursor is not None
+
+    def test_full_hot_page_only_counts_the_archive(self, base_repo, archive):
+        hot = [
+            EventORM(**_archived_row(datetime(2025, 2, day, tzinfo=timezone.utc))) for day in (2, 1)
+        ]
+        base_repo.get_many.return_value = (hot, 4)
+        archive.count_events.return_value = 7
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        response = asyncio.run(
+            repository.get_all_events(occurred_at__gte=datetime(2024, 12, 1), page_size=2)
+        )
+
+        archive.list_events.assert_not_called()
+        assert archive.count_events.call_args.kwargs["estimate"] is False
+        assert response.meta.total_count == 11
+        assert response.meta.next_cursor is not None
+
+    def test_count_none_leaves_the_archive_alone_on_a_full_page(self, base_repo, archive):
+        hot = [EventORM(**_archived_row(datetime(2025, 2, 1, tzinfo=timezone.utc)))]
+        base_repo.get_many.return_value = (hot, None)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        response = asyncio.run(
+            repository.get_all_events(
+                occurred_at__gte=datetime(2024, 12, 1), page_size=1, count=CountMode.NONE
+            )
+        )
+
+        assert base_repo.get_many.call_args.kwargs["count"] is CountMode.NONE
+        archive.list_events.assert_not_called()
+        archive.count_events.assert_not_called()
+        assert response.meta.total_count is None
+        assert response.meta.count_mode is CountMode.NONE
+
+    def test_estimated_count_adds_the_archive_estimate(self, base_repo, archive):
+        hot = [EventORM(**_archived_row(datetime(2025, 2, 1, tzinfo=timezone.utc)))]
+        base_repo.get_many.return_value = (hot, 900)
+        archive.count_events.return_value = 100
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        response = asyncio.run(
+            repository.get_all_events(
+                occurred_at__gte=datetime(2024, 12, 1), page_size=1, count=CountMode.ESTIMATE
+            )
+        )
+
+        assert base_repo.get_many.call_args.kwargs["count"] is CountMode.ESTIMATE
+        assert archive.count_events.call_args.kwargs["estimate"] is True
+        assert response.meta.total_count == 1000
+        assert response.meta.count_mode is CountMode.ESTIMATE
+
+    def test_later_pages_of_a_straddling_range_skip_the_hot_rows(self, base_repo, archive):
+        base_repo.get_many.return_value = ([], 3)
+        archive.list_events.return_value = ([], 7)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        asyncio.run(
+            repository.get_all_events(occurred_at__gte=datetime(2024, 12, 1), page=2, page_size=5)
+        )
+
+        kwargs = archive.list_events.call_args.kwargs
+        assert kwargs["since"] == datetime(2024, 12, 1)
+        assert (kwargs["offset"], kwargs["limit"]) == (2, 5)
+
+    def test_later_pages_count_the_hot_rows_exactly_to_place_the_archive(self, base_repo, archive):
+        # the estimate places nothing; the offset into the archive needs the exact count
+        base_repo.get_many.side_effect = [([], 40), ([], 3)]
+        archive.list_events.return_value = ([], 7)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        asyncio.run(
+            repository.get_all_events(
+                occurred_at__gte=datetime(2024, 12, 1),
+                page=2,
+                page_size=5,
+                count=CountMode.ESTIMATE,
+            )
+        )
+
+        counts = [c.kwargs["count"] for c in base_repo.get_many.call_args_list]
+        assert counts == [CountMode.ESTIMATE, CountMode.EXACT]
+        assert archive.list_events.call_args.kwargs["offset"] == 2
+
+    def test_unbounded_listing_stays_in_postgres(self, base_repo, archive):
+        base_repo.get_many.return_value = ([], 0)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        asyncio.run(repository.get_all_events(search="timeout", order="-rank"))
+
+        assert "occurred_at__gte" not in base_repo.get_many.call_args.kwargs
+        archive.list_events.assert_not_called()
+        archive.count_events.assert_not_called()
+
+    def test_archived_cursor_of_a_straddling_range_reads_the_archive(self, base_repo, archive):
+        base_repo.get_many.return_value = (
+            [EventORM(**_archived_row(datetime(2025, 2, 1, tzinfo=timezone.utc)))],
+            1,
+        )
+        archive.list_events.return_value = ([], 7)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+        after = SimpleNamespace(occurred_at=datetime(2024, 12, 1), id=uuid4())
+
+        response = asyncio.run(
+            repository.get_all_events(
+                occurred_at__gte=datetime(2024, 11, 1),
+                cursor=encode_cursor(after, EventsSearch.keyset),
+            )
+        )
+
+        assert base_repo.get_many.call_args.kwargs["cursor"] is None
+        kwargs = archive.list_events.call_args.kwargs
+        assert kwargs["after"] == [after.occurred_at, after.id]
+        assert response.results == []
+        assert response.meta.total_count == 8
+
+    def test_search_is_refused_on_straddling_ranges(self, base_repo, archive):
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        with pytest.raises(BadRequestError, match="occurred_at__gte to 2025-01-01"):
+            asyncio.run(
+                repository.get_all_events(occurred_at__gte=datetime(2024, 12, 1), search="timeout")
+            )
+        base_repo.get_many.assert_not_called()
+
+    def test_archived_cursor_replaces_the_offset(self, base_repo, archive):
+        archive.list_events.return_value = ([], 0)
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+        after = SimpleNamespace(occurred_at=datetime(2024, 12, 1), id=uuid4())
+
+        asyncio.run(
+            repository.get_all_events(
+                occurred_at__lt=datetime(2025, 1, 1),
+                page=3,
+                cursor=encode_cursor(after, EventsSearch.keyset),
+            )
+        )
+
+        kwargs = archive.list_events.call_args.kwargs
+        assert kwargs["offset"] == 0
+        assert kwargs["after"] == [after.occurred_at, after.id]
+
+    def test_json_filters_are_refused_on_archived_ranges(self, base_repo, archive):
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        with pytest.raises(BadRequestError):
+            asyncio.run(
+                repository.get_all_events(
+                    occurred_at__lt=datetime(2025, 1, 1), payload__amount__gt="100"
+                )
+            )
+        archive.list_events.assert_not_called()
+
+    def test_search_is_refused_on_archived_ranges(self, base_repo, archive):
+        repository = EventsRepository(repo=base_repo)
+        repository.archive = archive
+
+        with pytest.raises(BadRequestError):
+            asyncio.run(
+                repository.get_all_events(occurred_at__lt=datetime(2025, 1, 1), search="timeout")
+            )
+        archive.list_events.assert_not_called()
+
+
+class TestListCursor:
+    def _events(self, count: int) -> list[EventORM]:
+        stamp = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        events = []
+        for _ in range(count):
+            row = EventORM.values_from_model(
+                EventCreate.model_validate(_raw_event()), parent="test@example.com"
+            )
+            events.append(EventORM(**row, id=uuid4(), created_at=stamp, updated_at=stamp))
+        return events
+
+    def test_full_page_returns_a_cursor_after_the_last_row(self, base_repo):
+        events = self._events(2)
+        base_repo.get_many.return_value = (events, 5)
+
+        response = asyncio.run(EventsRepository(repo=base_repo).get_all_events(page_size=2))
+
+        assert response.meta.next_cursor == encode_cursor(events[-1], EventsSearch.keyset)
+
+    def test_last_page_and_custom_orders_have_no_cursor(self, base_repo):
+        repository = EventsRepository(repo=base_repo)
+        base_repo.get_many.return_value = (self._events(1), 1)
+        assert asyncio.run(repository.get_all_events(page_size=2)).meta.next_cursor is None
+
+        base_repo.get_many.return_value = (self._events(2), 5)
+        response = asyncio.run(repository.get_all_events(page_size=2, order="event_type"))
+        assert response.meta.next_cursor is None
+
+    def test_invalid_cursor_is_a_bad_request(self, base_repo):
+        base_repo.get_many.side_effect = InvalidCursorError("Invalid cursor 'x'")
+
+        with pytest.raises(BadRequestError):
+            asyncio.run(EventsRepository(repo=base_repo).get_all_events(cursor="x"))
+
+    def test_out_of_range_json_number_is_a_bad_request(self, base_repo):
+        base_repo.get_many.side_effect = InvalidJsonFilterError("Number 1e999 is out of range")
+
+        with pytest.raises(BadRequestError):
+            asyncio.run(EventsRepository(repo=base_repo).get_all_events(payload__amount="1e999"))
+
+    def test_short_substring_search_is_a_bad_request(self, base_repo):
+        base_repo.get_many.side_effect = InvalidSearchError("too short")
+
+        with pytest.raises(BadRequestError):
+            asyncio.run(EventsRepository(repo=base_repo).get_all_events(entity_id__contains="or"))
+
+
+class TestListCounts:
+    @pytest.fixture
+    def cached_repo(self, base_repo) -> MagicMock:
+        base_repo.app_config.EVENTS_COUNT_CACHE_TTL_S = 10
+        base_repo.get_many.return_value = ([], 1234)
+        return base_repo
+
+    def test_exact_count_is_cached_per_tenant_and_filters(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [b"4", None]
+
+        response = asyncio.run(
+            EventsRepository(repo=cached_repo).get_all_events(event_type="order.paid", page=3)
+        )
+
+        assert response.meta.total_count == 1234
+        assert response.meta.count_mode == CountMode.EXACT
+        assert cached_repo.get_many.call_args.kwargs["count"] == CountMode.EXACT
+        ((key, value),) = cached_repo.cache_set_many.call_args.args[0].items()
+        assert key.startswith("fw:count:test@example.com:")
+        # tagged with the list version it was counted at
+        assert value == b"4:1234"
+        version_key, _ = cached_repo.cache_get_many.call_args.args[0]
+        assert version_key == "fw:listver:test@example.com"
+
+    def test_cached_count_skips_counting(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [b"4", b"4:99"]
+
+        response = asyncio.run(EventsRepository(repo=cached_repo).get_all_events())
+
+        assert response.meta.total_count == 99
+        assert cached_repo.get_many.call_args.kwargs["count"] == CountMode.NONE
+        cached_repo.cache_set_many.assert_not_called()
+
+    def test_count_from_an_older_version_is_counted_again(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [b"5", b"4:99"]
+
+        response = asyncio.run(EventsRepository(repo=cached_repo).get_all_events())
+
+        assert response.meta.total_count == 1234
+        assert cached_repo.get_many.call_args.kwargs["count"] == CountMode.EXACT
+        ((_, value),) = cached_repo.cache_set_many.call_args.args[0].items()
+        assert value == b"5:1234"
+
+    def test_count_cache_outage_counts_without_caching(self, cached_repo):
+        cached_repo.cache_get_many.side_effect = RedisConnectionError()
+
+        response = asyncio.run(EventsRepository(repo=cached_repo).get_all_events())
+
+        assert response.meta.total_count == 1234
+        cached_repo.cache_set_many.assert_not_called()
+
+    def test_ingest_bumps_the_version_the_counts_are_tagged_with(self, cached_repo):
+        asyncio.run(EventsRepository(repo=cached_repo).ingest_events([_raw_event()]))
+
+        _, callback = cached_repo.after_commit.call_args.args
+        asyncio.run(callback())
+        cached_repo.cache_incr_many.assert_called_once_with(["fw:listver:test@example.com"])
+
+    def test_paging_params_share_the_cache_entry(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [None, None]
+        repository = EventsRepository(repo=cached_repo)
+
+        asyncio.run(repository.get_all_events(entity_id="o-1", page=1))
+        asyncio.run(repository.get_all_events(entity_id="o-1", page=2, cursor=None))
+        asyncio.run(repository.get_all_events(entity_id="o-2"))
+
+        keys = [call.args[0][1] for call in cached_repo.cache_get_many.call_args_list]
+        assert keys[0] == keys[1] != keys[2]
+
+    def test_capped_count_reports_the_cap(self, cached_repo):
+        cached_repo.get_many.return_value = ([], EventsSearch.count_cap + 1)
+
+        response = asyncio.run(
+            EventsRepository(repo=cached_repo).get_all_events(count=CountMode.CAPPED)
+        )
+
+        assert response.meta.total_count == EventsSearch.count_cap
+        assert response.meta.count_mode == CountMode.CAPPED
+        cached_repo.cache_get_many.assert_not_called()
+
+
+class TestListCache:
+    @pytest.fixture
+    def cached_repo(self, base_repo) -> MagicMock:
+        base_repo.app_config.EVENTS_LIST_CACHE_TTL_S = 60
+        base_repo.get_many.return_value = ([], 0)
+        return base_repo
+
+    def test_current_page_is_served_from_the_cache(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [b"7", b'7:{"meta":{}}']
+
+        body = asyncio.run(
+            EventsRepository(repo=cached_repo).get_all_events_json(event_type="order.paid")
+        )
+
+        assert body == b'{"meta":{}}'
+        version_key, key = cached_repo.cache_get_many.call_args.args[0]
+        assert version_key == "fw:listver:test@example.com"
+        assert key.startswith("fw:list:EventsSearch:test@example.com:")
+        cached_repo.get_many.assert_not_called()
+
+    def test_page_from_an_older_version_is_read_again(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [b"8", b'7:{"meta":{}}']
+
+        body = asyncio.run(EventsRepository(repo=cached_repo).get_all_events_json())
+
+        assert json.loads(body)["meta"]["totalCount"] == 0
+        assert "use_primary" not in cached_repo.get_many.call_args.kwargs
+        ((key, value),) = cached_repo.cache_set_many.call_args.args[0].items()
+        assert key.startswith("fw:list:EventsSearch:")
+        assert value == b"8:" + body
+        assert cached_repo.cache_set_many.call_args.kwargs["ttl"] == 60
+
+    def test_page_from_a_lagging_replica_is_cached_for_the_lag(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [b"8", None]
+        cached_repo.read_lag.return_value = 2.3
+
+        asyncio.run(EventsRepository(repo=cached_repo).get_all_events_json())
+
+        # a replica may not have the rows version 8 counts yet
+        assert cached_repo.cache_set_many.call_args.kwargs["ttl"] == 3
+        assert metrics.snapshot()["timers"]["events.list_cache.fill_lag"]["max"] >= 2.3
+
+    def test_params_and_tenants_get_their_own_pages(self, cached_repo):
+        cached_repo.cache_get_many.return_value = [None, None]
+        repository = EventsRepository(repo=cached_repo)
+
+        asyncio.run(repository.get_all_events_json(page=1))
+        asyncio.run(repository.get_all_events_json(page=2))
+        cached_repo.principal = "other@example.com"
+        asyncio.run(repository.get_all_events_json(page=1))
+
+        keys = [call.args[0][1] for call in cached_repo.cache_get_many.call_args_list]
+        assert len(set(keys)) == 3
+        # a tenant that never ingested has version 0
+        assert cached_repo.cache_set_many.call_args.args[0][keys[2]].startswith(b"0:")
+
+    def test_cache_outage_falls_back_to_postgres(self, cached_repo):
+        cached_repo.cache_get_many.side_effect = RedisConnectionError()
+
+        body = asyncio.run(EventsRepository(repo=cached_repo).get_all_events_json())
+
+        assert json.loads(body)["results"] == []
+        cached_repo.cache_set_many.assert_not_called()
+
+    def test_ingest_bumps_the_version_after_commit(self, cached_repo):
+        repository = EventsRepository(repo=cached_repo)
+
+        asyncio.run(repository.ingest_events([_raw_event(), _raw_event()]))
+
+        cached_repo.cache_incr_many.assert_not_called()
+        key, callback = cached_repo.after_commit.call_args.args
+        asyncio.run(callback())
+        cached_repo.cache_incr_many.assert_called_once_with(["fw:listver:test@example.com"])
+
+    def test_hit_ratio_is_exported(self, cached_repo):
+        before = metrics.snapshot()["counters"]
+        cached_repo.cache_get_many.return_value = [b"1", b"1:{}"]
+        repository = EventsRepository(repo=cached_repo)
+
+        asyncio.run(repository.get_all_events_json())
+        cached_repo.cache_get_many.return_value = [b"2", b"1:{}"]
+        asyncio.run(repository.get_all_events_json())
+
+        snapshot = metrics.snapshot()
+        counters = snapshot["counters"]
+        hits = counters["events.list_cache.hits"] - before.get("events.list_cache.hits", 0)
+        misses = counters["events.list_cache.misses"] - before.get("events.list_cache.misses", 0)
+        assert (hits, misses) == (1, 1)
+        ratio = counters["events.list_cache.hits"] / (
+            counters["events.list_cache.hits"] + counters["events.list_cache.misses"]
+        )
+        assert snapshot["gauges"]["events.list_cache.hit_ratio"] == ratio
+
+
+class TestListFields:
+    def test_fields_select_their_columns_and_the_keyset(self, base_repo):
+        row = SimpleNamespace(
+            event_type="order.paid",
+            entity_type="order",
+            entity_id="order-1",
+            occurred_at=datetime(2026, 1, 5),
+            id=uuid4(),
+        )
+        base_repo.get_many.return_value = ([row], 1)
+
+        response = asyncio.run(
+            EventsRepository(repo=base_repo).get_all_events(fields="eventType,entity")
+        )
+
+        projection = base_repo.get_many.call_args.kwargs["fields"]
+        assert projection.split(",") == [
+            "entity_id",
+            "entity_type",
+            "event_type",
+            "id",
+            "occurred_at",
+        ]
+        (result,) = response.results
+        assert result.model_fields_set == {"event_type", "entity"}
+        assert result.entity.id == "order-1"
+
+    def test_unknown_field_is_a_bad_request(self, base_repo):
+        with pytest.raises(BadRequestError):
+            asyncio.run(EventsRepository(repo=base_repo).get_all_events(fields="eventType,secret"))
+        base_repo.get_many.assert_not_called()
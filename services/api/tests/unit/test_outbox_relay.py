@@ -0,0 +1,173 @@
+"""
+Unit tests for OutboxRelay.
+
+The database session and Redis pipeline are mocks registered in the registry,
+so only the batching / hand-off / retry behaviour is exercised.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import redis
+
+from flux_watch_api.core.metrics import metrics
+from flux_watch_api.core.registry import registry
+from flux_watch_api.database.redis import AsyncRedis
+from flux_watch_api.database.session import AsyncDatabase
+from flux_watch_api.services.outbox_relay import OutboxRelay
+
+
+def _row(n: int):
+    return MagicMock(id=uuid4(), stream="analytics_events", fields={"n": str(n)})
+
+
+class _Pending:
+    """Stand-in for the locked outbox rows: hands out batches, then nothing."""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        # unsent rows the count query sees, the locked batch included
+        self.unsent = 0
+        self.committed: list[int] = []
+        self.rolled_back = 0
+
+    def session_scope(self, pool=None):
+        @asynccontextmanager
+        async def scope():
+            session = AsyncMock()
+            batch = self.batches.pop(0) if self.batches else []
+            session.execute.return_value = MagicMock(
+                all=MagicMock(return_value=batch), scalar_one=MagicMock(return_value=self.unsent)
+            )
+            try:
+                yield session
+            except Exception:
+                self.rolled_back += 1
+                self.batches.insert(0, batch)
+                raise
+            self.committed.append(len(batch))
+
+        return scope()
+
+
+@pytest.fixture
+def pending(monkeypatch):
+    state = _Pending()
+    db = MagicMock(spec=AsyncDatabase)
+    db.session_scope.side_effect = state.session_scope
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipeline = MagicMock()
+    pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    async_redis = MagicMock(spec=AsyncRedis)
+    async_redis.client = MagicMock(pipeline=pipeline)
+
+    monkeypatch.setitem(registry._dependencies, AsyncDatabase, db)
+    monkeypatch.setitem(registry._dependencies, AsyncRedis, async_redis)
+    state.pipe = pipe
+    return state
+
+
+class TestOutboxRelay:
+    def test_batch_is_sent_in_one_pipeline_and_marked_sent(self, pending):
+        pending.batches = [[_row(1), _row(2), _row(3)]]
+
+        sent = asyncio.run(OutboxRelay(batch_size=10).relay_once())
+
+        assert sent == 3
+        assert pending.pipe.xadd.call_count == 3
+        pending.pipe.execute.assert_awaited_once()
+        assert pending.committed == [3]
+
+    def test_nothing_pending_does_not_touch_redis(self, pending):
+        sent = asyncio.run(OutboxRelay().relay_once())
+
+        assert sent == 0
+        pending.pipe.execute.assert_not_awaited()
+
+    def test_failed_xadd_rolls_back_and_is_retried(self, pending):
+        pending.batches = [[_row(1)]]
+        pending.pipe.execute.side_effect = [redis.exceptions.ConnectionError, None]
+        relay = OutboxRelay()
+
+        with pytest.raises(redis.exceptions.ConnectionError):
+            asyncio.run(relay.relay_once())
+        assert pending.rolled_back == 1
+
+        assert asyncio.run(relay.relay_once()) == 1
+        assert pending.committed == [1]
+
+    def test_stop_drains_committed_backlog(self, pending):
+        pending.batches = [[_row(1), _row(2)], [_row(3), _row(4)], [_row(5)]]
+
+        async def scenario():
+            relay = OutboxRelay(batch_size=2, poll_interval_ms=10_000, retention_seconds=10**6)
+            relay.purge_sent = AsyncMock()
+            await relay.start()
+            await relay.stop()
+
+        asyncio.run(scenario())
+
+        assert sum(pending.committed) == 5
+
+    def test_full_batch_reports_the_backlog_behind_it(self, pending):
+        pending.batches = [[_row(1), _row(2)]]
+        pending.unsent = 7
+        relay = OutboxRelay(batch_size=2)
+
+        asyncio.run(relay.relay_once())
+
+        assert metrics.snapshot()["gauges"]["outbox_relay.pending"] == 5
+
+    def test_short_batch_drains_the_backlog(self, pending):
+        pending.batches = [[_row(1)]]
+        # rows other relays have locked are not waiting for this one
+        pending.unsent = 7
+        relay = OutboxRelay(batch_size=2)
+
+        asyncio.run(relay.relay_once())
+
+        assert relay.pending == 0
+
+    def test_backlog_is_reported_while_redis_is_down(self, pending):
+        pending.batches = [[_row(1), _row(2)]]
+        pending.unsent = 10
+        pending.pipe.execute.side_effect = redis.exceptions.ConnectionError
+        relay = OutboxRelay(batch_size=2)
+
+        with pytest.raises(redis.exceptions.ConnectionError):
+            asyncio.run(relay.relay_once())
+
+        assert relay.pending == 8
+
+    def test_batch_duration_is_timed(self, pending):
+        pending.batches = [[_row(1)]]
+        before = metrics.snapshot()["timers"].get("outbox_relay.batch", {}).get("count", 0)
+
+        asyncio.run(OutboxRelay().relay_once())
+        asyncio.run(OutboxRelay().relay_once())
+
+        # the empty pass does not count as a batch
+        assert metrics.snapshot()["timers"]["outbox_relay.batch"]["count"] == before + 1
+
+    def test_poll_interval_bounds_the_wait_for_a_new_message(self, pending):
+        async def scenario():
+            relay = OutboxRelay(batch_size=10, poll_interval_ms=20, retention_seconds=10**6)
+            relay.purge_sent = AsyncMock()
+            await relay.start()
+            await asyncio.sleep(0.01)
+            # committed while the relay sleeps between polls
+            pending.batches.append([_row(1)])
+            await asyncio.sleep(0.1)
+            sent_while_running = sum(pending.committed)
+            await relay.stop()
+            return sent_while_running
+
+        assert asyncio.run(scenario()) == 1
@@ -0,0 +1,131 @@
+"""
+Unit tests for PartitionManager.
+
+The catalog query is answered by a fake session so the planning, overlap and
+retention decisions are tested without a database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from flux_watch_api.database.partitions import PartitionManager
+
+
+class _Session:
+    def __init__(self, bounds: dict[str, str], stray: tuple[date, ...] = ()):
+        self.bounds = bounds
+        # days the DEFAULT partition holds rows for
+        self.stray = stray
+        self.statements: list[str] = []
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if "pg_inherits" in sql:
+            return list(self.bounds.items())
+        if sql.startswith("SELECT EXISTS"):
+            lower, upper = params["lower"].date(), params["upper"].date()
+            return MagicMock(scalar=lambda: any(lower <= day < upper for day in self.stray))
+        if "pg_attribute" in sql:
+            return MagicMock(scalar_one=lambda: "id, occurred_at")
+        return MagicMock()
+
+    def ddl(self) -> list[str]:
+        return [s for s in self.statements if s.startswith(("CREATE", "DROP"))]
+
+
+def _weekly(start: str, end: str) -> str:
+    return f"FOR VALUES FROM ('{start} 00:00:00') TO ('{end} 00:00:00')"
+
+
+class TestPartitionManager:
+    def test_weekly_plan_starts_on_monday(self):
+        manager = PartitionManager(interval="week", premake=2)
+
+        planned = manager.planned(date(2026, 10, 15))  # a Thursday
+
+        assert planned == [
+            ("events_p20261012", date(2026, 10, 12), date(2026, 10, 19)),
+            ("events_p20261019", date(2026, 10, 19), date(2026, 10, 26)),
+            ("events_p20261026", date(2026, 10, 26), date(2026, 11, 2)),
+        ]
+
+    def test_unknown_interval_is_rejected(self):
+        with pytest.raises(ValueError):
+            PartitionManager(interval="month")
+
+    def test_only_missing_partitions_are_created(self):
+        session = _Session(
+            {
+                "events_legacy": "FOR VALUES FROM (MINVALUE) TO ('2026-10-19 00:00:00')",
+                "events_p20261019": _weekly("2026-10-19", "2026-10-26"),
+                "events_default": "DEFAULT",
+            }
+        )
+        manager = PartitionManager(interval="week", premake=2)
+
+        created = asyncio.run(manager.ensure_partitions(session, date(2026, 10, 15)))
+
+        # the current week lives in events_legacy, the next one already exists
+        assert created == ["events_p20261026"]
+        assert session.ddl() == [
+            'CREATE TABLE "events_p20261026" PARTITION OF "events" '
+            "FOR VALUES FROM ('2026-10-26') TO ('2026-11-02')"
+        ]
+
+    def test_rows_caught_by_default_move_into_the_new_partition(self):
+        session = _Session(
+            {
+                "events_p20261019": _weekly("2026-10-19", "2026-10-26"),
+                "events_default": "DEFAULT",
+            },
+            stray=(date(2026, 10, 27),),
+        )
+        manager = PartitionManager(interval="week", premake=2)
+
+        created = asyncio.run(manager.ensure_partitions(session, date(2026, 10, 20)))
+
+        assert created == ["events_p20261026", "events_p20261102"]
+        moves = session.statements[session.statements.index(session.ddl()[0]) :]
+        assert moves[:2] == [
+            'CREATE TEMPORARY TABLE "_moved" AS SELECT id, occurred_at '
+            'FROM "events_default" WITH NO DATA',
+            'WITH moved AS (DELETE FROM "events_default" WHERE "occurred_at" >= :lower '
+            'AND "occurred_at" < :upper RETURNING id, occurred_at) '
+            'INSERT INTO "_moved" SELECT * FROM moved',
+        ]
+        # the rows go back in only once their partition exists
+        assert moves[2].startswith('CREATE TABLE "events_p20261026"')
+        assert moves[3:5] == [
+            'INSERT INTO "events" (id, occurred_at) SELECT id, occurred_at FROM "_moved"',
+            'DROP TABLE "_moved"',
+        ]
+        # nothing was caught for the week after
+        assert not any("_moved" in sql for sql in moves[5:])
+
+    def test_retention_drops_whole_partitions(self):
+        session = _Session(
+            {
+                "events_legacy": "FOR VALUES FROM (MINVALUE) TO ('2026-09-07 00:00:00')",
+                "events_p20260907": _weekly("2026-09-07", "2026-09-14"),
+                "events_p20260914": _weekly("2026-09-14", "2026-09-21"),
+                "events_default": "DEFAULT",
+            }
+        )
+        manager = PartitionManager(retention_days=30)
+
+        dropped = asyncio.run(manager.drop_expired(session, date(2026, 10, 15)))
+
+        # cutoff is 2026-09-15: the partition ending on the 21st still holds live rows
+        assert dropped == ["events_legacy", "events_p20260907"]
+
+    def test_no_retention_keeps_everything(self):
+        session = _Session({"events_legacy": "FOR VALUES FROM (MINVALUE) TO ('2020-01-01')"})
+
+        assert asyncio.run(PartitionManager().drop_expired(session, date(2026, 10, 15))) == []
+        assert session.ddl() == []
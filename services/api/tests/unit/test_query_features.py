@@ -0,0 +1,417 @@
+"""
+Unit tests for JsonFilterFeature, the compiled QueryPlan, keyset pagination,
+count modes, column projection and full-text search.
+
+Queries are built through EventsSearch and compiled against the PostgreSQL
+dialect; bound values are read from the compiled parameters.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from flux_watch_api.database.query_builder.base import ParamsBase, QueryModel
+from flux_watch_api.database.query_builder.builder import QueryBuilder
+from flux_watch_api.database.query_builder.features import (
+    FilterFeature,
+    InvalidJsonFilterError,
+    InvalidSearchError,
+    ModelFeature,
+    SearchFeature,
+    parse_json_filter,
+)
+from flux_watch_api.database.query_builder.processor import (
+    Counting,
+    CountMode,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+from flux_watch_api.models.common import AccountSearch
+from flux_watch_api.repository.events.events import EventsSearch
+from flux_watch_api.schema import AccountORM
+from flux_watch_api.schema.events import EventORM
+
+
+def _compiled(**params):
+    query = QueryBuilder(EventsSearch, parent="acct", **params).build_where()
+    compiled = query.compile(dialect=postgresql.psycopg.dialect())
+    return str(compiled), compiled.params
+
+
+class TestParseJsonFilter:
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("payload__amount", (["amount"], "eq")),
+            ("payload__amount__gt", (["amount"], "gt")),
+            ("payload__customer__tier__in", (["customer", "tier"], "in")),
+            ("context__region__name", (["region", "name"], "eq")),
+        ],
+    )
+    def test_path_and_operator(self, key, expected):
+        assert parse_json_filter(key, key.split("__")[0]) == expected
+
+    @pytest.mark.parametrize("key", ["payload__", "payload__a____gt", "payload__gt__"])
+    def test_empty_path_segments_are_rejected(self, key):
+        with pytest.raises(ValueError):
+            parse_json_filter(key, "payload")
+
+
+class TestJsonFilterFeature:
+    def test_equality_is_containment_with_typed_values(self):
+        sql, params = _compiled(payload__amount="100", context__env="prod")
+
+        assert "events.payload @> " in sql
+        assert "events.context @> " in sql
+        assert {"amount": 100} in params.values()
+        assert {"env": "prod"} in params.values()
+
+    def test_quoted_numbers_stay_strings(self):
+        _, params = _compiled(payload__order__ref='"100"')
+
+        assert {"order": {"ref": "100"}} in params.values()
+
+    def test_comparisons_are_jsonpath_predicates(self):
+        sql, params = _compiled(payload__amount__gt="100", payload__customer__since__lte="2026")
+
+        assert sql.count("events.payload @? CAST(") == 2
+        assert '$."amount" ? (@ > 100)' in params.values()
+        assert '$."customer"."since" ? (@ <= 2026)' in params.values()
+
+    def test_keys_are_quoted_in_jsonpath(self):
+        _, params = _compiled(**{"payload__a b__gte": "1"})
+
+        assert '$."a b" ? (@ >= 1)' in params.values()
+
+    def test_in_is_a_union_of_containments(self):
+        sql, params = _compiled(payload__tier__in="gold,silver")
+
+        assert sql.count("events.payload @> ") == 2
+        assert {"tier": "gold"} in params.values()
+        assert {"tier": "silver"} in params.values()
+
+    def test_exists_false_is_negated(self):
+        sql, params = _compiled(context__region__exists="false")
+
+        assert "NOT ((events.context @? CAST(" in sql
+        assert '$."region"' in params.values()
+
+    def test_unknown_extra_params_are_rejected(self):
+        with pytest.raises(ValidationError):
+            EventsSearch(actor__type="user")
+
+
+class TestPromotedColumns:
+    def test_promoted_key_uses_the_generated_column(self):
+        sql, params = _compiled(context__trace_id="abc", payload__latency_ms__gt="250")
+
+        assert "events.context_trace_id = " in sql
+        assert "events.payload_latency_ms > " in sql
+        assert "@>" not in sql and "@?" not in sql
+        assert "abc" in params.values()
+        assert 250.0 in params.values()
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            # ->> renders the number 123 and the string "123" alike
+            {"context__trace_id": "123"},
+            {"context__trace_id": '"123"'},
+            {"context__source__in": "web,1"},
+            # and text compares as text, not as numbers
+            {"context__trace_id__gt": "100"},
+            {"payload__latency_ms": "fast"},
+            {"payload__latency_ms": "true"},
+            # NULL in the column also means "key holds JSON null / a string"
+            {"context__trace_id__exists": "true"},
+            {"payload__latency_ms__exists": "true"},
+            {"context__session_id__ne": "abc"},
+        ],
+        ids=lambda params: "&".join(f"{k}={v}" for k, v in params.items()),
+    )
+    def test_values_the_column_cannot_answer_exactly_fall_back_to_json(self, params):
+        sql, _ = _compiled(**params)
+
+        assert "events.context_" not in sql and "events.payload_" not in sql
+
+    def test_in_on_a_text_column(self):
+        sql, params = _compiled(context__source__in="web,mobile")
+
+        assert "events.context_source IN " in sql
+        assert ["web", "mobile"] in params.values()
+
+    def test_nested_keys_are_not_promoted(self):
+        sql, _ = _compiled(context__trace_id__span="x")
+
+        assert "context_trace_id" not in sql
+
+
+class TestJsonScalars:
+    def test_nan_and_infinity_are_strings(self):
+        _, params = _compiled(payload__status="NaN", payload__level="-Infinity")
+
+        assert {"status": "NaN"} in params.values()
+        assert {"level": "-Infinity"} in params.values()
+
+    def test_out_of_range_numbers_are_rejected(self):
+        with pytest.raises(InvalidJsonFilterError):
+            _compiled(payload__amount__gt="1e999")
+
+
+def _built(schema_cls, planned: bool, **params):
+    builder = QueryBuilder(schema_cls, **params)
+    if not planned:
+        builder.schema.plan = None
+    data_query, count_query = builder.build(with_counts=True)
+    return data_query, count_query
+
+
+class TestQueryPlan:
+    @pytest.mark.parametrize(
+        ("schema_cls", "params"),
+        [
+            (AccountSearch, {"principal": "acct"}),
+            (EventsSearch, {"parent": "acct"}),
+            (
+                EventsSearch,
+                {
+                    "parent": "acct",
+                    "event_type": "order.created",
+                    "occurred_at__gte": "2026-01-01T00:00:00Z",
+                    "payload__amount__gt": "100",
+                    "context__trace_id": "t-1",
+                },
+            ),
+        ],
+    )
+    def test_plan_builds_the_same_statements(self, schema_cls, params):
+        dialect = postgresql.psycopg.dialect()
+        for planned_query, dynamic_query in zip(
+            _built(schema_cls, True, **params), _built(schema_cls, False, **params), strict=True
+        ):
+            planned, dynamic = (
+                planned_query.compile(dialect=dialect),
+                dynamic_query.compile(dialect=dialect),
+            )
+            assert str(planned) == str(dynamic)
+            assert planned.params == dynamic.params
+
+    def test_values_are_bound_so_the_compiled_cache_is_shared(self):
+        first, _ = _built(EventsSearch, True, parent="a", event_type="x", page=1)
+        second, _ = _built(EventsSearch, True, parent="b", event_type="y", page=3)
+
+        assert first._generate_cache_key() == second._generate_cache_key()
+
+    def test_plan_is_compiled_once_per_class(self):
+        assert isinstance(AccountSearch.plan.steps, list)
+        assert QueryBuilder(AccountSearch, principal="a").schema.plan is AccountSearch.plan
+
+    def test_other_params_class_skips_the_plan(self):
+        class Other(ParamsBase):
+            principal: str
+            principal__ne: str | None = None
+
+        schema = AccountSearch(params_cls=Other, principal="a", principal__ne="b")
+        assert schema.plan is None
+
+    def test_missing_column_fails_at_class_definition(self):
+        with pytest.raises(Exception, match="No column named nope"):
+
+            class Broken(QueryModel):
+                class Params(ParamsBase):
+                    nope: str | None = None
+
+                features = [ModelFeature(AccountORM), FilterFeature("nope")]
+
+    def test_non_feature_fails_at_class_definition(self):
+        with pytest.raises(TypeError):
+
+            class Broken(QueryModel):
+                class Params(ParamsBase):
+                    pass
+
+                features = [ModelFeature(AccountORM), object()]
+
+
+class TestColumnFilters:
+    def test_event_type_in_producer_and_actor(self):
+        sql, params = _compiled(
+            event_type__in="order.created,order.cancelled", producer="checkout", actor_id="u-1"
+        )
+
+        assert "events.event_type IN (__[POSTCOMPILE_event_type_1])" in sql
+        assert "events.producer = %(producer_1)s" in sql
+        assert "events.actor_id = %(actor_id_1)s" in sql
+        assert params["event_type_1"] == ["order.created", "order.cancelled"]
+
+
+class TestSearch:
+    def test_websearch_matches_the_search_vector(self):
+        sql, params = _compiled(search='"payment failed" -retry')
+
+        assert (
+            "events.search_vector @@ websearch_to_tsquery("
+            "%(param_1)s::REGCONFIG, %(websearch_to_tsquery_1)s::VARCHAR)"
+        ) in sql
+        assert params["param_1"] == "simple"
+        assert params["websearch_to_tsquery_1"] == '"payment failed" -retry'
+
+    def test_rank_order_ranks_the_matches(self):
+        query, _ = QueryBuilder(
+            EventsSearch, parent="acct", search="timeout", order="-rank"
+        ).build()
+        sql = str(query.compile(dialect=postgresql.psycopg.dialect()))
+
+        assert "ORDER BY ts_rank_cd(events.search_vector, websearch_to_tsquery(" in sql
+        assert "::VARCHAR)) DESC" in sql
+
+    def test_search_vector_is_not_selected(self):
+        query, _ = QueryBuilder(EventsSearch, parent="acct").build()
+        sql = str(query.compile(dialect=postgresql.psycopg.dialect()))
+
+        assert "search_vector" not in sql.split("FROM")[0]
+
+    def test_ilike_mode_is_unchanged(self):
+        feature = SearchFeature(param_name="search", fields=["entity_id", "producer"])
+        schema = SimpleNamespace(model=EventORM, params=SimpleNamespace(search="harsh"))
+        query = feature.apply(select(EventORM.id), schema)
+        sql = str(query.compile(dialect=postgresql.psycopg.dialect()))
+
+        assert "events.entity_id ILIKE %(entity_id_1)s::VARCHAR OR events.producer ILIKE" in sql
+
+    def test_trigram_matches_a_literal_substring(self):
+        sql, params = _compiled(entity_id__contains="ord_12%")
+
+        assert "events.entity_id ILIKE %(entity_id_1)s::VARCHAR" in sql
+        assert params["entity_id_1"] == "%ord\\_12\\%%"
+
+    def test_trigram_refuses_terms_shorter_than_a_trigram(self):
+        with pytest.raises(InvalidSearchError):
+            _compiled(entity_id__contains="or")
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(ValueError):
+            SearchFeature(param_name="search", fields=["search_vector"], mode="regex")
+
+
+class TestKeyset:
+    _KEYS = [EventORM.occurred_at, EventORM.id]
+
+    def test_cursor_round_trips_typed_values(self):
+        row = SimpleNamespace(occurred_at=datetime(2026, 1, 5, 12, 30, 1, 5), id=uuid4())
+
+        token = encode_cursor(row, EventsSearch.keyset)
+
+        assert "=" not in token
+        assert decode_cursor(token, self._KEYS) == [row.occurred_at, row.id]
+
+    @pytest.mark.parametrize("token", ["garbage", encode_cursor(SimpleNamespace(a=1), ["a"])])
+    def test_malformed_cursor_is_rejected(self, token):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, self._KEYS)
+
+    def test_cursor_seeks_instead_of_offset(self):
+        row = SimpleNamespace(occurred_at=datetime(2026, 1, 5), id=uuid4())
+        builder = QueryBuilder(
+            EventsSearch, parent="acct", cursor=encode_cursor(row, EventsSearch.keyset), page=7
+        )
+        data_query, count_query = builder.build(with_counts=True)
+        compiled = data_query.compile(dialect=postgresql.psycopg.dialect())
+        sql = str(compiled)
+
+        assert "(events.occurred_at, events.id) < (" in sql
+        assert "ORDER BY events.occurred_at DESC, events.id DESC" in sql
+        assert "OFFSET" not in sql
+        assert {row.occurred_at, row.id, 10} <= set(compiled.params.values())
+        # the total still counts the whole listing
+        assert "events.id) <" not in str(count_query.compile(dialect=postgresql.dialect()))
+
+    def test_cursor_needs_the_default_order(self):
+        with pytest.raises(InvalidCursorError):
+            QueryBuilder(EventsSearch, parent="acct", cursor="x", order="event_type").build()
+
+    def test_models_without_a_keyset_refuse_cursors(self):
+        with pytest.raises(InvalidCursorError):
+            QueryBuilder(AccountSearch, principal="a", cursor="x").build()
+
+
+class TestCountModes:
+    def _count_sql(self, count):
+        _, count_query = QueryBuilder(EventsSearch, parent="acct", count=count).build(
+            with_counts=True
+        )
+        return count_query, count_query is not None and str(
+            count_query.compile(dialect=postgresql.psycopg.dialect())
+        )
+
+    def test_exact_counts_the_whole_listing(self):
+        _, sql = self._count_sql(CountMode.EXACT)
+        assert sql.startswith("SELECT count(*)")
+        assert "LIMIT" not in sql
+
+    def test_capped_stops_after_the_cap(self):
+        query, sql = self._count_sql(CountMode.CAPPED)
+        assert "LIMIT" in sql
+        assert EventsSearch.count_cap + 1 in query.compile().params.values()
+
+    def test_estimate_explains_the_listing_with_bound_params(self):
+        query, sql = self._count_sql(CountMode.ESTIMATE)
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "%(parent_1)s" in sql
+        # a cached EXPLAIN cannot be executed twice, see Explain
+        assert query._generate_cache_key() is None
+
+    def test_none_skips_the_count(self):
+        assert self._count_sql(CountMode.NONE) == (None, False)
+
+    def test_estimate_reads_the_plan_rows(self):
+        params = EventsSearch(parent="acct", count=CountMode.ESTIMATE).params
+        plan = [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}]
+
+        assert Counting().value(params, plan) == 1234
+
+    @pytest.mark.parametrize(
+        ("mode", "total", "expected"),
+        [
+            (CountMode.CAPPED, 10_001, (10_000, CountMode.CAPPED)),
+            (CountMode.CAPPED, 42, (42, CountMode.EXACT)),
+            (CountMode.ESTIMATE, 42, (42, CountMode.ESTIMATE)),
+            (CountMode.NONE, None, (None, CountMode.NONE)),
+        ],
+    )
+    def test_report_names_the_mode_that_produced_the_number(self, mode, total, expected):
+        assert Counting.report(mode, total, 10_000) == expected
+
+
+class TestProjection:
+    def test_fields_select_only_those_columns(self):
+        builder = QueryBuilder(EventsSearch, parent="acct", fields="event_type,occurred_at,id")
+        data_query, count_query = builder.build(with_counts=True)
+        sql = str(data_query.compile(dialect=postgresql.dialect()))
+
+        assert builder.projected
+        assert sql.startswith("SELECT events.event_type, events.occurred_at, events.id \nFROM")
+        assert "payload" not in sql
+        assert "ORDER BY events.occurred_at DESC, events.id DESC" in sql
+        assert count_query is not None
+
+    def test_planned_and_dynamic_projections_match(self):
+        planned, _ = _built(EventsSearch, True, parent="acct", fields="entity_type,entity_id")
+        dynamic, _ = _built(EventsSearch, False, parent="acct", fields="entity_type,entity_id")
+
+        assert str(planned) == str(dynamic)
+
+    def test_unknown_column_is_rejected(self):
+        with pytest.raises(Exception, match="No column named secret"):
+            QueryBuilder(EventsSearch, parent="acct", fields="secret").build()
+
+    def test_without_fields_rows_are_models(self):
+        assert not QueryBuilder(EventsSearch, parent="acct").projected
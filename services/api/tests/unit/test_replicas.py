@@ -0,0 +1,175 @@
+"""
+Unit tests for read-replica routing.
+
+Engines and sessions are MagicMocks; ReplicaPool's clock is patched to move
+replicas through their cooldown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from flux_watch_api.database import replicas as replicas_module
+from flux_watch_api.database.client import AsyncSQLClient, SQLClient
+from flux_watch_api.database.replicas import (
+    AsyncReadSessions,
+    ReadSessions,
+    Replica,
+    ReplicaPool,
+)
+from flux_watch_api.models.common import AccountSearch
+from flux_watch_api.repository.events.events import EventsSearch
+
+
+def _replica(name: str) -> Replica:
+    return Replica(name, engine=MagicMock(), session_local=MagicMock())
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(replicas_module, "monotonic", lambda: now[0])
+    return now
+
+
+class TestReplicaPool:
+    def test_round_robin(self):
+        pool = ReplicaPool([_replica("r0"), _replica("r1")])
+
+        first = [next(pool.candidates())[0].name for _ in range(4)]
+
+        assert first == ["r0", "r1", "r0", "r1"]
+
+    def test_down_replica_is_skipped_until_cooldown_then_probed(self, clock):
+        r0, r1 = _replica("r0"), _replica("r1")
+        pool = ReplicaPool([r0, r1], cooldown_s=30)
+        pool.mark_down(r0)
+
+        assert [(r.name, probe) for r, probe in pool.candidates()] == [("r1", False)]
+
+        clock[0] += 30
+        assert ("r0", True) in [(r.name, probe) for r, probe in pool.candidates()]
+
+    def test_probe_failure_keeps_replica_down(self, clock):
+        replica = _replica("r0")
+        replica.engine.connect.side_effect = OperationalError("SELECT 1", {}, Exception())
+        pool = ReplicaPool([replica])
+
+        assert not pool.probe(replica)
+        assert replica.down_since == clock[0]
+
+    def test_probe_success_brings_replica_back(self, clock):
+        replica = _replica("r0")
+        pool = ReplicaPool([replica])
+        pool.mark_down(replica)
+
+        assert pool.probe(replica)
+        assert replica.down_since is None
+
+
+def _db(replica_session) -> MagicMock:
+    db = MagicMock()
+    db.has_replicas = True
+    db.replica_session.return_value = replica_session
+    return db
+
+
+def _primary() -> MagicMock:
+    session = MagicMock()
+    session.in_transaction.return_value = False
+    session.execute.return_value.scalar_one_or_none.return_value = "primary-row"
+    return session
+
+
+def _replica_session() -> MagicMock:
+    session = MagicMock()
+    session.info = {"replica": _replica("r0")}
+    session.execute.return_value.scalar_one_or_none.return_value = "replica-row"
+    return session
+
+
+class TestSQLClientRouting:
+    def test_reads_go_to_the_replica(self):
+        primary, replica = _primary(), _replica_session()
+        client = SQLClient(session=primary, reads=ReadSessions(_db(replica)))
+
+        assert client.get_one(AccountSearch, principal="a@x.io") == "replica-row"
+        replica.commit.assert_called_once()
+        primary.execute.assert_not_called()
+
+    def test_use_primary_and_opt_out(self):
+        primary, replica = _primary(), _replica_session()
+
+        client = SQLClient(session=primary, reads=ReadSessions(_db(replica)))
+        assert client.get_one(AccountSearch, principal="a@x.io", use_primary=True) == "primary-row"
+
+        client = SQLClient(session=primary, reads=ReadSessions(_db(replica), enabled=False))
+        assert client.get_one(AccountSearch, principal="a@x.io") == "primary-row"
+        replica.execute.assert_not_called()
+
+    def test_reads_after_a_write_stay_on_the_primary(self):
+        primary, replica = _primary(), _replica_session()
+        primary.in_transaction.return_value = True
+        client = SQLClient(session=primary, reads=ReadSessions(_db(replica)))
+
+        assert client.get_one(AccountSearch, principal="a@x.io") == "primary-row"
+        replica.execute.assert_not_called()
+
+    def test_failed_replica_read_falls_back_and_marks_it_down(self):
+        primary, replica = _primary(), _replica_session()
+        replica.execute.side_effect = OperationalError("SELECT", {}, Exception())
+        db = _db(replica)
+        client = SQLClient(session=primary, reads=ReadSessions(db))
+
+        assert client.get_one(AccountSearch, principal="a@x.io") == "primary-row"
+        db.replicas.mark_down.assert_called_once_with(replica.info["replica"])
+        replica.close.assert_called_once()
+        # the rest of the request stays on the primary
+        assert client.get_one(AccountSearch, principal="a@x.io") == "primary-row"
+        db.replica_session.assert_called_once()
+
+    def test_without_replicas_reads_use_the_primary(self):
+        primary = _primary()
+        db = _db(None)
+        db.has_replicas = False
+        client = SQLClient(session=primary, reads=ReadSessions(db))
+
+        assert client.get_one(AccountSearch, principal="a@x.io") == "primary-row"
+        db.replica_session.assert_not_called()
+
+
+class TestAsyncSQLClientRouting:
+    def test_get_many_reads_from_the_replica(self):
+        primary = AsyncMock()
+        primary.in_transaction = MagicMock(return_value=False)
+        replica = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ["row"]
+        result.scalar_one.return_value = 1
+        replica.execute.return_value = result
+        db = MagicMock(has_replicas=True)
+        db.replica_session = AsyncMock(return_value=replica)
+        client = AsyncSQLClient(session=primary, reads=AsyncReadSessions(db))
+
+        rows, total = asyncio.run(client.get_many(EventsSearch, parent="a@x.io"))
+
+        assert (rows, total) == (["row"], 1)
+        replica.commit.assert_awaited_once()
+        primary.execute.assert_not_called()
+
+    def test_read_lag_is_measured_on_the_replica_the_reads_use(self):
+        primary = AsyncMock()
+        primary.in_transaction = MagicMock(return_value=False)
+        replica = AsyncMock()
+        replica.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=1.5))
+        db = MagicMock(has_replicas=True)
+        db.replica_session = AsyncMock(return_value=replica)
+        client = AsyncSQLClient(session=primary, reads=AsyncReadSessions(db))
+
+        assert asyncio.run(client.read_lag()) == 1.5
+        assert "pg_last_xact_replay_timestamp" in str(replica.execute.call_args.args[0])
+        primary.execute.assert_not_called()
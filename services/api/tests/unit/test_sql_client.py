@@ -0,0 +1,79 @@
+"""
+Unit tests for the set-based write helpers on SQLClient and the after-commit
+callbacks of AsyncSQLClient.
+
+The session is a MagicMock; statements are compiled against the PostgreSQL
+dialect to check they target the same rows the QueryModel would select.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from flux_watch_api.database.client import AsyncSQLClient, SQLClient
+from flux_watch_api.models.common import AccountSearch, SessionSearch
+from flux_watch_api.repository.events.events import EventsSearch
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock()
+    session.execute.return_value.rowcount = 3
+    return session
+
+
+class TestSetBasedWrites:
+    def test_soft_delete_where_is_one_update(self, session):
+        account_id = uuid4()
+
+        count = SQLClient(session=session).soft_delete_where(SessionSearch, account_id=account_id)
+
+        assert count == 3
+        session.execute.assert_called_once()
+        sql = _sql(session.execute.call_args.args[0])
+        assert sql.startswith("UPDATE account_session SET is_expired=")
+        assert "account_session.account_id = " in sql
+        assert "account_session.is_expired IS false" in sql
+
+    def test_update_where_takes_attribute_names(self, session):
+        SQLClient(session=session).update_where(
+            AccountSearch, {"is_locked": True}, principal="a@example.com"
+        )
+
+        sql = _sql(session.execute.call_args.args[0])
+        assert sql.startswith("UPDATE account SET is_locked=")
+        assert "account.principal = " in sql
+
+    def test_unfiltered_update_is_refused(self, session):
+        with pytest.raises(ValueError):
+            SQLClient(session=session).update_where(EventsSearch, {"producer": "x"})
+        session.execute.assert_not_called()
+
+
+class TestAfterCommit:
+    def test_callbacks_run_once_per_key_after_the_commit(self):
+        session = AsyncMock()
+        session.info = {}
+        calls = []
+
+        async def callback(name):
+            # the commit has already happened when a callback runs
+            calls.append((name, session.commit.await_count))
+
+        client = AsyncSQLClient(session=session, reads=None)
+        client.after_commit("a", lambda: callback("a1"))
+        client.after_commit("a", lambda: callback("a2"))
+        client.after_commit("b", lambda: callback("b"))
+        asyncio.run(client.explicit_commit())
+        asyncio.run(client.explicit_commit())
+
+        assert calls == [("a2", 1), ("b", 1)]
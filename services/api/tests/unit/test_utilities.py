@@ -0,0 +1,41 @@
+"""
+Unit tests for the helpers in flux_watch_api.utils.utilities.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from flux_watch_api.utils.utilities import iter_ndjson_lines
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def _collect(*parts: bytes, max_line_bytes: int = 1024) -> list[tuple[int, bytes | None]]:
+    async def _run():
+        return [
+            item async for item in iter_ndjson_lines(_chunks(*parts), max_line_bytes=max_line_bytes)
+        ]
+
+    return asyncio.run(_run())
+
+
+class TestIterNdjsonLines:
+    def test_lines_split_across_chunks_are_joined(self):
+        assert _collect(b'{"a":', b"1}\n{", b'"b":2}\n') == [(1, b'{"a":1}'), (2, b'{"b":2}')]
+
+    def test_trailing_line_without_newline_is_yielded(self):
+        assert _collect(b"one\ntwo") == [(1, b"one"), (2, b"two")]
+
+    def test_blank_lines_are_skipped_but_counted(self):
+        assert _collect(b"one\n\n  \nfour\n") == [(1, b"one"), (4, b"four")]
+
+    def test_oversized_line_is_reported_as_none(self):
+        result = _collect(b"ok\n", b"x" * 10, b"x" * 10, b"\nok\n", max_line_bytes=8)
+        assert result == [(1, b"ok"), (2, None), (3, b"ok")]
+
+    def test_oversized_line_within_single_chunk(self):
+        assert _collect(b"xxxxxxxxxxxx\nok\n", max_line_bytes=8) == [(1, None), (2, b"ok")]